@@ -0,0 +1,9 @@
+"""
+Benchmarks 패키지 - 수집/조회 성능을 측정하는 오프라인 벤치마크를 관리합니다.
+
+외부 서버나 MySQL 없이 SQLite 위에서 앱을 프로세스 안에서 실행하며, 결과를 JSON으로 저장하여
+버전 간 성능 변화를 비교할 수 있습니다. 프로젝트 루트(config/config.ini가 있는 위치)에서 실행합니다.
+
+    python -m benchmarks.load_test --agents 20 --containers 50 --rate 1 --duration 30
+    python -m benchmarks.micro --group validation --sizes 10 100 1000
+"""
@@ -0,0 +1,140 @@
+"""
+벤치마크 공용 도구 - 테스트 데이터 생성, 지연 시간 통계, 결과 저장/비교를 제공합니다.
+
+앱 모듈(config, database 등)은 import 시점에 설정을 읽으므로, 이 모듈은 앱 모듈을 import하지 않습니다.
+벤치마크 스크립트는 configure_environment()로 환경변수를 먼저 설정한 뒤 앱 모듈을 import해야 합니다.
+"""
+
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def create_sqlite_database(memory: bool = False) -> Path:
+    """
+    벤치마크용 SQLite DB 파일 경로를 새 임시 디렉토리에 만들어 반환합니다. (사용 후 remove_sqlite_database로 삭제)
+
+    memory=True면 메모리 기반 파일 시스템(/dev/shm)에 DB 파일을 만들어 디스크 I/O 영향을 없앱니다.
+    (앱은 연결 풀(pool_size)과 async 드라이버를 사용하므로 :memory: 대신 메모리 위의 파일을 사용)
+    """
+    shm = Path("/dev/shm")
+    directory = shm if memory and shm.is_dir() else None
+    return Path(tempfile.mkdtemp(prefix="resource-benchmark-", dir=directory)) / "benchmark.db"
+
+def remove_sqlite_database(path: Path) -> None:
+    shutil.rmtree(path.parent, ignore_errors=True)
+
+def configure_environment(database_url: Optional[str] = None, overrides: Optional[Dict[str, str]] = None) -> None:
+    """
+    앱 모듈을 import하기 전에 벤치마크용 설정을 환경변수로 지정합니다.
+
+    기본값은 이미 지정된 환경변수를 덮어쓰지 않으므로 LOGGING_LEVEL=INFO 등으로 바꿀 수 있으며,
+    overrides(명령행 옵션)는 항상 적용됩니다.
+    """
+    if database_url:
+        os.environ["DATABASE_URL"] = database_url
+    defaults = {
+        # 요청마다 남는 수집 로그가 측정값에 섞이지 않도록 WARNING 이상만 출력
+        "LOGGING_LEVEL": "WARNING",
+        "LOGGING_PAYLOAD_MODE": "off",
+        "MONITORING_CLEANUP_ENABLED": "false"
+    }
+    for key, value in defaults.items():
+        os.environ.setdefault(key, value)
+    os.environ.update(overrides or {})
+
+def make_host(host_name: str, now: datetime) -> Dict[str, Any]:
+    return {
+        "host_name": host_name,
+        "cpu_percentage": 12.5,
+        "cpu_cores": 16,
+        "cpu_threads": 32,
+        "memory_usage": 18.1,
+        "memory_percentage": 57.9,
+        "get_datetime": now.strftime(DATETIME_FORMAT)
+    }
+
+def make_containers(host_name: str, count: int, now: datetime) -> List[Dict[str, Any]]:
+    timestamp = now.strftime(DATETIME_FORMAT)
+    return [
+        {
+            "engine_type": "docker",
+            "cluster_name": f"cluster-{host_name}",
+            "node_name": host_name,
+            "container_name": f"container-{index:04d}",
+            "status": "running",
+            "cpu_percentage": (index % 100) / 10,
+            "memory_usage": 128.0 + index,
+            "memory_percentage": (index % 50) / 2,
+            "get_datetime": timestamp
+        }
+        for index in range(count)
+    ]
+
+def make_payload(host_name: str, containers: int, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Agent 한 번의 보고(SystemResourceData 형식)를 만듭니다."""
+    now = now or datetime.utcnow()
+    return {"host": make_host(host_name, now), "containers": make_containers(host_name, containers, now)}
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """정렬된 값에서 선형 보간 백분위수를 구합니다. (fraction: 0.0 ~ 1.0)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def latency_summary(latencies: Sequence[float]) -> Dict[str, float]:
+    """지연 시간(초) 목록을 ms 단위 통계로 요약합니다."""
+    values = sorted(latencies)
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values) * 1000, 3),
+        "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(values, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3)
+    }
+
+def _git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5, check=True
+        )
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def environment_info() -> Dict[str, Any]:
+    """결과 비교에 필요한 실행 환경 정보"""
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count()
+    }
+
+def write_results(path: str, results: Dict[str, Any]) -> None:
+    output = Path(path)
+    if output.parent != Path("."):
+        output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+
+def load_results(path: str) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+def change_percent(current: float, baseline: float) -> Optional[float]:
+    if not baseline:
+        return None
+    return round((current - baseline) / baseline * 100, 1)
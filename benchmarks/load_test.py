@@ -0,0 +1,264 @@
+"""
+수집 부하 테스트 - 앱을 프로세스 안에서 SQLite로 실행하고 N개 Agent가 M개 컨테이너 보고를 일정 주기로 전송합니다.
+
+네트워크/외부 DB 없이 httpx ASGITransport로 앱을 직접 호출하며, 수집 구간이 끝나면 조회 API 지연 시간도 측정합니다.
+결과(rows/s, p50/p95/p99)는 JSON으로 저장하고 --compare로 이전 결과와 비교합니다.
+
+사용법:
+    python -m benchmarks.load_test --agents 20 --containers 50 --rate 1 --duration 30
+    python -m benchmarks.load_test --memory --mode async --ingest queue --output result.json
+    python -m benchmarks.load_test --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .common import (
+    create_sqlite_database, remove_sqlite_database, configure_environment, make_payload, latency_summary,
+    environment_info, write_results, load_results, change_percent
+)
+
+# 수집 구간 이후 측정하는 조회 API ({host_id}는 첫 번째 Agent의 호스트 ID)
+READ_ENDPOINTS = (
+    "/api/hosts",
+    "/api/hosts/latest",
+    "/api/containers/latest",
+    "/api/containers?limit=1000",
+    "/api/hosts/{host_id}/containers?limit=1000",
+    "/api/hosts/{host_id}/metrics?limit=1000"
+)
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_test", description="오프라인 수집/조회 부하 테스트")
+    parser.add_argument("--agents", type=int, default=20, help="동시에 보고하는 Agent(호스트) 수")
+    parser.add_argument("--containers", type=int, default=50, help="보고 1건당 컨테이너 수")
+    parser.add_argument("--rate", type=float, default=1.0, help="Agent 1개의 초당 보고 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="수집 구간 길이 (초)")
+    parser.add_argument("--reads", type=int, default=50, help="조회 API별 요청 수 (0이면 조회 측정 생략)")
+    parser.add_argument("--read-concurrency", type=int, default=4, help="조회 API 동시 요청 수")
+    parser.add_argument("--memory", action="store_true", help="메모리 파일 시스템(/dev/shm)에 SQLite DB 생성")
+    parser.add_argument("--database-url", help="SQLite 대신 사용할 DATABASE_URL")
+    parser.add_argument("--mode", choices=("sync", "async"), default="sync", help="[database] mode")
+    parser.add_argument("--ingest", choices=("direct", "queue"), default="direct", help="[ingest] mode")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/load_test-<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    return parser.parse_args(argv)
+
+class AppLifespan:
+    """ASGI lifespan 프로토콜로 앱의 startup/shutdown 이벤트를 실행합니다."""
+
+    def __init__(self, app):
+        self.app = app
+        self._receive: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self._send: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _wait(self, expected: str) -> None:
+        message = asyncio.ensure_future(self._send.get())
+        done, _ = await asyncio.wait({message, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        if message not in done:
+            message.cancel()
+            self._task.result()
+            raise RuntimeError(f"앱이 {expected} 응답 없이 종료되었습니다.")
+        result = message.result()
+        if result["type"].endswith(".failed"):
+            raise RuntimeError(result.get("message", result["type"]))
+
+    async def __aenter__(self):
+        scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}
+        self._task = asyncio.create_task(self.app(scope, self._receive.get, self._send.put))
+        await self._receive.put({"type": "lifespan.startup"})
+        await self._wait("lifespan.startup.complete")
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._receive.put({"type": "lifespan.shutdown"})
+        await self._wait("lifespan.shutdown.complete")
+        await self._task
+
+class IngestStats:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.lags: List[float] = []
+        self.errors: Dict[str, int] = {}
+        self.host_rows = 0
+        self.container_rows = 0
+        self.payload_bytes = 0
+
+async def run_agent(client, host_name: str, containers: int, rate: float, deadline: float, stats: IngestStats) -> None:
+    """
+    한 Agent의 보고 루프. 지정된 주기로 보고를 보내며(open-loop), 응답이 늦어져도 다음 보고 시각은 밀리지 않습니다.
+
+    lag은 예정 시각보다 늦게 전송된 시간으로, 서버가 보고 주기를 따라가지 못하면 커집니다.
+    """
+    interval = 1 / rate
+    scheduled = time.perf_counter()
+    while scheduled < deadline:
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        body = json.dumps(make_payload(host_name, containers, datetime.utcnow())).encode("utf-8")
+
+        start = time.perf_counter()
+        stats.lags.append(max(0.0, start - scheduled))
+        try:
+            response = await client.post("/api/resources", content=body, headers={"content-type": "application/json"})
+            status = response.status_code
+        except Exception as e:
+            status = type(e).__name__
+        stats.latencies.append(time.perf_counter() - start)
+
+        if status in (200, 202):
+            stats.host_rows += 1
+            stats.container_rows += containers
+            stats.payload_bytes += len(body)
+        else:
+            stats.errors[str(status)] = stats.errors.get(str(status), 0) + 1
+        scheduled += interval
+
+async def wait_queue_drained(timeout: float = 60.0) -> None:
+    """queue 수집 모드에서 큐에 남은 보고가 모두 저장될 때까지 기다립니다."""
+    from services import ingest_queue, QUEUE_MODE
+
+    if not QUEUE_MODE:
+        return
+    deadline = time.perf_counter() + timeout
+    while ingest_queue.depth and time.perf_counter() < deadline:
+        await asyncio.sleep(0.05)
+
+async def run_ingest(client, args: argparse.Namespace) -> Dict[str, Any]:
+    stats = IngestStats()
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(
+        run_agent(client, f"bench-host-{index:04d}", args.containers, args.rate, deadline, stats)
+        for index in range(args.agents)
+    ))
+    await wait_queue_drained()
+    elapsed = time.perf_counter() - start
+    rows = stats.host_rows + stats.container_rows
+
+    return {
+        "requests": len(stats.latencies),
+        "errors": stats.errors,
+        "elapsed_seconds": round(elapsed, 3),
+        "requests_per_second": round(len(stats.latencies) / elapsed, 2),
+        "host_rows": stats.host_rows,
+        "container_rows": stats.container_rows,
+        "rows_per_second": round(rows / elapsed, 1),
+        "payload_bytes_per_second": round(stats.payload_bytes / elapsed, 1),
+        "latency": latency_summary(stats.latencies),
+        "schedule_lag": latency_summary(stats.lags)
+    }
+
+async def run_reads(client, path: str, requests: int, concurrency: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    response_bytes = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal response_bytes
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code == 200:
+                response_bytes += len(response.content)
+            else:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return {
+        "errors": errors,
+        "avg_response_bytes": round(response_bytes / max(1, requests - sum(errors.values())), 1),
+        "latency": latency_summary(latencies)
+    }
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    import httpx
+    from main import app
+
+    async with AppLifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+            ingest = await run_ingest(client, args)
+
+            reads: Dict[str, Any] = {}
+            if args.reads > 0:
+                hosts = (await client.get("/api/hosts")).json()
+                host_id = hosts[0]["id"] if hosts else 1
+                for endpoint in READ_ENDPOINTS:
+                    path = endpoint.format(host_id=host_id)
+                    reads[endpoint] = await run_reads(client, path, args.reads, args.read_concurrency)
+
+    return {"ingest": ingest, "reads": reads}
+
+def print_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    ingest = results["ingest"]
+    base_ingest = (baseline or {}).get("ingest", {})
+
+    def delta(current: float, previous: Optional[float]) -> str:
+        change = change_percent(current, previous) if previous is not None else None
+        return f" ({change:+.1f}%)" if change is not None else ""
+
+    latency = ingest["latency"]
+    base_latency = base_ingest.get("latency", {})
+    print(f"[수집] 요청 {ingest['requests']}건, 오류 {sum(ingest['errors'].values())}건, {ingest['elapsed_seconds']}초")
+    print(f"  rows/s: {ingest['rows_per_second']}{delta(ingest['rows_per_second'], base_ingest.get('rows_per_second'))}")
+    for key in ("p50_ms", "p95_ms", "p99_ms"):
+        print(f"  {key}: {latency.get(key)}{delta(latency.get(key, 0), base_latency.get(key))}")
+    print(f"  보고 지연(lag) p95_ms: {ingest['schedule_lag'].get('p95_ms')}")
+
+    base_reads = (baseline or {}).get("reads", {})
+    for endpoint, read in results["reads"].items():
+        latency = read["latency"]
+        base_latency = base_reads.get(endpoint, {}).get("latency", {})
+        print(
+            f"[조회] {endpoint}: p50 {latency.get('p50_ms')}ms{delta(latency.get('p50_ms', 0), base_latency.get('p50_ms'))}, "
+            f"p95 {latency.get('p95_ms')}ms{delta(latency.get('p95_ms', 0), base_latency.get('p95_ms'))}, "
+            f"p99 {latency.get('p99_ms')}ms, 오류 {sum(read['errors'].values())}건"
+        )
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+    database = None if args.database_url else create_sqlite_database(memory=args.memory)
+    configure_environment(
+        args.database_url or f"sqlite:///{database}",
+        {"DATABASE_MODE": args.mode, "INGEST_MODE": args.ingest}
+    )
+
+    results = {
+        "benchmark": "load_test",
+        "environment": environment_info(),
+        "parameters": {
+            "agents": args.agents,
+            "containers": args.containers,
+            "rate": args.rate,
+            "duration": args.duration,
+            "reads": args.reads,
+            "read_concurrency": args.read_concurrency,
+            "database": "memory" if args.memory and not args.database_url else ("custom" if args.database_url else "file"),
+            "mode": args.mode,
+            "ingest": args.ingest
+        },
+    }
+    try:
+        results.update(asyncio.run(run_benchmark(args)))
+    finally:
+        if database is not None:
+            remove_sqlite_database(database)
+
+    output = args.output or f"benchmarks/results/load_test-{datetime.utcnow():%Y%m%d-%H%M%S}.json"
+    write_results(output, results)
+    print_report(results, load_results(args.compare) if args.compare else None)
+    print(f"결과 저장: {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,299 @@
+"""
+수집 경로 마이크로 벤치마크 - receive_resource_data를 이루는 단계를 따로 떼어 ops/s와 메모리 할당량을 측정합니다.
+
+- validation: SystemResourceData 검증 (JSON 바이트 / dict, 컨테이너 10/100/1000개)
+- timestamp: get_datetime 문자열 변환 (strptime / AgentDatetime 검증)
+- logging: log_received_data 메시지 포맷팅 (off / summary / sample 전체 출력)
+- db: Container ORM 객체 생성, ORM add_all+flush, Core bulk INSERT (SQLite 메모리 DB)
+- serialization: 컨테이너 목록 응답 (response_model 검증+JSON 인코딩 / 컬럼 튜플 orjson 인코딩)
+
+시간은 tracemalloc 없이 측정하고(best-of-N), 할당량은 tracemalloc으로 별도 실행하여 측정합니다.
+- peak_kib: 1회 호출 중 최대 추가 메모리 (임시 객체 포함)
+- retained_bytes: 호출 1회당 해제되지 않고 남은 메모리
+
+사용법:
+    python -m benchmarks.micro
+    python -m benchmarks.micro --group validation --group db --sizes 100 1000
+    python -m benchmarks.micro --compare benchmarks/results/micro-baseline.json
+"""
+
+import argparse
+import gc
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .common import (
+    DATETIME_FORMAT, configure_environment, make_payload, environment_info, write_results, load_results, change_percent
+)
+
+GROUPS = ("validation", "timestamp", "logging", "db", "serialization")
+
+# (벤치마크 이름, 1회 실행 함수)
+Case = Tuple[str, Callable[[], Any]]
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.micro", description="수집 경로 마이크로 벤치마크")
+    parser.add_argument("--group", action="append", choices=GROUPS, help="실행할 벤치마크 그룹 (반복 지정 가능, 기본: 전체)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="보고 1건당 컨테이너 수")
+    parser.add_argument("--list-sizes", type=int, nargs="+", default=[1000, 10000], help="serialization 목록 크기")
+    parser.add_argument("--min-time", type=float, default=0.2, help="반복 1회(round)의 최소 측정 시간 (초)")
+    parser.add_argument("--rounds", type=int, default=5, help="반복 횟수 (가장 빠른 round를 사용)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/micro-<시각>.json)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    return parser.parse_args(argv)
+
+def _calibrate(func: Callable[[], Any], min_time: float) -> int:
+    """1 round가 min_time 이상 걸리는 반복 횟수를 찾습니다."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return loops
+        loops = loops * 10 if elapsed < min_time / 10 else max(loops + 1, int(loops * min_time / max(elapsed, 1e-9) * 1.1))
+
+def _measure_time(func: Callable[[], Any], min_time: float, rounds: int) -> Tuple[float, int]:
+    """1회 실행 시간(초, best-of-rounds)과 round당 반복 횟수를 반환합니다."""
+    loops = _calibrate(func, min_time)
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best, loops
+
+def _measure_allocations(func: Callable[[], Any], loops: int) -> Tuple[float, float]:
+    """tracemalloc으로 (1회 호출 최대 추가 메모리 bytes, 호출 1회당 남은 메모리 bytes)를 측정합니다."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+
+        gc.collect()
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(loops):
+            func()
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - baseline), max(0, after - before) / loops
+
+def run_case(name: str, func: Callable[[], Any], args: argparse.Namespace) -> Dict[str, Any]:
+    seconds, loops = _measure_time(func, args.min_time, args.rounds)
+    peak, retained = _measure_allocations(func, min(loops, 100))
+    return {
+        "ops_per_second": round(1 / seconds, 1),
+        "mean_us": round(seconds * 1e6, 2),
+        "loops": loops,
+        "peak_kib": round(peak / 1024, 2),
+        "retained_bytes": round(retained, 1)
+    }
+
+def validation_cases(sizes: List[int]) -> List[Case]:
+    from model import SystemResourceData
+
+    cases: List[Case] = []
+    for size in sizes:
+        payload = make_payload("bench-host", size)
+        body = json.dumps(payload).encode("utf-8")
+        # JSON 본문 경로(model_validate_json)와 MessagePack 경로(dict -> model_validate)
+        cases.append((f"validation.json[{size}]", lambda body=body: SystemResourceData.model_validate_json(body)))
+        cases.append((f"validation.dict[{size}]", lambda payload=payload: SystemResourceData.model_validate(payload)))
+    return cases
+
+def timestamp_cases() -> List[Case]:
+    from pydantic import TypeAdapter
+    from model import AgentDatetime
+
+    # 수집 경로는 AgentDatetime 검증 한 번으로 변환하며, strptime은 이전 방식의 비교 기준
+    adapter = TypeAdapter(AgentDatetime)
+    text = datetime(2025, 1, 1, 12, 30, 45).strftime(DATETIME_FORMAT)
+    return [
+        ("timestamp.strptime", lambda: datetime.strptime(text, DATETIME_FORMAT)),
+        ("timestamp.agent_datetime", lambda: adapter.validate_python(text)),
+        ("timestamp.agent_datetime_offset", lambda: adapter.validate_python("2025-01-01T21:30:45+09:00"))
+    ]
+
+class _FormatOnlyHandler(logging.Handler):
+    """레코드를 포맷팅만 하고 버리는 핸들러 (실제 로그는 리스너 스레드에서 포맷팅되므로 그 비용을 같은 스레드에서 측정)"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+
+def logging_cases(sizes: List[int]) -> List[Case]:
+    import utils.utils as payload_logging
+    from model import SystemResourceData
+
+    logger = logging.getLogger("benchmarks.payload")
+    logger.handlers = [_FormatOnlyHandler()]
+    logger.handlers[0].setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    def log_with(mode: str, resource_data: SystemResourceData) -> Callable[[], None]:
+        def run():
+            # 모듈 전역 설정을 바꿔 실행하고 원래 값으로 되돌림 (sample은 매번 출력되도록 1건 중 1건)
+            saved = payload_logging.PAYLOAD_LOG_MODE, payload_logging.PAYLOAD_LOG_SAMPLE_RATE
+            payload_logging.PAYLOAD_LOG_MODE, payload_logging.PAYLOAD_LOG_SAMPLE_RATE = mode, 1
+            try:
+                payload_logging.log_received_data(resource_data.host, resource_data.containers, logger)
+            finally:
+                payload_logging.PAYLOAD_LOG_MODE, payload_logging.PAYLOAD_LOG_SAMPLE_RATE = saved
+        return run
+
+    cases: List[Case] = []
+    for size in sizes:
+        resource_data = SystemResourceData.model_validate(make_payload("bench-host", size))
+        for mode in ("off", "summary", "sample"):
+            cases.append((f"logging.{mode}[{size}]", log_with(mode, resource_data)))
+    return cases
+
+def db_cases(sizes: List[int]) -> List[Case]:
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+    from model import Base, Host, ContainerSeries, Container
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        host = Host(host_name="bench-host")
+        series = ContainerSeries(
+            series_hash="0" * 40, engine_type="docker", cluster_name="cluster",
+            node_name="bench-host", container_name="container", status="running"
+        )
+        session.add_all([host, series])
+        session.commit()
+        host_id, series_id = host.id, series.id
+
+    def orm_construct(rows):
+        return lambda: [Container(**row) for row in rows]
+
+    def orm_flush(rows):
+        def run():
+            # INSERT까지 실행하고 롤백하여 매 실행의 테이블 크기를 같게 유지
+            with Session(engine) as session:
+                session.add_all([Container(**row) for row in rows])
+                session.flush()
+                session.rollback()
+        return run
+
+    def core_insert(rows):
+        def run():
+            with Session(engine) as session:
+                session.execute(insert(Container.__table__), rows)
+                session.rollback()
+        return run
+
+    cases: List[Case] = []
+    now = datetime.utcnow()
+    for size in sizes:
+        rows = [
+            {
+                "series_id": series_id,
+                "cpu_percentage": (index % 100) / 10,
+                "memory_usage": 128.0 + index,
+                "memory_percentage": (index % 50) / 2,
+                "get_datetime": now,
+                "host_id": host_id
+            }
+            for index in range(size)
+        ]
+        cases.append((f"db.orm_construct[{size}]", orm_construct(rows)))
+        cases.append((f"db.orm_flush[{size}]", orm_flush(rows)))
+        cases.append((f"db.core_insert[{size}]", core_insert(rows)))
+    return cases
+
+def serialization_cases(list_sizes: List[int]) -> List[Case]:
+    from typing import List as ListType
+    from pydantic import TypeAdapter
+    from model import ContainerResponse
+    from utils.serialization import dump_json, rows_to_dicts
+
+    # FastAPI response_model 경로: 응답 모델로 재검증 -> JSON 호환 값으로 변환 -> json.dumps (JSONResponse와 같은 옵션)
+    adapter = TypeAdapter(ListType[ContainerResponse])
+
+    def response_model(rows: List[Dict[str, Any]]):
+        def run():
+            content = adapter.dump_python(adapter.validate_python(rows), mode="json")
+            return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+        return run
+
+    columns = tuple(ContainerResponse.model_fields)
+    now = datetime.utcnow()
+    cases: List[Case] = []
+    for size in list_sizes:
+        tuples = [
+            (index, "docker", "cluster", "bench-host", f"container-{index:05d}", "running",
+             (index % 100) / 10, 128.0 + index, (index % 50) / 2, now, 1)
+            for index in range(size)
+        ]
+        dicts = rows_to_dicts(columns, tuples)
+        cases.append((f"serialization.response_model[{size}]", response_model(dicts)))
+        # 현재 목록 조회 경로: 컬럼 튜플 -> dict -> orjson
+        cases.append((f"serialization.orjson_rows[{size}]", lambda tuples=tuples: dump_json(rows_to_dicts(columns, tuples))))
+    return cases
+
+def build_cases(args: argparse.Namespace) -> List[Case]:
+    groups = args.group or GROUPS
+    builders = {
+        "validation": lambda: validation_cases(args.sizes),
+        "timestamp": timestamp_cases,
+        "logging": lambda: logging_cases(args.sizes),
+        "db": lambda: db_cases(args.sizes),
+        "serialization": lambda: serialization_cases(args.list_sizes)
+    }
+    return [case for group in GROUPS if group in groups for case in builders[group]()]
+
+def print_report(results: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Any]] = None) -> None:
+    base_results = (baseline or {}).get("results", {})
+    print(f"{'benchmark':<42} {'ops/s':>12} {'mean(us)':>12} {'peak(KiB)':>11} {'retained(B)':>12}")
+    for name, result in results.items():
+        previous = base_results.get(name, {}).get("ops_per_second")
+        change = change_percent(result["ops_per_second"], previous) if previous else None
+        delta = f" ({change:+.1f}%)" if change is not None else ""
+        print(
+            f"{name:<42} {result['ops_per_second']:>12,.1f} {result['mean_us']:>12,.2f} "
+            f"{result['peak_kib']:>11,.2f} {result['retained_bytes']:>12,.1f}{delta}"
+        )
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+    # 앱 모듈(utils 등)을 import하기 전에 로그 설정을 지정
+    configure_environment()
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, func in build_cases(args):
+        results[name] = run_case(name, func, args)
+
+    output = args.output or f"benchmarks/results/micro-{datetime.utcnow():%Y%m%d-%H%M%S}.json"
+    write_results(output, {
+        "benchmark": "micro",
+        "environment": environment_info(),
+        "parameters": {
+            "groups": list(args.group or GROUPS),
+            "sizes": args.sizes,
+            "list_sizes": args.list_sizes,
+            "min_time": args.min_time,
+            "rounds": args.rounds
+        },
+        "results": results
+    })
+    print_report(results, load_results(args.compare) if args.compare else None)
+    print(f"결과 저장: {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
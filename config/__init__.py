@@ -2,7 +2,7 @@
 Configuration module for Resource Monitor Server
 """
 
-from .config import config, Config
+from .config import config, Config, Settings, LIVE_SETTINGS, PAYLOAD_LOG_MODES, validate_live_settings
 from .config import (
     get_database_url,
     get_server_config,
@@ -13,6 +13,10 @@ from .config import (
 __all__ = [
     'config',
     'Config',
+    'Settings',
+    'LIVE_SETTINGS',
+    'PAYLOAD_LOG_MODES',
+    'validate_live_settings',
     'get_database_url',
     'get_server_config',
     'get_app_config',
@@ -1,21 +1,208 @@
 import configparser
+import logging
 import os
-from typing import Optional, List
+import threading
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+def _lower(default: str) -> Any:
+    """읽은 값을 소문자로 변환하는 설정 필드"""
+    return field(default=default, metadata={"lower": True})
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    설정 파일과 환경변수를 한 번 읽어 타입 변환까지 마친 읽기 전용 설정 스냅샷.
+    
+    필드 이름은 "{섹션}_{키}" 형식이며 (예: logging_level -> [logging] level, 환경변수 LOGGING_LEVEL),
+    기본값은 설정 파일/환경변수에 값이 없을 때 사용됩니다.
+    """
+    
+    # MySQL 설정
+    mysql_host: str = "localhost"
+    mysql_port: int = 3306
+    mysql_user: str = "root"
+    mysql_password: str = ""
+    mysql_database: str = "test"
+    mysql_charset: str = "utf8mb4"
+    
+    # Database 설정 (database_url은 MySQL 설정 또는 환경변수 DATABASE_URL로 생성, 비밀번호가 없으면 None)
+    database_url: Optional[str] = field(default=None, metadata={"derived": True})
+    database_echo: bool = False
+    database_pool_size: int = 0
+    database_max_overflow: int = 0
+    database_pool_pre_ping: bool = True
+    database_pool_recycle: int = 3600
+    database_pool_warmup: bool = True
+    database_health_check_interval_seconds: int = 10
+    database_health_check_timeout_seconds: int = 5
+    database_auto_migrate: bool = True
+    database_mode: str = _lower("sync")
+    database_async_mysql_driver: str = "asyncmy"
+    database_partitioning: str = _lower("none")
+    database_partition_future_days: int = 7
+    database_partition_maintenance_interval_hours: int = 6
+    
+    # Server 설정
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_reload: bool = True
+    server_log_level: str = "info"
+    server_graceful_shutdown_seconds: int = 10
+    
+    # App 설정
+    app_title: str = "Resource Monitor Server"
+    app_description: str = "Agent로부터 Docker 자원 사용량 정보를 수집하는 서버"
+    app_version: str = "1.0.0"
+    app_debug: bool = False
+    app_config_reload_interval_seconds: int = 5
+    
+    # CORS 설정
+    cors_allow_origins: Tuple[str, ...] = ("*",)
+    cors_allow_methods: Tuple[str, ...] = ("GET", "POST", "PUT", "DELETE", "OPTIONS")
+    cors_allow_headers: Tuple[str, ...] = ("*",)
+    cors_allow_credentials: bool = True
+    
+    # Logging 설정
+    logging_level: str = "INFO"
+    logging_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    logging_file_path: str = "logs/app.log"
+    logging_max_file_size: int = 10485760  # 10MB
+    logging_backup_count: int = 5
+    logging_payload_mode: str = _lower("summary")
+    logging_payload_sample_rate: int = 100
+    
+    # API 설정
+    api_default_page_size: int = 1000
+    api_max_page_size: int = 10000
+    api_export_chunk_size: int = 5000
+    
+    # Ingest 설정
+    ingest_mode: str = _lower("direct")
+    ingest_queue_max_size: int = 10000
+    ingest_flush_interval_ms: int = 200
+    ingest_flush_max_rows: int = 5000
+    ingest_flush_max_retries: int = 3
+    ingest_max_body_mb: int = 64
+    
+    # Cache 설정
+    cache_latest_state_enabled: bool = True
+    cache_latest_warmup_hours: int = 24
+    cache_series_cache_size: int = 100000
+    cache_query_ttl_seconds: int = 10
+    cache_query_max_entries: int = 256
+    
+    # Stream 설정
+    stream_enabled: bool = True
+    stream_max_subscribers: int = 100
+    stream_buffer_size: int = 1000
+    stream_heartbeat_seconds: int = 15
+    
+    # Rollup 설정
+    rollup_enabled: bool = True
+    rollup_interval_seconds: int = 60
+    rollup_batch_size: int = 10000
+    rollup_max_batches_per_run: int = 50
+    rollup_max_points: int = 1000
+    
+    # Security 설정
+    security_secret_key: str = "your-secret-key-here"
+    security_algorithm: str = "HS256"
+    security_access_token_expire_minutes: int = 30
+    
+    # Monitoring 설정
+    monitoring_max_records_per_host: int = 1000
+    monitoring_cleanup_interval_hours: int = 24
+    monitoring_data_retention_days: int = 30
+    monitoring_cleanup_enabled: bool = False
+    monitoring_cleanup_batch_size: int = 1000
+    monitoring_cleanup_batch_pause_ms: int = 100
+    
+    # Metrics 설정
+    metrics_enabled: bool = True
+    metrics_server_timing_enabled: bool = False
+    metrics_slow_query_log_enabled: bool = False
+    metrics_slow_query_threshold_ms: int = 500
+
+# 서버 실행 중 다시 읽어 반영하는 설정 (SIGHUP 또는 설정 파일 변경 시)
+# 그 외 설정은 엔진/미들웨어/백그라운드 작업 생성 시점에 사용되므로 재시작해야 반영됩니다.
+LIVE_SETTINGS = frozenset({
+    "logging_level",
+    "logging_payload_mode",
+    "logging_payload_sample_rate",
+    "cors_allow_origins",
+    "cors_allow_methods",
+    "cors_allow_headers",
+    "cors_allow_credentials",
+    "monitoring_data_retention_days",
+    "monitoring_max_records_per_host",
+    "monitoring_cleanup_interval_hours",
+    "monitoring_cleanup_batch_size",
+    "monitoring_cleanup_batch_pause_ms"
+})
+
+# [logging] payload_mode 허용 값
+PAYLOAD_LOG_MODES = ("off", "summary", "sample")
+
+# 음수를 허용하지 않는 LIVE_SETTINGS (0이면 미적용/대기 없음)
+_NON_NEGATIVE_LIVE_SETTINGS = (
+    "monitoring_data_retention_days",
+    "monitoring_max_records_per_host",
+    "monitoring_cleanup_batch_pause_ms"
+)
+
+# 1 이상이어야 하는 LIVE_SETTINGS (0이면 삭제 루프가 끝나지 않거나 정리 작업이 대기 없이 반복됨)
+_POSITIVE_LIVE_SETTINGS = (
+    "logging_payload_sample_rate",
+    "monitoring_cleanup_interval_hours",
+    "monitoring_cleanup_batch_size"
+)
+
+def validate_live_settings(settings: Settings) -> None:
+    """
+    서버 실행 중 반영할 설정 값이 올바른지 확인합니다. (서버 시작 시와 설정을 다시 읽을 때 확인)
+    
+    Raises:
+        ValueError: 알 수 없는 로그 레벨/수신 데이터 로그 방식이거나 범위를 벗어난 보존 정책 값이 있는 경우
+    """
+    errors = []
+    if not isinstance(logging.getLevelName(settings.logging_level.upper()), int):
+        errors.append(f"[logging] level: 알 수 없는 로그 레벨입니다 ({settings.logging_level})")
+    if settings.logging_payload_mode not in PAYLOAD_LOG_MODES:
+        errors.append(
+            f"[logging] payload_mode: {' | '.join(PAYLOAD_LOG_MODES)} 중 하나여야 합니다 ({settings.logging_payload_mode})"
+        )
+    for names, minimum in ((_NON_NEGATIVE_LIVE_SETTINGS, 0), (_POSITIVE_LIVE_SETTINGS, 1)):
+        for name in names:
+            value = getattr(settings, name)
+            if value < minimum:
+                section, key = name.split("_", 1)
+                errors.append(f"[{section}] {key}: {minimum} 이상이어야 합니다 ({value})")
+    if errors:
+        raise ValueError("잘못된 설정 값: " + "; ".join(errors))
+
 class Config:
     def __init__(self, config_file: str = "config/config.ini"):
         self.config = configparser.ConfigParser(interpolation=None)
         self.config_file = config_file
+        self._reload_lock = threading.Lock()
+        self._reload_listeners: List[Callable[[Settings], None]] = []
         self._load_config()
+        self.settings = self._load_settings()
+        validate_live_settings(self.settings)
     
     def _load_config(self):
-        """설정 파일을 로드합니다."""
+        """설정 파일을 로드합니다. (읽기에 실패하면 기존 내용을 유지)"""
         config_path = Path(self.config_file)
         if not config_path.exists():
             raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {self.config_file}")
         
-        self.config.read(self.config_file, encoding='utf-8')
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read(self.config_file, encoding='utf-8')
+        self.config = parser
     
     def _get_env_or_config(self, section: str, key: str, default: Optional[str] = None) -> Optional[str]:
         """환경변수를 우선으로 하고, 없으면 설정 파일에서 가져옵니다."""
@@ -62,142 +249,385 @@ class Config:
         
         return [item.strip() for item in value.split(",")]
     
+    def _build_database_url(self, values: Dict[str, Any]) -> Optional[str]:
+        """MySQL 설정을 조합하여 DATABASE_URL을 생성합니다. (비밀번호가 없으면 None)"""
+        # 직접 DATABASE_URL이 환경변수로 설정된 경우 우선 사용
+        direct_url = os.getenv("DATABASE_URL")
+        if direct_url:
+            return direct_url
+        
+        if not values["mysql_password"]:
+            return None
+        return (
+            f"mysql+pymysql://{values['mysql_user']}:{values['mysql_password']}@{values['mysql_host']}:"
+            f"{values['mysql_port']}/{values['mysql_database']}?charset={values['mysql_charset']}"
+        )
+    
+    def _load_settings(self) -> Settings:
+        """현재 설정 파일 내용과 환경변수로 Settings 스냅샷을 만듭니다."""
+        values: Dict[str, Any] = {}
+        for settings_field in fields(Settings):
+            if settings_field.metadata.get("derived"):
+                continue
+            section, key = settings_field.name.split("_", 1)
+            default = settings_field.default
+            if settings_field.type is bool:
+                value = self._get_bool(section, key, default)
+            elif settings_field.type is int:
+                value = self._get_int(section, key, default)
+            elif settings_field.type is float:
+                value = self._get_float(section, key, default)
+            elif settings_field.type == Tuple[str, ...]:
+                value = tuple(self._get_list(section, key, list(default)))
+            else:
+                value = self._get_env_or_config(section, key, default)
+                if settings_field.metadata.get("lower"):
+                    value = value.lower()
+            values[settings_field.name] = value
+        
+        # 환경변수 MYSQL_PASSWORD에서 우선 가져오고, 없으면 설정 파일 값 사용 (보안상 권장하지 않음)
+        values["mysql_password"] = os.getenv("MYSQL_PASSWORD") or values["mysql_password"]
+        values["database_url"] = self._build_database_url(values)
+        return Settings(**values)
+    
+    def on_reload(self, listener: Callable[[Settings], None]) -> None:
+        """설정을 다시 읽어 LIVE_SETTINGS 값이 바뀌었을 때 새 스냅샷으로 호출할 함수를 등록합니다."""
+        self._reload_listeners.append(listener)
+    
+    def reload(self) -> Dict[str, Tuple[Any, Any]]:
+        """
+        설정 파일과 환경변수를 다시 읽어 LIVE_SETTINGS에 해당하는 값만 새 스냅샷으로 교체합니다.
+        
+        스냅샷은 통째로 교체되므로 읽는 쪽은 이전 또는 새 설정 중 하나만 보게 되며,
+        재시작이 필요한 설정의 변경은 반영하지 않고 경고만 남깁니다.
+        새 값이 올바르지 않거나 변경을 반영하는 함수가 실패하면 기존 스냅샷을 유지하고,
+        이미 반영한 함수에는 기존 스냅샷을 다시 전달합니다.
+        
+        Returns:
+            Dict[str, Tuple[Any, Any]]: 반영된 설정 {필드 이름: (이전 값, 새 값)}
+        
+        Raises:
+            ValueError: 새 설정 값이 올바르지 않은 경우
+            RuntimeError: 변경을 반영하는 함수가 실패한 경우
+        """
+        with self._reload_lock:
+            current = self.settings
+            self._load_config()
+            loaded = self._load_settings()
+            
+            changed = {}
+            pending = []
+            for settings_field in fields(Settings):
+                name = settings_field.name
+                before, after = getattr(current, name), getattr(loaded, name)
+                if before == after:
+                    continue
+                if name in LIVE_SETTINGS:
+                    changed[name] = (before, after)
+                else:
+                    pending.append(name)
+            
+            if pending:
+                logger.warning(f"재시작 후 반영되는 설정이 변경되었습니다: {', '.join(pending)}")
+            if not changed:
+                return changed
+            
+            candidate = replace(current, **{name: after for name, (_, after) in changed.items()})
+            validate_live_settings(candidate)
+            
+            self.settings = candidate
+            applied = []
+            for listener in self._reload_listeners:
+                try:
+                    listener(candidate)
+                except Exception as e:
+                    self.settings = current
+                    for applied_listener in applied:
+                        try:
+                            applied_listener(current)
+                        except Exception as rollback_error:
+                            logger.error(
+                                f"기존 설정 복원 실패 ({getattr(applied_listener, '__qualname__', applied_listener)}): "
+                                f"{str(rollback_error)}"
+                            )
+                    raise RuntimeError(
+                        f"설정 변경 반영 실패 ({getattr(listener, '__qualname__', listener)}): {str(e)}"
+                    ) from e
+                applied.append(listener)
+            
+            logger.info(
+                "설정 다시 읽기 완료: " + ", ".join(f"{name}={after!r}" for name, (_, after) in changed.items())
+            )
+            return changed
+    
     # MySQL 설정
     def get_mysql_host(self) -> str:
-        return self._get_env_or_config("mysql", "host", "localhost")
+        return self.settings.mysql_host
     
     def get_mysql_port(self) -> int:
-        return self._get_int("mysql", "port", 3306)
+        return self.settings.mysql_port
     
     def get_mysql_user(self) -> str:
-        return self._get_env_or_config("mysql", "user", "root")
+        return self.settings.mysql_user
     
     def get_mysql_password(self) -> str:
-        # 환경변수 MYSQL_PASSWORD에서 우선 가져오기
-        password = os.getenv("MYSQL_PASSWORD")
-        if password:
-            return password
-        
-        # 환경변수가 없으면 설정 파일에서 가져오기 (보안상 권장하지 않음)
-        return self._get_env_or_config("mysql", "password", "")
+        return self.settings.mysql_password
     
     def get_mysql_database(self) -> str:
-        return self._get_env_or_config("mysql", "database", "test")
+        return self.settings.mysql_database
     
     def get_mysql_charset(self) -> str:
-        return self._get_env_or_config("mysql", "charset", "utf8mb4")
+        return self.settings.mysql_charset
     
     # Database 설정
     def get_database_url(self) -> str:
-        """MySQL 설정을 조합하여 DATABASE_URL을 생성합니다."""
-        # 직접 DATABASE_URL이 환경변수로 설정된 경우 우선 사용
-        direct_url = os.getenv("DATABASE_URL")
-        if direct_url:
-            return direct_url
-        
-        # MySQL 설정으로 URL 생성
-        host = self.get_mysql_host()
-        port = self.get_mysql_port()
-        user = self.get_mysql_user()
-        password = self.get_mysql_password()
-        database = self.get_mysql_database()
-        charset = self.get_mysql_charset()
-        
-        if not password:
+        """MySQL 설정을 조합하여 만든 DATABASE_URL (환경변수 DATABASE_URL 우선)"""
+        if self.settings.database_url is None:
             raise ValueError("MySQL 비밀번호가 설정되지 않았습니다. 환경변수 MYSQL_PASSWORD를 설정해주세요.")
-        
-        return f"mysql+pymysql://{user}:{password}@{host}:{port}/{database}?charset={charset}"
+        return self.settings.database_url
     
     def get_database_echo(self) -> bool:
-        return self._get_bool("database", "echo", False)
+        return self.settings.database_echo
     
     def get_database_pool_size(self) -> int:
-        return self._get_int("database", "pool_size", 0)
+        return self.settings.database_pool_size
     
     def get_database_max_overflow(self) -> int:
-        return self._get_int("database", "max_overflow", 0)
+        return self.settings.database_max_overflow
     
     def get_database_pool_pre_ping(self) -> bool:
-        return self._get_bool("database", "pool_pre_ping", True)
+        return self.settings.database_pool_pre_ping
     
     def get_database_pool_recycle(self) -> int:
-        return self._get_int("database", "pool_recycle", 3600)
+        return self.settings.database_pool_recycle
+    
+    def get_database_pool_warmup(self) -> bool:
+        """서버 시작 시 연결 풀에 pool_size개 연결을 미리 열지 여부"""
+        return self.settings.database_pool_warmup
+    
+    def get_database_health_check_interval_seconds(self) -> int:
+        """백그라운드 DB 상태 확인 주기 (/health, /ready는 마지막 확인 결과를 사용)"""
+        return self.settings.database_health_check_interval_seconds
+    
+    def get_database_health_check_timeout_seconds(self) -> int:
+        return self.settings.database_health_check_timeout_seconds
+    
+    def get_database_auto_migrate(self) -> bool:
+        """서버 시작 시 스키마 마이그레이션 자동 적용 여부"""
+        return self.settings.database_auto_migrate
+    
+    def get_database_mode(self) -> str:
+        """데이터베이스 접근 방식 (sync 또는 async)"""
+        return self.settings.database_mode
+    
+    def get_database_async_mysql_driver(self) -> str:
+        """async 모드에서 사용할 MySQL 드라이버 (asyncmy 또는 aiomysql)"""
+        return self.settings.database_async_mysql_driver
+    
+    def get_database_partitioning(self) -> str:
+        """containers 테이블 파티셔닝 방식 (none 또는 daily, MySQL에서만 적용)"""
+        return self.settings.database_partitioning
+    
+    def get_database_partition_future_days(self) -> int:
+        return self.settings.database_partition_future_days
+    
+    def get_database_partition_maintenance_interval_hours(self) -> int:
+        return self.settings.database_partition_maintenance_interval_hours
     
     # Server 설정
     def get_server_host(self) -> str:
-        return self._get_env_or_config("server", "host", "0.0.0.0")
+        return self.settings.server_host
     
     def get_server_port(self) -> int:
-        return self._get_int("server", "port", 8000)
+        return self.settings.server_port
     
     def get_server_reload(self) -> bool:
-        return self._get_bool("server", "reload", True)
+        return self.settings.server_reload
     
     def get_server_log_level(self) -> str:
-        return self._get_env_or_config("server", "log_level", "info")
+        return self.settings.server_log_level
+    
+    def get_server_graceful_shutdown_seconds(self) -> int:
+        """종료 시 열린 연결(실시간 전송 등)이 끝나기를 기다리는 최대 시간"""
+        return self.settings.server_graceful_shutdown_seconds
     
     # App 설정
     def get_app_title(self) -> str:
-        return self._get_env_or_config("app", "title", "Resource Monitor Server")
+        return self.settings.app_title
     
     def get_app_description(self) -> str:
-        return self._get_env_or_config("app", "description", "Agent로부터 Docker 자원 사용량 정보를 수집하는 서버")
+        return self.settings.app_description
     
     def get_app_version(self) -> str:
-        return self._get_env_or_config("app", "version", "1.0.0")
+        return self.settings.app_version
     
     def get_app_debug(self) -> bool:
-        return self._get_bool("app", "debug", False)
+        return self.settings.app_debug
+    
+    def get_app_config_reload_interval_seconds(self) -> int:
+        """설정 파일 변경 확인 주기 (초, 0이면 SIGHUP으로만 다시 읽음)"""
+        return self.settings.app_config_reload_interval_seconds
     
     # CORS 설정
     def get_cors_allow_origins(self) -> List[str]:
-        return self._get_list("cors", "allow_origins", ["*"])
+        return list(self.settings.cors_allow_origins)
     
     def get_cors_allow_methods(self) -> List[str]:
-        return self._get_list("cors", "allow_methods", ["GET", "POST", "PUT", "DELETE", "OPTIONS"])
+        return list(self.settings.cors_allow_methods)
     
     def get_cors_allow_headers(self) -> List[str]:
-        return self._get_list("cors", "allow_headers", ["*"])
+        return list(self.settings.cors_allow_headers)
     
     def get_cors_allow_credentials(self) -> bool:
-        return self._get_bool("cors", "allow_credentials", True)
+        return self.settings.cors_allow_credentials
     
     # Logging 설정
     def get_logging_level(self) -> str:
-        return self._get_env_or_config("logging", "level", "INFO")
+        return self.settings.logging_level
     
     def get_logging_format(self) -> str:
-        return self._get_env_or_config("logging", "format", 
-                                     "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        return self.settings.logging_format
     
     def get_logging_file_path(self) -> str:
-        return self._get_env_or_config("logging", "file_path", "logs/app.log")
+        return self.settings.logging_file_path
     
     def get_logging_max_file_size(self) -> int:
-        return self._get_int("logging", "max_file_size", 10485760)  # 10MB
+        return self.settings.logging_max_file_size
     
     def get_logging_backup_count(self) -> int:
-        return self._get_int("logging", "backup_count", 5)
+        return self.settings.logging_backup_count
+    
+    def get_logging_payload_mode(self) -> str:
+        return self.settings.logging_payload_mode
+    
+    def get_logging_payload_sample_rate(self) -> int:
+        return self.settings.logging_payload_sample_rate
+    
+    # API 설정
+    def get_api_default_page_size(self) -> int:
+        return self.settings.api_default_page_size
+    
+    def get_api_max_page_size(self) -> int:
+        return self.settings.api_max_page_size
+    
+    def get_api_export_chunk_size(self) -> int:
+        return self.settings.api_export_chunk_size
+    
+    # Ingest 설정
+    def get_ingest_mode(self) -> str:
+        """수집 방식 (direct: 요청 내 즉시 저장, queue: 큐 적재 후 백그라운드 저장)"""
+        return self.settings.ingest_mode
+    
+    def get_ingest_queue_max_size(self) -> int:
+        return self.settings.ingest_queue_max_size
+    
+    def get_ingest_flush_interval_ms(self) -> int:
+        return self.settings.ingest_flush_interval_ms
+    
+    def get_ingest_flush_max_rows(self) -> int:
+        return self.settings.ingest_flush_max_rows
+    
+    def get_ingest_flush_max_retries(self) -> int:
+        return self.settings.ingest_flush_max_retries
+    
+    def get_ingest_max_body_mb(self) -> int:
+        """압축 해제한 수집 요청 본문의 최대 크기 (MB)"""
+        return self.settings.ingest_max_body_mb
+    
+    # Cache 설정
+    def get_cache_latest_state_enabled(self) -> bool:
+        return self.settings.cache_latest_state_enabled
+    
+    def get_cache_latest_warmup_hours(self) -> int:
+        """시작 시 최신 상태 캐시를 채울 때 조회할 최근 기록 범위 (0이면 전체)"""
+        return self.settings.cache_latest_warmup_hours
+    
+    def get_cache_series_cache_size(self) -> int:
+        """수집 시 컨테이너 series ID를 조회하는 LRU 캐시 크기"""
+        return self.settings.cache_series_cache_size
+    
+    def get_cache_query_ttl_seconds(self) -> int:
+        """집계 조회 결과 캐시 유지 시간 (0이면 동시에 들어온 같은 요청만 결과 공유)"""
+        return self.settings.cache_query_ttl_seconds
+    
+    def get_cache_query_max_entries(self) -> int:
+        return self.settings.cache_query_max_entries
+    
+    # Stream 설정
+    def get_stream_enabled(self) -> bool:
+        return self.settings.stream_enabled
+    
+    def get_stream_max_subscribers(self) -> int:
+        return self.settings.stream_max_subscribers
+    
+    def get_stream_buffer_size(self) -> int:
+        """구독자별 전송 대기 버퍼 크기 (가득 차면 가장 오래된 샘플부터 버림)"""
+        return self.settings.stream_buffer_size
+    
+    def get_stream_heartbeat_seconds(self) -> int:
+        return self.settings.stream_heartbeat_seconds
+    
+    # Rollup 설정
+    def get_rollup_enabled(self) -> bool:
+        return self.settings.rollup_enabled
+    
+    def get_rollup_interval_seconds(self) -> int:
+        return self.settings.rollup_interval_seconds
+    
+    def get_rollup_batch_size(self) -> int:
+        return self.settings.rollup_batch_size
+    
+    def get_rollup_max_batches_per_run(self) -> int:
+        return self.settings.rollup_max_batches_per_run
+    
+    def get_rollup_max_points(self) -> int:
+        """resolution=auto일 때 허용하는 최대 버킷 수"""
+        return self.settings.rollup_max_points
     
     # Security 설정
     def get_security_secret_key(self) -> str:
-        return self._get_env_or_config("security", "secret_key", "your-secret-key-here")
+        return self.settings.security_secret_key
     
     def get_security_algorithm(self) -> str:
-        return self._get_env_or_config("security", "algorithm", "HS256")
+        return self.settings.security_algorithm
     
     def get_security_access_token_expire_minutes(self) -> int:
-        return self._get_int("security", "access_token_expire_minutes", 30)
+        return self.settings.security_access_token_expire_minutes
     
     # Monitoring 설정
     def get_monitoring_max_records_per_host(self) -> int:
-        return self._get_int("monitoring", "max_records_per_host", 1000)
+        return self.settings.monitoring_max_records_per_host
     
     def get_monitoring_cleanup_interval_hours(self) -> int:
-        return self._get_int("monitoring", "cleanup_interval_hours", 24)
+        return self.settings.monitoring_cleanup_interval_hours
     
     def get_monitoring_data_retention_days(self) -> int:
-        return self._get_int("monitoring", "data_retention_days", 30)
+        return self.settings.monitoring_data_retention_days
+    
+    def get_monitoring_cleanup_enabled(self) -> bool:
+        return self.settings.monitoring_cleanup_enabled
+    
+    def get_monitoring_cleanup_batch_size(self) -> int:
+        return self.settings.monitoring_cleanup_batch_size
+    
+    def get_monitoring_cleanup_batch_pause_ms(self) -> int:
+        return self.settings.monitoring_cleanup_batch_pause_ms
+    
+    # Metrics 설정
+    def get_metrics_enabled(self) -> bool:
+        """/metrics(Prometheus) 엔드포인트와 요청/DB 지표 수집 사용 여부"""
+        return self.settings.metrics_enabled
+    
+    def get_metrics_server_timing_enabled(self) -> bool:
+        """응답에 Server-Timing 헤더(검증/DB/직렬화 시간) 추가 여부"""
+        return self.settings.metrics_server_timing_enabled
+    
+    def get_metrics_slow_query_log_enabled(self) -> bool:
+        return self.settings.metrics_slow_query_log_enabled
+    
+    def get_metrics_slow_query_threshold_ms(self) -> int:
+        """이 시간(ms) 이상 걸린 SQL 문을 느린 쿼리로 기록"""
+        return self.settings.metrics_slow_query_threshold_ms
 
 # 전역 설정 인스턴스
 config = Config()
@@ -228,4 +658,4 @@ def get_cors_config() -> dict:
         "allow_methods": config.get_cors_allow_methods(),
         "allow_headers": config.get_cors_allow_headers(),
         "allow_credentials": config.get_cors_allow_credentials()
-    } 
\ No newline at end of file
+    }
@@ -0,0 +1,90 @@
+"""
+pytest 공통 설정 - 테스트는 MySQL 대신 임시 디렉토리의 SQLite 데이터베이스를 사용합니다.
+
+설정/데이터베이스 모듈은 import 시점에 환경변수를 읽으므로 앱 모듈을 import하기 전에 설정합니다.
+(config/config.ini는 README의 설치 방법대로 미리 만들어 두어야 합니다)
+
+    python -m pytest -q
+"""
+
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from typing import Optional
+
+_TEST_DIR = tempfile.mkdtemp(prefix="resource-monitor-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DIR}/test.db"
+os.environ["DATABASE_MODE"] = "sync"
+os.environ.setdefault("LOGGING_LEVEL", "WARNING")
+os.environ.setdefault("DATABASE_HEALTH_CHECK_TIMEOUT_SECONDS", "1")
+
+import pytest
+from model import Base, SystemResourceData
+from database import engine as test_engine, SessionLocal, series_id_cache
+from database.crud import _host_id_cache
+
+def pytest_sessionfinish(session, exitstatus):
+    test_engine.dispose()
+    shutil.rmtree(_TEST_DIR, ignore_errors=True)
+
+@pytest.fixture
+def engine():
+    """테스트마다 비어 있는 테이블과 ID 캐시로 시작하는 엔진"""
+    Base.metadata.drop_all(bind=test_engine)
+    Base.metadata.create_all(bind=test_engine)
+    _host_id_cache.clear()
+    series_id_cache.clear()
+    yield test_engine
+    test_engine.dispose()
+
+@pytest.fixture
+def db(engine):
+    with SessionLocal() as session:
+        yield session
+
+@pytest.fixture
+def make_payload():
+    """Agent 보고 한 건(SystemResourceData)을 만드는 함수"""
+    def _make_payload(
+        host_name: str = "host-1",
+        containers: int = 2,
+        when: Optional[datetime] = None,
+        cluster_name: str = "cluster-1",
+        host_cpu: float = 1.5,
+        host_memory_percentage: float = 10.0
+    ) -> SystemResourceData:
+        when = when or datetime(2025, 6, 23, 3, 2, 50)
+        return SystemResourceData.model_validate({
+            "host": {
+                "host_name": host_name,
+                "cpu_percentage": host_cpu,
+                "cpu_cores": 4,
+                "cpu_threads": 8,
+                "memory_usage": 1024.0,
+                "memory_percentage": host_memory_percentage,
+                "get_datetime": when
+            },
+            "containers": [
+                {
+                    "engine_type": "docker",
+                    "cluster_name": cluster_name,
+                    "node_name": "node-1",
+                    "container_name": f"container-{index}",
+                    "status": "running",
+                    "cpu_percentage": float(index),
+                    "memory_usage": 100.0 * (index + 1),
+                    "memory_percentage": 2.0,
+                    "get_datetime": when
+                }
+                for index in range(containers)
+            ]
+        })
+    return _make_payload
+
+@pytest.fixture
+def client(engine):
+    """API 테스트 클라이언트 (startup 이벤트의 백그라운드 작업은 시작하지 않음)"""
+    from fastapi.testclient import TestClient
+    import main
+    return TestClient(main.app)
@@ -5,17 +5,105 @@ Database 패키지 - 데이터베이스 연결과 관련된 기능들을 관리
 from .database import (
     engine,
     SessionLocal,
+    async_engine,
+    AsyncSessionLocal,
+    ASYNC_MODE,
+    PARTITIONING_ENABLED,
     create_tables,
     get_db,
+    get_async_db,
+    get_session,
+    run_db,
+    run_db_task,
+    rollback_db,
+    ping_database,
+    warm_up_pool,
+    setup_partitioning,
     startup_db,
     shutdown_db
 )
+from .series import SERIES_FIELDS, resolve_series_ids, series_id_cache, get_series_cache_stats
+from .crud import upsert_host, save_resource_data, save_resource_batch
+from .migrations import ManualMigrationRequired, run_migrations
+from .rollups import (
+    RESOLUTIONS, WATERMARK_NAME, HOST_WATERMARK_NAME, choose_resolution,
+    get_max_container_id, get_max_host_metric_id, process_rollups, process_host_rollups,
+    get_watermark, get_container_rollups, get_host_rollups
+)
+from .partitions import get_partitions, maintain_partitions
+from .aggregates import AGGREGATE_METRICS, AGGREGATE_FUNCTIONS, GROUP_FIELDS, get_top_containers, get_usage_by_group
+from .retention import (
+    delete_expired_chunk, delete_expired_host_metrics_chunk, get_host_ids, get_host_retention_boundary, delete_host_excess_chunk,
+    get_host_metrics_retention_boundary, delete_host_metrics_excess_chunk
+)
+from .queries import (
+    get_all_hosts, get_host, get_latest_host_metrics, get_latest_host_metric, get_host_metrics_page,
+    get_latest_container_rows, get_containers_page, iter_container_chunks, EXPORT_COLUMNS,
+    HOST_COLUMNS, HOST_METRIC_COLUMNS
+)
 
 __all__ = [
     "engine", 
     "SessionLocal",
+    "async_engine",
+    "AsyncSessionLocal",
+    "ASYNC_MODE",
+    "PARTITIONING_ENABLED",
     "create_tables",
     "get_db",
+    "get_async_db",
+    "get_session",
+    "run_db",
+    "run_db_task",
+    "rollback_db",
+    "ping_database",
+    "warm_up_pool",
+    "setup_partitioning",
     "startup_db",
-    "shutdown_db"
+    "shutdown_db",
+    "ManualMigrationRequired",
+    "run_migrations",
+    "RESOLUTIONS",
+    "choose_resolution",
+    "get_max_container_id",
+    "process_rollups",
+    "WATERMARK_NAME",
+    "HOST_WATERMARK_NAME",
+    "get_max_host_metric_id",
+    "process_host_rollups",
+    "get_watermark",
+    "get_container_rollups",
+    "get_host_rollups",
+    "get_partitions",
+    "maintain_partitions",
+    "AGGREGATE_METRICS",
+    "AGGREGATE_FUNCTIONS",
+    "GROUP_FIELDS",
+    "get_top_containers",
+    "get_usage_by_group",
+    "delete_expired_chunk",
+    "delete_expired_host_metrics_chunk",
+    "get_host_ids",
+    "get_host_retention_boundary",
+    "get_host_metrics_retention_boundary",
+    "delete_host_metrics_excess_chunk",
+    "delete_host_excess_chunk",
+    "SERIES_FIELDS",
+    "resolve_series_ids",
+    "series_id_cache",
+    "get_series_cache_stats",
+    "upsert_host",
+    "save_resource_data",
+    "save_resource_batch",
+    "get_all_hosts",
+    "get_host",
+    "get_latest_host_metrics",
+    "get_latest_host_metric",
+    "get_host_metrics_page",
+    "get_latest_container_rows",
+    "get_containers_page",
+    "iter_container_chunks",
+    "EXPORT_COLUMNS",
+    "HOST_COLUMNS",
+    "HOST_METRIC_COLUMNS"
 ] 
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+데이터베이스 관리 명령
+
+사용법:
+    python -m database status    # 스키마 마이그레이션 적용 현황 조회
+    python -m database upgrade   # 테이블 생성 및 미적용 마이그레이션 적용
+    python -m database partition # containers 일 단위 파티셔닝 변환 및 파티션 유지보수 (MySQL)
+"""
+
+import sys
+from typing import List
+from .database import engine, SessionLocal, create_tables, setup_partitioning
+from .migrations import MIGRATIONS, get_applied_versions, run_migrations
+from .partitions import maintain_partitions
+from config.config import config
+from logger import logger
+
+def main(argv: List[str]) -> int:
+    command = argv[1] if len(argv) > 1 else "status"
+    
+    if command == "upgrade":
+        create_tables()
+        applied = run_migrations(engine)
+        logger.info(f"적용된 마이그레이션: {applied if applied else '없음 (최신 상태)'}")
+        return 0
+    
+    if command == "status":
+        applied = get_applied_versions(engine)
+        for version, description, *_ in MIGRATIONS:
+            state = f"적용됨 ({applied[version]})" if version in applied else "미적용"
+            logger.info(f"{version} - {description}: {state}")
+        return 0
+    
+    if command == "partition":
+        create_tables()
+        setup_partitioning()
+        with SessionLocal() as db:
+            result = maintain_partitions(
+                db,
+                future_days=config.get_database_partition_future_days(),
+                retention_days=config.get_monitoring_data_retention_days()
+            )
+        logger.info(f"생성한 파티션: {result['created']}, 삭제한 파티션: {result['dropped']}")
+        return 0
+    
+    logger.error(f"알 수 없는 명령입니다: {command} (status, upgrade 또는 partition)")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
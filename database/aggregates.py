@@ -0,0 +1,118 @@
+"""
+집계 조회 - 조회 구간의 컨테이너 기록을 DB에서 GROUP BY로 집계합니다.
+
+- 상위 N개 컨테이너: 컨테이너별 평균/최대 사용량 순위
+- 그룹별 사용량: cluster_name/node_name/engine_type별 컨테이너 평균 사용량의 합계/평균
+
+두 쿼리 모두 get_datetime 범위 조건으로 (get_datetime, id) 인덱스 range scan 후 집계하며,
+필터 조건은 컨테이너 기록 조회와 같은 방식(container_series에서 series ID를 먼저 찾음)으로 적용합니다.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from sqlalchemy import Integer, cast, func, select
+from sqlalchemy.orm import Session
+from model import Container, ContainerSeries
+from .queries import _container_conditions
+
+# 집계 대상 지표와 집계 함수
+AGGREGATE_METRICS = ("cpu_percentage", "memory_usage", "memory_percentage")
+AGGREGATE_FUNCTIONS = {"avg": func.avg, "max": func.max}
+# 그룹별 사용량 조회에서 묶을 수 있는 컨테이너 식별 필드
+GROUP_FIELDS = ("cluster_name", "node_name", "engine_type")
+
+# 컨테이너 하나를 구분하는 컬럼 (status가 바뀌어도 같은 컨테이너로 집계)
+_CONTAINER_KEY = (
+    Container.host_id,
+    ContainerSeries.engine_type,
+    ContainerSeries.cluster_name,
+    ContainerSeries.node_name,
+    ContainerSeries.container_name
+)
+
+def _select_window(*columns, since: datetime, until: Optional[datetime], **filters):
+    return (
+        select(*columns)
+        .join_from(Container, ContainerSeries, Container.series_id == ContainerSeries.id)
+        .where(*_container_conditions(since=since, until=until, **filters))
+    )
+
+def get_top_containers(
+    db: Session,
+    metric: str,
+    function: str,
+    since: datetime,
+    limit: int,
+    until: Optional[datetime] = None,
+    **filters
+) -> List[Dict[str, Any]]:
+    """
+    조회 구간에서 metric의 평균(avg) 또는 최대(max) 값이 큰 순서로 컨테이너 limit개를 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        metric: AGGREGATE_METRICS 중 하나
+        function: "avg" 또는 "max"
+        since: 조회 시작 시각 (이상)
+        limit: 최대 컨테이너 수
+        until: 조회 종료 시각 (미만, None이면 제한 없음)
+        **filters: host_id, cluster_name, node_name, engine_type
+    """
+    value = AGGREGATE_FUNCTIONS[function](getattr(Container, metric)).label("value")
+    stmt = (
+        _select_window(
+            *_CONTAINER_KEY,
+            value,
+            func.count().label("sample_count"),
+            func.max(Container.get_datetime).label("last_seen"),
+            since=since, until=until, **filters
+        )
+        .group_by(*_CONTAINER_KEY)
+        .order_by(value.desc(), Container.host_id, ContainerSeries.container_name)
+        .limit(limit)
+    )
+    return [dict(row._mapping) for row in db.execute(stmt)]
+
+def get_usage_by_group(
+    db: Session,
+    group_by: str,
+    since: datetime,
+    until: Optional[datetime] = None,
+    **filters
+) -> List[Dict[str, Any]]:
+    """
+    조회 구간의 컨테이너별 평균 사용량을 구한 뒤 group_by 필드별로 합계(sum)와 컨테이너 평균(avg)을 집계합니다.
+
+    합계는 그룹에 속한 컨테이너들이 구간 동안 평균적으로 함께 사용한 양입니다.
+    (보고 횟수가 많은 컨테이너가 합계에 더 크게 반영되지 않도록 컨테이너별 평균을 먼저 계산)
+
+    Args:
+        db: 데이터베이스 세션
+        group_by: GROUP_FIELDS 중 하나
+        since: 조회 시작 시각 (이상)
+        until: 조회 종료 시각 (미만, None이면 제한 없음)
+        **filters: host_id, cluster_name, node_name, engine_type
+    """
+    per_container = (
+        _select_window(
+            *_CONTAINER_KEY,
+            func.count().label("sample_count"),
+            *(func.avg(getattr(Container, metric)).label(metric) for metric in AGGREGATE_METRICS),
+            since=since, until=until, **filters
+        )
+        .group_by(*_CONTAINER_KEY)
+        .subquery()
+    )
+    group = per_container.c[group_by]
+    columns = [
+        group.label("group"),
+        func.count().label("container_count"),
+        # MySQL은 정수 SUM을 DECIMAL로 반환하므로 정수로 변환
+        cast(func.sum(per_container.c.sample_count), Integer).label("sample_count")
+    ]
+    for metric in AGGREGATE_METRICS:
+        columns.append(func.sum(per_container.c[metric]).label(f"{metric}_sum"))
+        columns.append(func.avg(per_container.c[metric]).label(f"{metric}_avg"))
+
+    stmt = select(*columns).group_by(group).order_by(group)
+    return [dict(row._mapping) for row in db.execute(stmt)]
@@ -0,0 +1,235 @@
+"""
+데이터베이스 쓰기 작업 - 자원 사용량 데이터 저장 로직을 관리합니다.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError, SQLAlchemyError
+from sqlalchemy.orm import Session
+from model import Host, HostMetric, Container, SystemResourceData
+from .series import resolve_series_ids, series_id_cache, series_key
+from utils.metrics import INGEST_HOST_ROWS, INGEST_CONTAINER_ROWS
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# host_name -> 호스트 ID (커밋이 끝난 호스트만 기록하며, 호스트는 삭제되지 않으므로 만료하지 않음)
+_host_id_cache: Dict[str, int] = {}
+
+def _host_values(host_data) -> Dict[str, Any]:
+    return {
+        "host_name": host_data.host_name,
+        "cpu_percentage": host_data.cpu_percentage,
+        "cpu_cores": host_data.cpu_cores,
+        "cpu_threads": host_data.cpu_threads,
+        "memory_usage": host_data.memory_usage,
+        "memory_percentage": host_data.memory_percentage,
+        "get_datetime": host_data.get_datetime
+    }
+
+def _host_metric_row(host_data, host_id: int) -> Dict[str, Any]:
+    return {
+        "host_id": host_id,
+        "cpu_percentage": host_data.cpu_percentage,
+        "cpu_cores": host_data.cpu_cores,
+        "cpu_threads": host_data.cpu_threads,
+        "memory_usage": host_data.memory_usage,
+        "memory_percentage": host_data.memory_percentage,
+        "get_datetime": host_data.get_datetime
+    }
+
+def _container_rows(containers_data, host_id: int, series_ids: Dict[tuple, int]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "series_id": series_ids[series_key(container_data)],
+            "cpu_percentage": container_data.cpu_percentage,
+            "memory_usage": container_data.memory_usage,
+            "memory_percentage": container_data.memory_percentage,
+            "get_datetime": container_data.get_datetime,
+            "host_id": host_id
+        }
+        for container_data in containers_data
+    ]
+
+def upsert_host(db: Session, values: Dict[str, Any]) -> int:
+    """
+    호스트 행을 한 번의 문장으로 INSERT 또는 UPDATE하고 호스트 ID를 반환합니다.
+
+    - MySQL: INSERT ... ON DUPLICATE KEY UPDATE (id=LAST_INSERT_ID(id)로 기존 ID 반환)
+    - SQLite: INSERT ... ON CONFLICT DO UPDATE ... RETURNING id
+    - 그 외: SELECT 후 INSERT/UPDATE
+    """
+    hosts = Host.__table__
+    update_values = {key: value for key, value in values.items() if key != "host_name"}
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        stmt = mysql_insert(hosts).values(**values)
+        stmt = stmt.on_duplicate_key_update(
+            id=func.last_insert_id(hosts.c.id),
+            **{key: stmt.inserted[key] for key in update_values}
+        )
+        return db.execute(stmt).lastrowid
+
+    if dialect == "sqlite":
+        stmt = sqlite_insert(hosts).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[hosts.c.host_name],
+            set_={key: stmt.excluded[key] for key in update_values}
+        ).returning(hosts.c.id)
+        return db.execute(stmt).scalar_one()
+
+    host_id = db.execute(select(hosts.c.id).where(hosts.c.host_name == values["host_name"])).scalar()
+    if host_id is None:
+        return db.execute(insert(hosts).values(**values)).inserted_primary_key[0]
+    db.execute(update(hosts).where(hosts.c.id == host_id).values(**update_values))
+    return host_id
+
+def _resolve_host_ids(db: Session, payloads: Sequence[SystemResourceData]) -> Dict[str, int]:
+    """
+    보고에 포함된 호스트들의 host_name -> id 매핑을 반환합니다.
+
+    이미 알고 있는 호스트는 메모리 캐시에서 찾고, 모르는 호스트만 한 번에 조회합니다.
+    처음 보는 호스트는 새로 등록하며, 기존 호스트 행은 갱신하지 않습니다.
+    (자원 사용량은 host_metrics에 추가되므로 보고마다 hosts 행을 UPDATE하지 않음)
+    """
+    names = {payload.host.host_name for payload in payloads}
+    host_ids = {name: _host_id_cache[name] for name in names if name in _host_id_cache}
+
+    missing = [name for name in names if name not in host_ids]
+    if missing:
+        host_ids.update(db.execute(
+            select(Host.host_name, Host.id).where(Host.host_name.in_(missing))
+        ).all())
+
+    for payload in payloads:
+        name = payload.host.host_name
+        if name not in host_ids:
+            # 동시에 같은 신규 호스트가 들어와도 충돌하지 않도록 upsert 사용
+            host_ids[name] = upsert_host(db, _host_values(payload.host))
+
+    return host_ids
+
+def _write_batch(db: Session, payloads: Sequence[SystemResourceData]) -> Tuple[Dict[str, int], Dict[tuple, int]]:
+    """
+    보고들을 현재 트랜잭션에 기록하고 (host_name -> 호스트 ID, series 키 -> series ID) 매핑을 반환합니다.
+
+    반환된 매핑은 커밋이 끝난 뒤 _remember_ids로 캐시에 기록합니다.
+    """
+    host_ids = _resolve_host_ids(db, payloads)
+    series_ids = resolve_series_ids(
+        db, (series_key(container_data) for payload in payloads for container_data in payload.containers)
+    )
+
+    host_metric_rows = []
+    container_rows = []
+    for payload in payloads:
+        host_id = host_ids[payload.host.host_name]
+        host_metric_rows.append(_host_metric_row(payload.host, host_id))
+        container_rows.extend(_container_rows(payload.containers, host_id, series_ids))
+
+    db.execute(insert(HostMetric.__table__), host_metric_rows)
+    if container_rows:
+        # 모든 컨테이너 행을 multi-row INSERT로 한 번에 저장
+        db.execute(insert(Container.__table__), container_rows)
+    return host_ids, series_ids
+
+def _remember_ids(host_ids: Dict[str, int], series_ids: Dict[tuple, int]) -> None:
+    _host_id_cache.update(host_ids)
+    series_id_cache.put_many(series_ids)
+
+def _count_ingested(payloads: Sequence[SystemResourceData]) -> None:
+    """커밋된 보고의 저장 행 수를 지표에 반영합니다."""
+    INGEST_HOST_ROWS.inc(len(payloads))
+    INGEST_CONTAINER_ROWS.inc(sum(len(payload.containers) for payload in payloads))
+
+def save_resource_data(db: Session, resource_data: SystemResourceData) -> Tuple[int, int]:
+    """
+    단일 Agent 보고를 하나의 트랜잭션으로 저장합니다.
+
+    호스트/series ID 확인(캐시) + host_metrics INSERT 1회 + 컨테이너 executemany INSERT 1회 + COMMIT으로 처리하며
+    ORM unit-of-work를 거치지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        resource_data: 검증된 자원 사용량 데이터
+
+    Returns:
+        Tuple[int, int]: (호스트 ID, 저장된 컨테이너 수)
+    """
+    host_ids, series_ids = _write_batch(db, [resource_data])
+    db.commit()
+    _remember_ids(host_ids, series_ids)
+    _count_ingested([resource_data])
+    return host_ids[resource_data.host.host_name], len(resource_data.containers)
+
+def _error_message(exception: SQLAlchemyError) -> str:
+    return str(getattr(exception, "orig", None) or exception)
+
+def _is_transient_error(exception: SQLAlchemyError) -> bool:
+    """
+    연결 끊김, DB 중단, 잠금 대기 시간 초과 등 데이터와 무관하게 저장 전체가 실패한 오류인지 확인합니다.
+
+    이런 오류는 항목별로 다시 저장해도 모두 실패하므로 호출자가 배치 전체를 재시도해야 합니다.
+    """
+    if isinstance(exception, (OperationalError, InterfaceError)):
+        return True
+    return isinstance(exception, DBAPIError) and exception.connection_invalidated
+
+def save_resource_batch(db: Session, payloads: Sequence[SystemResourceData]) -> List[Dict[str, Any]]:
+    """
+    여러 자원 사용량 스냅샷을 하나의 트랜잭션으로 저장합니다.
+
+    데이터/무결성 오류로 일괄 저장이 실패하면 롤백 후 항목별 SAVEPOINT로 다시 저장하여
+    문제가 있는 스냅샷만 실패로 처리합니다.
+    연결/DB 중단 오류(_is_transient_error)는 항목별 저장도 모두 실패하므로 그대로 예외를 발생시킵니다.
+
+    Args:
+        db: 데이터베이스 세션
+        payloads: 검증된 자원 사용량 데이터 리스트
+
+    Returns:
+        List[dict]: 입력 순서대로 {"host_id", "containers_count"} 또는 {"error"}
+
+    Raises:
+        SQLAlchemyError: 연결/DB 중단 오류로 저장하지 못한 경우 (아무것도 저장되지 않음)
+    """
+    if not payloads:
+        return []
+
+    try:
+        host_ids, series_ids = _write_batch(db, payloads)
+        db.commit()
+        _remember_ids(host_ids, series_ids)
+        _count_ingested(payloads)
+        return [
+            {"host_id": host_ids[payload.host.host_name], "containers_count": len(payload.containers)}
+            for payload in payloads
+        ]
+    except SQLAlchemyError as e:
+        db.rollback()
+        if _is_transient_error(e):
+            raise
+        # 캐시된 ID가 원인일 수 있으므로 항목별 저장은 DB에서 다시 조회
+        _host_id_cache.clear()
+        series_id_cache.clear()
+        logger.warning(f"배치 일괄 저장 실패, 항목별 저장으로 재시도합니다: {_error_message(e)}")
+
+    results = []
+    saved = []
+    for payload in payloads:
+        try:
+            with db.begin_nested():
+                host_ids, _ = _write_batch(db, [payload])
+            results.append({"host_id": host_ids[payload.host.host_name], "containers_count": len(payload.containers)})
+            saved.append(payload)
+        except SQLAlchemyError as e:
+            if _is_transient_error(e):
+                db.rollback()
+                raise
+            results.append({"error": _error_message(e)})
+    db.commit()
+    _count_ingested(saved)
+    return results
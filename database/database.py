@@ -1,7 +1,15 @@
-from sqlalchemy import create_engine
+import asyncio
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
 from model import Base
+from .migrations import run_migrations
+from .partitions import is_partitioning_supported, enable_partitioning
+from .instrumentation import instrument_engine, instrument_sessions, instrument_slow_queries
+from utils.metrics import METRICS_ENABLED
+from utils.timing import server_timing
 from config.config import config
 from logger import logger
 
@@ -23,9 +31,86 @@ engine = create_engine(
     pool_recycle=config.get_database_pool_recycle()
 )
 
+# DB 상태 확인 제한 시간 ([database] health_check_timeout_seconds)
+HEALTH_CHECK_TIMEOUT = max(1, config.get_database_health_check_timeout_seconds())
+
+def health_connect_args(url: str, timeout_seconds: int) -> dict:
+    """
+    상태 확인 연결의 드라이버 인자를 반환합니다.
+    
+    DB가 응답하지 않을 때 제한 시간 안에 실패하도록 연결/읽기/쓰기 제한 시간을 지정합니다.
+    (지정하지 않으면 상태 확인이 시간 초과로 끝나도 스레드풀의 연결 시도는 OS TCP 제한 시간까지 남아 있음)
+    """
+    args = {"check_same_thread": False} if "sqlite" in url else {}
+    backend = make_url(url).get_backend_name()
+    if backend == "mysql":
+        args.update(connect_timeout=timeout_seconds, read_timeout=timeout_seconds, write_timeout=timeout_seconds)
+    elif backend == "sqlite":
+        args["timeout"] = timeout_seconds
+    return args
+
+# DB 상태 확인 전용 엔진 (요청/수집용 연결 풀과 슬롯을 다투지 않도록 연결 1개만 따로 사용)
+# 이전 확인이 연결을 반환하지 못했으면 기본 30초가 아닌 제한 시간만큼만 연결을 기다림
+health_engine = create_engine(
+    DATABASE_URL,
+    connect_args=health_connect_args(DATABASE_URL, HEALTH_CHECK_TIMEOUT),
+    pool_size=1,
+    max_overflow=0,
+    pool_timeout=HEALTH_CHECK_TIMEOUT,
+    pool_pre_ping=False,
+    pool_recycle=config.get_database_pool_recycle()
+)
+
 # 세션 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# async 모드 설정 ([database] mode = async)
+ASYNC_MODE = config.get_database_mode() == "async"
+
+def to_async_url(url: str) -> str:
+    """동기 DATABASE_URL을 async 드라이버 URL로 변환합니다."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    if backend == "mysql":
+        driver = config.get_database_async_mysql_driver()
+        return parsed.set(drivername=f"mysql+{driver}").render_as_string(hide_password=False)
+    raise ValueError(f"async 모드를 지원하지 않는 데이터베이스입니다: {backend}")
+
+async_engine = None
+AsyncSessionLocal = None
+
+if ASYNC_MODE:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    
+    async_engine = create_async_engine(
+        to_async_url(DATABASE_URL),
+        echo=config.get_database_echo(),
+        pool_size=config.get_database_pool_size(),
+        max_overflow=config.get_database_max_overflow(),
+        pool_pre_ping=config.get_database_pool_pre_ping(),
+        pool_recycle=config.get_database_pool_recycle()
+    )
+    # run_sync 이후에도 로드된 속성을 사용할 수 있도록 commit 시 만료하지 않음
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# 연결 풀/COMMIT 지표 수집 ([metrics] enabled)
+if METRICS_ENABLED:
+    instrument_engine(engine, "sync")
+    if async_engine is not None:
+        instrument_engine(async_engine.sync_engine, "async")
+    instrument_sessions()
+
+# 느린 쿼리 로그 ([metrics] slow_query_log_enabled)
+if config.get_metrics_slow_query_log_enabled():
+    instrument_slow_queries(engine, config.get_metrics_slow_query_threshold_ms())
+    if async_engine is not None:
+        instrument_slow_queries(async_engine.sync_engine, config.get_metrics_slow_query_threshold_ms())
+
+# containers 일 단위 파티셔닝 설정 ([database] partitioning = daily)
+PARTITIONING_ENABLED = config.get_database_partitioning() == "daily"
+
 # 테이블 생성
 def create_tables():
     try:
@@ -44,11 +129,118 @@ def get_db():
     finally:
         db.close()
 
-# 데이터베이스 초기화 (테이블 생성만)
+# 비동기 데이터베이스 세션 dependency
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 설정된 모드에 맞는 세션 dependency
+get_session = get_async_db if ASYNC_MODE else get_db
+
+async def run_db(db, fn, *args, **kwargs):
+    """
+    동기 Session을 받는 DB 작업 함수를 이벤트 루프를 막지 않고 실행합니다.
+    
+    - async 모드: AsyncSession.run_sync로 async 드라이버 위에서 실행
+    - sync 모드: 스레드풀에서 실행
+    
+    Args:
+        db: get_session이 제공한 Session 또는 AsyncSession
+        fn: 첫 번째 인자로 동기 Session을 받는 함수
+    """
+    with server_timing("db"):
+        if ASYNC_MODE:
+            return await db.run_sync(fn, *args, **kwargs)
+        return await run_in_threadpool(fn, db, *args, **kwargs)
+
+async def run_db_task(fn, *args, **kwargs):
+    """
+    요청 컨텍스트 밖(백그라운드 작업 등)에서 새 세션을 열어 DB 작업 함수를 실행합니다.
+    
+    Args:
+        fn: 첫 번째 인자로 동기 Session을 받는 함수
+    """
+    if ASYNC_MODE:
+        async with AsyncSessionLocal() as db:
+            return await db.run_sync(fn, *args, **kwargs)
+    
+    def _run():
+        with SessionLocal() as db:
+            return fn(db, *args, **kwargs)
+    
+    return await run_in_threadpool(_run)
+
+async def rollback_db(db):
+    """세션 종류에 맞게 트랜잭션을 롤백합니다."""
+    if ASYNC_MODE:
+        await db.rollback()
+    else:
+        await run_in_threadpool(db.rollback)
+
+def ping_database() -> None:
+    """상태 확인 전용 연결로 SELECT 1을 실행합니다. (실패 시 예외 발생)"""
+    with health_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+async def warm_up_pool() -> int:
+    """
+    요청/수집에 사용하는 엔진의 연결 풀에 pool_size개 연결을 동시에 열어 두고, 연 연결 수를 반환합니다.
+    
+    연결을 모두 체크아웃한 상태로 만든 뒤 반환하므로 풀에 pool_size개가 유휴 연결로 남습니다.
+    첫 Agent 보고가 TCP/TLS 연결 생성 비용을 부담하지 않도록 서버 시작 시 실행합니다.
+    """
+    target = async_engine.sync_engine if ASYNC_MODE else engine
+    size = target.pool.size() if hasattr(target.pool, "size") else 0
+    if size <= 0:
+        return 0
+    
+    if ASYNC_MODE:
+        results = await asyncio.gather(*(async_engine.connect().start() for _ in range(size)), return_exceptions=True)
+        connections = [result for result in results if not isinstance(result, BaseException)]
+        for connection in connections:
+            await connection.close()
+    else:
+        results = await asyncio.gather(*(run_in_threadpool(engine.connect) for _ in range(size)), return_exceptions=True)
+        connections = [result for result in results if not isinstance(result, BaseException)]
+        for connection in connections:
+            await run_in_threadpool(connection.close)
+    
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        logger.warning(f"연결 풀 미리 열기 중 {len(errors)}개 실패: {str(errors[0])}")
+    return len(connections)
+
+def setup_partitioning() -> bool:
+    """
+    containers 테이블을 일 단위 파티션 테이블로 변환합니다. (이미 변환되어 있으면 아무것도 하지 않음)
+    
+    파티셔닝을 지원하지 않는 데이터베이스에서는 일반 테이블을 그대로 사용합니다.
+    """
+    with engine.begin() as connection:
+        if not is_partitioning_supported(connection):
+            logger.warning(f"{connection.dialect.name}는 파티셔닝을 지원하지 않아 일반 테이블을 사용합니다")
+            return False
+        return enable_partitioning(
+            connection,
+            future_days=config.get_database_partition_future_days(),
+            retention_days=config.get_monitoring_data_retention_days()
+        )
+
+# 데이터베이스 초기화 (테이블 생성 및 스키마 마이그레이션)
 async def startup_db():
     logger.info("데이터베이스 초기화 시작")
     try:
         create_tables()
+        if config.get_database_auto_migrate():
+            # 테이블 전체를 갱신하는 마이그레이션은 python -m database upgrade로만 적용
+            applied = run_migrations(engine, allow_manual=False)
+            if applied:
+                logger.info(f"스키마 마이그레이션 적용 완료: {applied}")
+            if PARTITIONING_ENABLED:
+                setup_partitioning()
+        if config.get_database_pool_warmup():
+            opened = await warm_up_pool()
+            logger.info(f"연결 풀 미리 열기 완료: {opened}개")
         logger.info("데이터베이스 초기화 성공")
     except Exception as e:
         logger.error(f"데이터베이스 초기화 실패: {str(e)}")
@@ -59,6 +251,9 @@ async def shutdown_db():
     logger.info("데이터베이스 엔진 정리 시작")
     try:
         engine.dispose()
+        health_engine.dispose()
+        if async_engine is not None:
+            await async_engine.dispose()
         logger.info("데이터베이스 엔진 정리 완료")
     except Exception as e:
         logger.error(f"데이터베이스 엔진 정리 중 오류: {str(e)}") 
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+데이터베이스 지표 수집 - 연결 풀/세션 이벤트로 체크아웃 대기 시간, 사용 중 연결 수, COMMIT 지연 시간을 기록합니다.
+
+지표는 /metrics(Prometheus 텍스트 형식)로 노출됩니다. 풀 크기/overflow 게이지는 조회 시점에만 읽습니다.
+느린 쿼리 로그(before/after_cursor_execute)도 이 모듈에서 연결합니다.
+"""
+
+import threading
+import time
+from typing import Dict
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool
+from utils.metrics import registry, DB_COMMIT_DURATION, DB_POOL_CHECKOUT_WAIT, DB_POOL_CHECKOUTS
+from logger import get_logger
+
+slow_query_logger = get_logger("database.slow_query")
+
+# 느린 쿼리 로그에 남길 SQL 최대 길이
+MAX_STATEMENT_LENGTH = 2000
+
+# 엔진 이름("sync", "async") -> 연결 풀
+_pools: Dict[str, Pool] = {}
+# 엔진 이름 -> 체크아웃되어 사용 중인 연결 수 (checkout/checkin 이벤트로 갱신)
+_checked_out: Dict[str, int] = {}
+_lock = threading.Lock()
+
+def _pool_gauge(method: str):
+    def collect():
+        return [((name,), getattr(pool, method)()) for name, pool in _pools.items() if hasattr(pool, method)]
+    return collect
+
+registry.gauge(
+    "db_pool_checked_out_connections", "체크아웃되어 사용 중인 연결 수",
+    lambda: [((name,), count) for name, count in _checked_out.items()], labels=("engine",)
+)
+registry.gauge("db_pool_size", "연결 풀 크기 (pool_size)", _pool_gauge("size"), labels=("engine",))
+registry.gauge("db_pool_overflow", "pool_size를 넘어 추가로 연 연결 수 (음수면 여유 연결 수)", _pool_gauge("overflow"), labels=("engine",))
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    엔진의 연결 풀에 지표 수집을 연결합니다.
+
+    - checkout/checkin 이벤트: 사용 중 연결 수, 체크아웃 횟수
+    - Pool.connect 호출 시간: 풀이 가득 차 연결 반환을 기다린 시간 (새 연결 생성 시간 포함)
+    """
+    pool = engine.pool
+    labels = (name,)
+    _pools[name] = pool
+    _checked_out[name] = 0
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKOUTS.inc(labels=labels)
+        with _lock:
+            _checked_out[name] += 1
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        with _lock:
+            _checked_out[name] -= 1
+
+    # 체크아웃 시작 시점 이벤트가 없으므로 Engine이 호출하는 Pool.connect의 소요 시간을 측정
+    connect = pool.connect
+
+    def timed_connect():
+        start = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start, labels)
+
+    pool.connect = timed_connect
+
+def _on_before_commit(session: Session) -> None:
+    session.info["commit_started"] = time.perf_counter()
+
+def _on_after_commit(session: Session) -> None:
+    started = session.info.pop("commit_started", None)
+    if started is not None:
+        DB_COMMIT_DURATION.observe(time.perf_counter() - started)
+
+def instrument_sessions() -> None:
+    """모든 세션(AsyncSession 내부 세션 포함)의 COMMIT 소요 시간을 기록합니다."""
+    if not event.contains(Session, "before_commit", _on_before_commit):
+        event.listen(Session, "before_commit", _on_before_commit)
+        event.listen(Session, "after_commit", _on_after_commit)
+
+def _redact_parameters(parameters, executemany: bool) -> str:
+    """파라미터 값은 기록하지 않고 개수만 남깁니다."""
+    if executemany:
+        return f"<{len(parameters)}행 파라미터 생략>"
+    if not parameters:
+        return "<없음>"
+    return f"<{len(parameters)}개 파라미터 생략>"
+
+def instrument_slow_queries(engine: Engine, threshold_ms: int) -> None:
+    """
+    실행 시간이 threshold_ms 이상인 SQL 문을 WARNING으로 기록합니다.
+
+    SQL 문은 바인드 파라미터 자리표시자 상태로 남기고, 파라미터 값은 개수만 기록합니다.
+    """
+    threshold = threshold_ms / 1000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context.query_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(connection, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "query_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        if elapsed >= threshold:
+            slow_query_logger.warning(
+                "느린 쿼리 (%.1fms): %s / 파라미터: %s",
+                elapsed * 1000,
+                " ".join(statement.split())[:MAX_STATEMENT_LENGTH],
+                _redact_parameters(parameters, executemany)
+            )
@@ -0,0 +1,279 @@
+"""
+스키마 마이그레이션 - 운영 중인 데이터베이스에 인덱스 추가 등 스키마 변경을 적용합니다.
+
+create_all은 이미 존재하는 테이블을 변경하지 않으므로, 기존 테이블에 대한 변경은
+버전별 마이그레이션으로 등록하고 schema_migrations 테이블에 적용 이력을 기록합니다.
+
+사용법:
+    python -m database status    # 적용 현황 조회
+    python -m database upgrade   # 미적용 마이그레이션 적용
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+from model import Base, Container, ContainerSeries
+from .partitions import get_partitions
+from .series import SERIES_FIELDS, series_hash
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# 적용 이력 테이블 (모델 메타데이터와 분리하여 관리)
+_migration_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _migration_metadata,
+    Column("version", String(50), primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False)
+)
+
+def create_missing_indexes(connection: Connection, table_name: str) -> List[str]:
+    """
+    모델에 정의된 인덱스 중 실제 테이블에 없는 인덱스를 생성합니다.
+
+    MySQL(InnoDB)의 CREATE INDEX는 기본적으로 online DDL로 수행되어
+    인덱스 생성 중에도 INSERT가 차단되지 않습니다.
+
+    Returns:
+        List[str]: 새로 생성한 인덱스 이름
+    """
+    table = Base.metadata.tables[table_name]
+    inspector = inspect(connection)
+    existing = {index["name"] for index in inspector.get_indexes(table_name)}
+    columns = {column["name"] for column in inspector.get_columns(table_name)}
+    created = []
+    for index in sorted(table.indexes, key=lambda index: index.name):
+        # 아직 없는 컬럼의 인덱스는 해당 컬럼을 추가하는 이후 마이그레이션에서 생성
+        if index.name in existing or not {column.name for column in index.columns} <= columns:
+            continue
+        logger.info(f"인덱스 생성 중: {table_name}.{index.name}")
+        index.create(connection)
+        created.append(index.name)
+    return created
+
+def _0001_container_time_series_indexes(connection: Connection) -> None:
+    create_missing_indexes(connection, "containers")
+
+# container_series로 옮겨진 containers의 식별 컬럼과 해당 컬럼의 인덱스
+_LEGACY_CONTAINER_INDEXES = ("ix_containers_container_name_get_datetime", "ix_containers_cluster_node_get_datetime")
+
+# series_id를 채울 때 한 번에 갱신/커밋하는 containers id 구간 크기
+_BACKFILL_BATCH_ROWS = 10000
+
+def _container_columns(connection: Connection) -> Dict[str, Dict[str, Any]]:
+    return {column["name"]: column for column in inspect(connection).get_columns("containers")}
+
+def _0002_requires_upgrade(connection: Connection) -> bool:
+    """containers에 식별 컬럼이 남아 있으면(테이블 전체를 갱신해야 하면) True"""
+    return any(field in _container_columns(connection) for field in SERIES_FIELDS)
+
+def _register_legacy_series(connection: Connection) -> None:
+    """series_id가 비어 있는 기록의 식별 필드 조합 중 아직 등록되지 않은 조합을 container_series에 등록합니다."""
+    field_list = ", ".join(SERIES_FIELDS)
+    keys = connection.execute(text(f"SELECT DISTINCT {field_list} FROM containers WHERE series_id IS NULL")).all()
+    known = set(connection.execute(select(ContainerSeries.series_hash)).scalars())
+    rows = []
+    for key in keys:
+        key_hash = series_hash(tuple(key))
+        if key_hash not in known:
+            known.add(key_hash)
+            rows.append({"series_hash": key_hash, **dict(zip(SERIES_FIELDS, key))})
+    if rows:
+        connection.execute(insert(ContainerSeries.__table__), rows)
+    connection.commit()
+    logger.info(f"container_series 등록 완료: {len(rows)}개")
+
+def _backfill_series_ids(connection: Connection) -> None:
+    """series_id가 비어 있는 기록을 id 구간별로 채우고 구간마다 커밋합니다."""
+    min_id, max_id = connection.execute(text("SELECT MIN(id), MAX(id) FROM containers WHERE series_id IS NULL")).one()
+    if min_id is None:
+        return
+    match = " AND ".join(f"s.{field} = containers.{field}" for field in SERIES_FIELDS)
+    stmt = text(
+        f"UPDATE containers SET series_id = (SELECT s.id FROM container_series s WHERE {match}) "
+        f"WHERE id >= :lower AND id < :upper AND series_id IS NULL"
+    )
+    for lower in range(min_id, max_id + 1, _BACKFILL_BATCH_ROWS):
+        connection.execute(stmt, {"lower": lower, "upper": lower + _BACKFILL_BATCH_ROWS})
+        connection.commit()
+        logger.info(f"series_id 채우는 중: id {min(lower + _BACKFILL_BATCH_ROWS - 1, max_id)}/{max_id}")
+
+    remaining = connection.execute(text("SELECT COUNT(*) FROM containers WHERE series_id IS NULL")).scalar()
+    if remaining:
+        raise RuntimeError(f"series_id를 채우지 못한 containers 기록이 {remaining}개 있습니다.")
+
+def _has_series_foreign_key(connection: Connection) -> bool:
+    return any(
+        foreign_key["referred_table"] == "container_series" and foreign_key["constrained_columns"] == ["series_id"]
+        for foreign_key in inspect(connection).get_foreign_keys("containers")
+    )
+
+def _rebuild_sqlite_containers(connection: Connection) -> None:
+    """
+    SQLite는 컬럼 삭제/제약 변경을 ALTER로 할 수 없으므로 모델 정의대로 새 테이블을 만들어 기록을 복사합니다.
+    (SQLite DDL은 트랜잭션에 포함되므로 중간에 실패하면 전체가 롤백됨)
+    """
+    legacy_table = Table("containers", MetaData(), autoload_with=connection)
+    for index in list(legacy_table.indexes):
+        index.drop(connection)
+    connection.execute(text("ALTER TABLE containers RENAME TO containers_0002_legacy"))
+    Container.__table__.create(connection)
+    column_list = ", ".join(column.name for column in Container.__table__.columns)
+    connection.execute(text(f"INSERT INTO containers ({column_list}) SELECT {column_list} FROM containers_0002_legacy"))
+    connection.execute(text("DROP TABLE containers_0002_legacy"))
+    connection.commit()
+
+def _drop_legacy_columns(connection: Connection) -> None:
+    legacy_table = Table("containers", MetaData(), autoload_with=connection)
+    for index in list(legacy_table.indexes):
+        if index.name in _LEGACY_CONTAINER_INDEXES:
+            logger.info(f"인덱스 삭제 중: containers.{index.name}")
+            index.drop(connection)
+
+    if connection.dialect.name == "mysql":
+        # MySQL은 한 번의 ALTER로 모든 컬럼을 삭제하여 테이블 재작성을 1회로 줄임
+        connection.execute(text(
+            "ALTER TABLE containers " + ", ".join(f"DROP COLUMN {field}" for field in SERIES_FIELDS)
+        ))
+    else:
+        for field in SERIES_FIELDS:
+            connection.execute(text(f"ALTER TABLE containers DROP COLUMN {field}"))
+    connection.commit()
+
+def _enforce_series_id_constraints(connection: Connection) -> None:
+    """series_id를 모델과 같이 NOT NULL + container_series 외래키로 만듭니다. (이미 적용된 제약은 건너뜀)"""
+    if _container_columns(connection)["series_id"]["nullable"]:
+        if connection.dialect.name == "mysql":
+            connection.execute(text("ALTER TABLE containers MODIFY series_id INTEGER NOT NULL"))
+        else:
+            connection.execute(text("ALTER TABLE containers ALTER COLUMN series_id SET NOT NULL"))
+
+    # 파티션 테이블(MySQL)은 외래키를 지원하지 않음
+    partitioned = connection.dialect.name == "mysql" and bool(get_partitions(connection))
+    if not partitioned and not _has_series_foreign_key(connection):
+        connection.execute(text(
+            "ALTER TABLE containers ADD CONSTRAINT fk_containers_series_id "
+            "FOREIGN KEY (series_id) REFERENCES container_series (id)"
+        ))
+    connection.commit()
+
+def _0002_container_series(connection: Connection) -> None:
+    """
+    containers의 식별 문자열을 container_series로 옮기고 series_id(NOT NULL, 외래키)로 대체합니다.
+
+    테이블 전체를 갱신하므로 서버 시작 시에는 자동 적용하지 않으며, 점검 시간에 python -m database upgrade로 적용합니다.
+    MySQL은 DDL마다 커밋되므로 각 단계는 이미 끝난 부분을 건너뛰고, 중단된 뒤 다시 실행하면 남은 단계부터 이어서 진행합니다.
+
+        1. series_id 컬럼 추가
+        2. 식별 필드 조합별 series 등록 (이미 등록된 조합 제외)
+        3. series_id가 비어 있는 기록을 id 구간별로 채움 (구간마다 커밋)
+        4. 식별 컬럼과 해당 인덱스 삭제
+        5. series_id를 NOT NULL + 외래키로 변경
+    """
+    columns = _container_columns(connection)
+    legacy_fields = [field for field in SERIES_FIELDS if field in columns]
+    if legacy_fields:
+        if len(legacy_fields) != len(SERIES_FIELDS):
+            raise RuntimeError(f"containers 식별 컬럼 일부만 남아 있어 series_id를 채울 수 없습니다: {legacy_fields}")
+        if "series_id" not in columns:
+            connection.execute(text("ALTER TABLE containers ADD COLUMN series_id INTEGER"))
+            connection.commit()
+        _register_legacy_series(connection)
+        _backfill_series_ids(connection)
+
+    if connection.dialect.name == "sqlite":
+        if legacy_fields or _container_columns(connection)["series_id"]["nullable"] or not _has_series_foreign_key(connection):
+            _rebuild_sqlite_containers(connection)
+    else:
+        if legacy_fields:
+            _drop_legacy_columns(connection)
+        _enforce_series_id_constraints(connection)
+
+    create_missing_indexes(connection, "containers")
+
+_ROLLUP_TABLES = ("container_rollups", "host_rollups")
+_ROLLUP_METRICS = ("cpu_percentage", "memory_usage", "memory_percentage")
+
+def _0003_rollup_metric_counts(connection: Connection) -> None:
+    """
+    롤업 테이블에 지표별 샘플 수({지표}_count) 컬럼을 추가하고 host_rollups를 다시 집계하도록 비웁니다.
+
+    - 기존 버킷은 NULL 값도 0으로 집계했으므로 지표별 샘플 수를 sample_count로 채웁니다.
+    - 기존 host_rollups는 컨테이너 기록으로 집계되어 있으므로 삭제하며,
+      롤업 작업이 host_metrics의 처음부터(host_rollup watermark) 다시 집계합니다.
+
+    중간에 중단되어도 다시 실행하면 남은 단계만 수행합니다.
+    """
+    inspector = inspect(connection)
+    for table_name in _ROLLUP_TABLES:
+        columns = {column["name"] for column in inspector.get_columns(table_name)}
+        for metric in _ROLLUP_METRICS:
+            if f"{metric}_count" not in columns:
+                connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {metric}_count INTEGER NOT NULL DEFAULT 0"))
+            connection.execute(text(
+                f"UPDATE {table_name} SET {metric}_count = sample_count "
+                f"WHERE {metric}_count = 0 AND {metric}_sum IS NOT NULL"
+            ))
+    connection.execute(text("DELETE FROM host_rollups"))
+    connection.execute(text("DELETE FROM rollup_watermarks WHERE name = 'host_rollup'"))
+
+class ManualMigrationRequired(RuntimeError):
+    """서버 시작 시 자동 적용하지 않는 마이그레이션이 필요한 경우"""
+
+# (버전, 설명, 적용 함수, 수동 적용 확인 함수) - 버전 순서대로 적용됩니다.
+# 수동 적용 확인 함수가 True를 반환하면(테이블 전체 갱신 등) 서버 시작 시에는 적용하지 않고
+# python -m database upgrade로만 적용합니다. (None이면 항상 자동 적용)
+MIGRATIONS: List[Tuple[str, str, Callable[[Connection], None], Optional[Callable[[Connection], bool]]]] = [
+    ("0001", "containers 시계열 복합 인덱스 추가", _0001_container_time_series_indexes, None),
+    ("0002", "containers 식별 컬럼을 container_series 차원 테이블로 분리", _0002_container_series, _0002_requires_upgrade),
+    ("0003", "롤업 지표별 샘플 수 추가 및 host_rollups를 host_metrics 기준으로 재집계", _0003_rollup_metric_counts, None),
+]
+
+def get_applied_versions(engine: Engine) -> Dict[str, datetime]:
+    _migration_metadata.create_all(bind=engine)
+    with engine.connect() as connection:
+        rows = connection.execute(select(schema_migrations.c.version, schema_migrations.c.applied_at)).all()
+    return dict(rows)
+
+def run_migrations(engine: Engine, allow_manual: bool = True) -> List[str]:
+    """
+    적용되지 않은 마이그레이션을 버전 순서대로 적용합니다.
+
+    각 마이그레이션은 자체 연결에서 실행되며, 마지막 커밋에 적용 이력이 함께 기록됩니다.
+    (단계별로 커밋하는 마이그레이션은 중단 후 다시 실행하면 남은 단계부터 진행)
+
+    Args:
+        engine: 대상 엔진
+        allow_manual: False면(서버 시작 시) 수동 적용이 필요한 마이그레이션을 만났을 때 적용하지 않고 예외 발생
+
+    Returns:
+        List[str]: 이번에 적용한 버전 목록
+
+    Raises:
+        ManualMigrationRequired: allow_manual이 False이고 수동 적용이 필요한 마이그레이션이 남은 경우
+    """
+    applied = get_applied_versions(engine)
+    newly_applied = []
+    for version, description, migrate, requires_manual in MIGRATIONS:
+        if version in applied:
+            continue
+        with engine.connect() as connection:
+            if not allow_manual and requires_manual is not None and requires_manual(connection):
+                raise ManualMigrationRequired(
+                    f"마이그레이션 {version} ({description})은 테이블 전체를 갱신하므로 서버 시작 시 적용하지 않습니다. "
+                    f"점검 시간에 python -m database upgrade로 적용한 뒤 서버를 시작하세요."
+                )
+            logger.info(f"마이그레이션 적용 중: {version} - {description}")
+            migrate(connection)
+            connection.execute(schema_migrations.insert().values(
+                version=version,
+                description=description,
+                applied_at=datetime.utcnow()
+            ))
+            connection.commit()
+        newly_applied.append(version)
+        logger.info(f"마이그레이션 적용 완료: {version}")
+    return newly_applied
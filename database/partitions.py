@@ -0,0 +1,154 @@
+"""
+일 단위 파티셔닝 - MySQL에서 containers 테이블을 get_datetime 기준 RANGE 파티션으로 관리합니다.
+
+파티션은 하루 단위(p20261017 = 2026-10-17 하루치 기록)로 만들고, 마지막에 MAXVALUE 파티션(p_future)을 두어
+미리 만들어 둔 파티션 범위를 벗어난 기록도 INSERT가 실패하지 않게 합니다.
+보관 기간이 지난 파티션은 DROP PARTITION으로 삭제하므로 행 단위 DELETE 없이 즉시 정리됩니다.
+
+MySQL 외의 데이터베이스(SQLite 등)는 파티셔닝을 지원하지 않으므로 일반 테이블을 그대로 사용합니다.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+TABLE_NAME = "containers"
+FUTURE_PARTITION = "p_future"
+
+# MySQL TO_DAYS(date)와 date.toordinal()의 차이 (TO_DAYS는 0년부터 계산)
+_TO_DAYS_OFFSET = 365
+
+def is_partitioning_supported(connection: Connection) -> bool:
+    return connection.dialect.name == "mysql"
+
+def _to_days(day: date) -> int:
+    return day.toordinal() + _TO_DAYS_OFFSET
+
+def _from_days(days: int) -> date:
+    return date.fromordinal(days - _TO_DAYS_OFFSET)
+
+def _partition_name(day: date) -> str:
+    return f"p{day:%Y%m%d}"
+
+def _partition_definition(day: date) -> str:
+    """day 하루치(day 다음 날 0시 미만) 기록을 담는 파티션 정의"""
+    return f"PARTITION {_partition_name(day)} VALUES LESS THAN ({_to_days(day + timedelta(days=1))})"
+
+def get_partitions(connection: Connection) -> List[Tuple[str, Optional[int]]]:
+    """
+    containers 테이블의 파티션 목록을 순서대로 반환합니다.
+
+    Returns:
+        List[Tuple[str, Optional[int]]]: (파티션 이름, 상한 TO_DAYS 값) 목록. MAXVALUE 파티션의 상한은 None이며,
+        파티셔닝되지 않은 테이블이면 빈 목록을 반환합니다.
+    """
+    rows = connection.execute(text(
+        "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL "
+        "ORDER BY PARTITION_ORDINAL_POSITION"
+    ), {"table": TABLE_NAME}).all()
+    return [
+        (name, None if description == "MAXVALUE" else int(description))
+        for name, description in rows
+    ]
+
+def enable_partitioning(connection: Connection, future_days: int, retention_days: int) -> bool:
+    """
+    파티셔닝되지 않은 containers 테이블을 일 단위 RANGE 파티션 테이블로 변환합니다.
+
+    MySQL 파티션 테이블의 제약에 맞추어 다음을 함께 변경합니다.
+    - 기본키를 (id, get_datetime)으로 변경 (모든 유니크 키에 파티션 키가 포함되어야 함)
+    - hosts 외래키 제거 (InnoDB 파티션 테이블은 외래키를 지원하지 않음)
+
+    테이블 전체를 다시 쓰므로 기록이 많은 운영 테이블은 점검 시간에 python -m database partition으로 실행하세요.
+
+    Returns:
+        bool: 변환을 수행했으면 True, 이미 파티셔닝되어 있으면 False
+    """
+    if get_partitions(connection):
+        return False
+
+    today = datetime.utcnow().date()
+    oldest = connection.execute(text(f"SELECT DATE(MIN(get_datetime)) FROM {TABLE_NAME}")).scalar()
+    first_day = oldest or today
+    if retention_days > 0:
+        # 보관 기간 이전 기록은 모두 첫 파티션에 담기므로 첫 유지보수에서 함께 삭제됩니다.
+        first_day = max(first_day, today - timedelta(days=retention_days))
+    first_day = min(first_day, today)
+
+    days = [first_day + timedelta(days=offset) for offset in range((today - first_day).days + future_days + 1)]
+    definitions = [_partition_definition(day) for day in days]
+    definitions.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE")
+
+    logger.info(f"{TABLE_NAME} 테이블 파티셔닝 변환 시작 ({days[0]} ~ {days[-1]}, {len(days)}개 파티션)")
+    for foreign_key in inspect(connection).get_foreign_keys(TABLE_NAME):
+        connection.execute(text(f"ALTER TABLE {TABLE_NAME} DROP FOREIGN KEY {foreign_key['name']}"))
+    connection.execute(text(f"UPDATE {TABLE_NAME} SET get_datetime = '1970-01-01' WHERE get_datetime IS NULL"))
+    connection.execute(text(
+        f"ALTER TABLE {TABLE_NAME} MODIFY get_datetime DATETIME NOT NULL, "
+        f"DROP PRIMARY KEY, ADD PRIMARY KEY (id, get_datetime)"
+    ))
+    connection.execute(text(
+        f"ALTER TABLE {TABLE_NAME} PARTITION BY RANGE (TO_DAYS(get_datetime)) ({', '.join(definitions)})"
+    ))
+    logger.info(f"{TABLE_NAME} 테이블 파티셔닝 변환 완료")
+    return True
+
+def create_future_partitions(connection: Connection, future_days: int) -> List[str]:
+    """
+    오늘부터 future_days일 뒤까지의 파티션이 없으면 p_future를 분할하여 생성합니다.
+
+    p_future에는 보통 기록이 없으므로 REORGANIZE PARTITION이 데이터 복사 없이 빠르게 끝납니다.
+
+    Returns:
+        List[str]: 새로 만든 파티션 이름
+    """
+    partitions = get_partitions(connection)
+    bounds = [bound for _, bound in partitions if bound is not None]
+    today = datetime.utcnow().date()
+    # 마지막 일 단위 파티션의 다음 날부터 생성
+    start = _from_days(max(bounds)) if bounds else today
+    days = [start + timedelta(days=offset) for offset in range((today + timedelta(days=future_days) - start).days + 1)]
+    if not days:
+        return []
+
+    definitions = [_partition_definition(day) for day in days]
+    definitions.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN MAXVALUE")
+    connection.execute(text(
+        f"ALTER TABLE {TABLE_NAME} REORGANIZE PARTITION {FUTURE_PARTITION} INTO ({', '.join(definitions)})"
+    ))
+    return [_partition_name(day) for day in days]
+
+def drop_expired_partitions(connection: Connection, retention_days: int) -> List[str]:
+    """
+    모든 기록이 보관 기간(retention_days)보다 오래된 파티션을 삭제합니다.
+
+    Returns:
+        List[str]: 삭제한 파티션 이름
+    """
+    if retention_days <= 0:
+        return []
+    cutoff = _to_days(datetime.utcnow().date() - timedelta(days=retention_days))
+    expired = [name for name, bound in get_partitions(connection) if bound is not None and bound <= cutoff]
+    if expired:
+        connection.execute(text(f"ALTER TABLE {TABLE_NAME} DROP PARTITION {', '.join(expired)}"))
+    return expired
+
+def maintain_partitions(db: Session, future_days: int, retention_days: int) -> Dict[str, Any]:
+    """
+    미래 파티션을 미리 만들고 보관 기간이 지난 파티션을 삭제합니다.
+
+    새 파티션을 먼저 만든 뒤 삭제하므로 유지보수 중에도 INSERT 대상 파티션이 항상 존재합니다.
+    """
+    connection = db.connection()
+    if not is_partitioning_supported(connection) or not get_partitions(connection):
+        return {"created": [], "dropped": []}
+    created = create_future_partitions(connection, future_days)
+    dropped = drop_expired_partitions(connection, retention_days)
+    db.commit()
+    return {"created": created, "dropped": dropped}
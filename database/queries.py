@@ -0,0 +1,249 @@
+"""
+데이터베이스 조회 작업 - 호스트/컨테이너 조회 쿼리를 관리합니다.
+
+모든 함수는 동기 Session을 첫 번째 인자로 받으며, 엔드포인트에서는 run_db를 통해 호출합니다.
+(엔진에서 직접 연결을 여는 스트리밍 조회 iter_container_chunks 제외)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from model import Host, HostMetric, ContainerSeries, Container
+from .database import engine
+from .series import SERIES_FIELDS
+
+HOST_METRIC_FIELDS = ("cpu_percentage", "cpu_cores", "cpu_threads", "memory_usage", "memory_percentage", "get_datetime")
+
+# 호스트 조회 컬럼 순서 (HostResponse 필드 순서와 동일)
+HOST_COLUMNS = ("id", "host_name", *HOST_METRIC_FIELDS)
+
+# host_metrics 조회 컬럼 순서 (HostMetricResponse 필드 순서와 동일)
+HOST_METRIC_COLUMNS = ("id", "host_id", *HOST_METRIC_FIELDS)
+
+def _columns(model, names: Sequence[str]) -> list:
+    return [model.__table__.c[name] for name in names]
+
+def get_latest_host_metrics(db: Session) -> Dict[int, Row]:
+    """
+    호스트별 가장 최근 host_metrics 기록을 조회합니다.
+
+    (host_id, get_datetime, id) 인덱스로 호스트별 MAX(get_datetime)을 구한 뒤 조인하므로
+    기록 전체를 정렬하지 않습니다. 같은 시각의 기록이 여러 개면 id가 큰 쪽을 사용합니다.
+    """
+    latest = (
+        select(HostMetric.host_id, func.max(HostMetric.get_datetime).label("max_datetime"))
+        .group_by(HostMetric.host_id)
+        .subquery()
+    )
+    stmt = select(*_columns(HostMetric, HOST_METRIC_COLUMNS)).join(
+        latest,
+        and_(HostMetric.host_id == latest.c.host_id, HostMetric.get_datetime == latest.c.max_datetime)
+    )
+    metrics: Dict[int, Row] = {}
+    for metric in db.execute(stmt):
+        current = metrics.get(metric.host_id)
+        if current is None or metric.id > current.id:
+            metrics[metric.host_id] = metric
+    return metrics
+
+def get_latest_host_metric(db: Session, host_id: int) -> Optional[HostMetric]:
+    """특정 호스트의 가장 최근 host_metrics 기록 (인덱스 역순 탐색 1행)"""
+    stmt = (
+        select(HostMetric)
+        .where(HostMetric.host_id == host_id)
+        .order_by(HostMetric.get_datetime.desc(), HostMetric.id.desc())
+        .limit(1)
+    )
+    return db.execute(stmt).scalars().first()
+
+def get_all_hosts(db: Session) -> List[Dict[str, Any]]:
+    """
+    등록된 모든 호스트를 가장 최근 자원 사용량과 함께 조회합니다.
+
+    host_metrics 기록이 없는 호스트(기록 테이블 추가 이전에 등록된 호스트 등)는 hosts 행의 값을 사용합니다.
+    """
+    hosts = db.execute(select(*_columns(Host, HOST_COLUMNS)).order_by(Host.id)).all()
+    metrics = get_latest_host_metrics(db)
+    results = []
+    for host in hosts:
+        source = metrics.get(host.id, host)
+        results.append({
+            "id": host.id,
+            "host_name": host.host_name,
+            **{field: getattr(source, field) for field in HOST_METRIC_FIELDS}
+        })
+    return results
+
+def get_host(db: Session, host_id: int) -> Optional[Host]:
+    return db.get(Host, host_id)
+
+# 컨테이너 조회 컬럼 순서 (ContainerResponse 필드 순서와 동일, 내보내기에도 사용)
+EXPORT_COLUMNS = (
+    "id", "engine_type", "cluster_name", "node_name", "container_name", "status",
+    "cpu_percentage", "memory_usage", "memory_percentage", "get_datetime", "host_id"
+)
+
+def _select_containers():
+    """
+    컨테이너 기록을 container_series와 조인하여 ContainerResponse 형태의 컬럼으로 조회하는 SELECT를 반환합니다.
+    """
+    columns = [
+        (ContainerSeries if name in SERIES_FIELDS else Container).__table__.c[name]
+        for name in EXPORT_COLUMNS
+    ]
+    return select(*columns).join_from(
+        Container.__table__, ContainerSeries.__table__,
+        Container.__table__.c.series_id == ContainerSeries.__table__.c.id
+    )
+
+def get_latest_container_rows(db: Session, since: Optional[datetime] = None) -> List[Row]:
+    """
+    (host_id, container_name)별 가장 최근 컨테이너 기록을 한 번의 GROUP BY 쿼리로 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        since: 이 시각 이후 기록만 대상으로 함 (get_datetime 인덱스 범위로 스캔 범위 제한)
+    """
+    latest_ids = (
+        select(func.max(Container.id).label("max_id"))
+        .join(ContainerSeries, Container.series_id == ContainerSeries.id)
+    )
+    if since is not None:
+        latest_ids = latest_ids.where(Container.get_datetime >= since)
+    latest_ids = latest_ids.group_by(Container.host_id, ContainerSeries.container_name).subquery()
+
+    stmt = _select_containers().join(latest_ids, Container.id == latest_ids.c.max_id)
+    return list(db.execute(stmt).all())
+
+def _container_conditions(
+    host_id: Optional[int] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    cluster_name: Optional[str] = None,
+    node_name: Optional[str] = None,
+    container_name: Optional[str] = None,
+    status: Optional[str] = None,
+    engine_type: Optional[str] = None
+) -> list:
+    conditions = []
+    if host_id is not None:
+        conditions.append(Container.host_id == host_id)
+    if since is not None:
+        conditions.append(Container.get_datetime >= since)
+    if until is not None:
+        conditions.append(Container.get_datetime < until)
+
+    # 식별 필드 조건은 작은 container_series에서 series ID를 먼저 찾아 (series_id, get_datetime) 인덱스로 조회
+    series_conditions = []
+    if cluster_name is not None:
+        series_conditions.append(ContainerSeries.cluster_name == cluster_name)
+    if node_name is not None:
+        series_conditions.append(ContainerSeries.node_name == node_name)
+    if container_name is not None:
+        series_conditions.append(ContainerSeries.container_name == container_name)
+    if status is not None:
+        series_conditions.append(ContainerSeries.status == status)
+    if engine_type is not None:
+        series_conditions.append(ContainerSeries.engine_type == engine_type)
+    if series_conditions:
+        conditions.append(Container.series_id.in_(select(ContainerSeries.id).where(*series_conditions)))
+    return conditions
+
+def get_containers_page(
+    db: Session,
+    limit: int,
+    after: Optional[Tuple[datetime, int]] = None,
+    **filters
+) -> Tuple[List[Row], bool]:
+    """
+    (get_datetime, id) 기준 keyset 페이지네이션으로 컨테이너 기록을 조회합니다.
+
+    OFFSET 없이 마지막 행 이후만 조회하므로 테이블이 커져도 페이지 조회 비용이 일정합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        limit: 최대 조회 행 수
+        after: 이전 페이지 마지막 행의 (get_datetime, id)
+        **filters: host_id, since, until, cluster_name, node_name, container_name, status
+            (since는 이상, until은 미만)
+
+    Returns:
+        Tuple[List[Row], bool]: (조회된 행, 다음 페이지 존재 여부)
+    """
+    conditions = _container_conditions(**filters)
+    if after is not None:
+        after_datetime, after_id = after
+        # row-value 비교 대신 풀어쓰고 get_datetime 하한을 함께 주어 인덱스 range scan 유도
+        conditions.append(Container.get_datetime >= after_datetime)
+        conditions.append(or_(
+            Container.get_datetime > after_datetime,
+            and_(Container.get_datetime == after_datetime, Container.id > after_id)
+        ))
+
+    stmt = (
+        _select_containers()
+        .where(*conditions)
+        .order_by(Container.get_datetime, Container.id)
+        .limit(limit + 1)
+    )
+    rows = list(db.execute(stmt).all())
+    return rows[:limit], len(rows) > limit
+
+def get_host_metrics_page(
+    db: Session,
+    host_id: int,
+    limit: int,
+    after: Optional[Tuple[datetime, int]] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> Tuple[List[Row], bool]:
+    """
+    특정 호스트의 host_metrics 기록을 (get_datetime, id) 기준 keyset 페이지네이션으로 조회합니다.
+
+    Returns:
+        Tuple[List[Row], bool]: (HOST_METRIC_COLUMNS 순서의 행, 다음 페이지 존재 여부)
+    """
+    conditions = [HostMetric.host_id == host_id]
+    if since is not None:
+        conditions.append(HostMetric.get_datetime >= since)
+    if until is not None:
+        conditions.append(HostMetric.get_datetime < until)
+    if after is not None:
+        after_datetime, after_id = after
+        conditions.append(HostMetric.get_datetime >= after_datetime)
+        conditions.append(or_(
+            HostMetric.get_datetime > after_datetime,
+            and_(HostMetric.get_datetime == after_datetime, HostMetric.id > after_id)
+        ))
+
+    stmt = (
+        select(*_columns(HostMetric, HOST_METRIC_COLUMNS))
+        .where(*conditions)
+        .order_by(HostMetric.get_datetime, HostMetric.id)
+        .limit(limit + 1)
+    )
+    rows = list(db.execute(stmt).all())
+    return rows[:limit], len(rows) > limit
+
+def iter_container_chunks(chunk_size: int, **filters) -> Iterator[Sequence[Row]]:
+    """
+    서버 사이드 커서로 컨테이너 기록을 chunk_size 행씩 읽어 반환합니다.
+
+    요청 세션과 별도로 엔진에서 직접 연결을 열며, stream_results 옵션으로
+    MySQL(pymysql)에서는 SSCursor를 사용하므로 결과 전체를 메모리에 올리지 않습니다.
+
+    Args:
+        chunk_size: 한 번에 읽을 행 수
+        **filters: host_id, since, until, cluster_name, node_name, container_name, status
+    """
+    stmt = (
+        _select_containers()
+        .where(*_container_conditions(**filters))
+        .order_by(Container.get_datetime, Container.id)
+    )
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=chunk_size).execute(stmt)
+        for partition in result.partitions():
+            yield partition
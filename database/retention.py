@@ -0,0 +1,109 @@
+"""
+데이터 보존 정책 - 오래되었거나 호스트별 보관 개수를 넘는 containers/host_metrics 기록을 작은 단위로 삭제합니다.
+
+각 함수는 한 번 호출에 최대 batch_size행만 삭제하고 바로 커밋하므로
+긴 잠금을 잡지 않으며, 호출 사이의 대기는 호출하는 쪽(백그라운드 작업)에서 처리합니다.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.orm import Session
+from model import Host, HostMetric, Container
+
+def _delete_chunk(db: Session, table, conditions: list, order_by: list, batch_size: int) -> int:
+    if db.get_bind().dialect.name == "mysql":
+        # DELETE ... WHERE ... LIMIT n (인덱스 범위 내에서 최대 n행만 삭제)
+        stmt = delete(table).where(*conditions).with_dialect_options(mysql_limit=batch_size)
+        deleted = db.execute(stmt).rowcount
+    else:
+        # DELETE ... LIMIT을 지원하지 않는 DB는 삭제할 ID를 먼저 조회
+        ids = db.execute(
+            select(table.c.id).where(*conditions).order_by(*order_by).limit(batch_size)
+        ).scalars().all()
+        deleted = db.execute(delete(table).where(table.c.id.in_(ids))).rowcount if ids else 0
+    db.commit()
+    return deleted
+
+def delete_expired_chunk(db: Session, cutoff: datetime, batch_size: int) -> int:
+    """
+    get_datetime이 cutoff 이전인 기록을 최대 batch_size행 삭제합니다.
+
+    Returns:
+        int: 삭제한 행 수 (batch_size보다 작으면 더 삭제할 행이 없음)
+    """
+    table = Container.__table__
+    return _delete_chunk(
+        db,
+        table,
+        [table.c.get_datetime < cutoff],
+        [table.c.get_datetime, table.c.id],
+        batch_size
+    )
+
+def delete_expired_host_metrics_chunk(db: Session, cutoff: datetime, batch_size: int) -> int:
+    """get_datetime이 cutoff 이전인 host_metrics 기록을 최대 batch_size행 삭제합니다."""
+    table = HostMetric.__table__
+    return _delete_chunk(
+        db,
+        table,
+        [table.c.get_datetime < cutoff],
+        [table.c.get_datetime, table.c.id],
+        batch_size
+    )
+
+def get_host_ids(db: Session) -> List[int]:
+    return list(db.execute(select(Host.id).order_by(Host.id)).scalars().all())
+
+def _host_retention_boundary(db: Session, table, host_id: int, keep: int) -> Optional[Tuple[datetime, int]]:
+    row = db.execute(
+        select(table.c.get_datetime, table.c.id)
+        .where(table.c.host_id == host_id)
+        .order_by(table.c.get_datetime.desc(), table.c.id.desc())
+        .offset(keep)
+        .limit(1)
+    ).first()
+    return (row.get_datetime, row.id) if row else None
+
+def _delete_host_excess_chunk(db: Session, table, host_id: int, boundary: Tuple[datetime, int], batch_size: int) -> int:
+    boundary_datetime, boundary_id = boundary
+    return _delete_chunk(
+        db,
+        table,
+        [
+            table.c.host_id == host_id,
+            table.c.get_datetime <= boundary_datetime,
+            or_(
+                table.c.get_datetime < boundary_datetime,
+                and_(table.c.get_datetime == boundary_datetime, table.c.id <= boundary_id)
+            )
+        ],
+        [table.c.get_datetime, table.c.id],
+        batch_size
+    )
+
+def get_host_retention_boundary(db: Session, host_id: int, keep: int) -> Optional[Tuple[datetime, int]]:
+    """
+    호스트의 containers 기록 중 최근 keep개를 제외한 가장 최신 행의 (get_datetime, id)를 반환합니다.
+
+    (host_id, get_datetime, id) 인덱스를 역순으로 keep개만 건너뛰므로 전체 기록 수와 무관하게 조회됩니다.
+    초과분이 없으면 None을 반환합니다.
+    """
+    return _host_retention_boundary(db, Container.__table__, host_id, keep)
+
+def delete_host_excess_chunk(db: Session, host_id: int, boundary: Tuple[datetime, int], batch_size: int) -> int:
+    """
+    호스트의 containers 기록 중 boundary 이하((get_datetime, id) 기준)인 행을 최대 batch_size행 삭제합니다.
+
+    Returns:
+        int: 삭제한 행 수 (batch_size보다 작으면 더 삭제할 행이 없음)
+    """
+    return _delete_host_excess_chunk(db, Container.__table__, host_id, boundary, batch_size)
+
+def get_host_metrics_retention_boundary(db: Session, host_id: int, keep: int) -> Optional[Tuple[datetime, int]]:
+    """호스트의 host_metrics 기록 중 최근 keep개를 제외한 가장 최신 행의 (get_datetime, id)를 반환합니다."""
+    return _host_retention_boundary(db, HostMetric.__table__, host_id, keep)
+
+def delete_host_metrics_excess_chunk(db: Session, host_id: int, boundary: Tuple[datetime, int], batch_size: int) -> int:
+    """호스트의 host_metrics 기록 중 boundary 이하((get_datetime, id) 기준)인 행을 최대 batch_size행 삭제합니다."""
+    return _delete_host_excess_chunk(db, HostMetric.__table__, host_id, boundary, batch_size)
@@ -0,0 +1,309 @@
+"""
+시계열 롤업 - 원본 기록을 1m/5m/1h 버킷별 min/avg/max/last로 집계합니다.
+
+- container_rollups: containers 기록을 컨테이너별로 집계
+- host_rollups: host_metrics 기록(호스트 자체의 사용량)을 호스트별로 집계
+
+rollup_watermarks에 원본 테이블별로 마지막으로 처리한 행 ID를 기록하여
+매 실행마다 새로 들어온 행만 증분 처리합니다.
+값이 NULL인 지표는 해당 지표의 집계에서 제외합니다.
+"""
+
+import operator
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import and_, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from model import Container, ContainerSeries, HostMetric, ContainerRollup, HostRollup, RollupWatermark
+
+# 해상도 이름 -> 버킷 크기(초)
+RESOLUTIONS = {"1m": 60, "5m": 300, "1h": 3600}
+METRICS = ("cpu_percentage", "memory_usage", "memory_percentage")
+WATERMARK_NAME = "rollup"
+HOST_WATERMARK_NAME = "host_rollup"
+
+_EPOCH = datetime(1970, 1, 1)
+
+def bucket_start(value: datetime, seconds: int) -> datetime:
+    elapsed = int((value - _EPOCH).total_seconds())
+    return _EPOCH + timedelta(seconds=elapsed - elapsed % seconds)
+
+def choose_resolution(since: datetime, until: datetime, max_points: int) -> str:
+    """조회 범위에서 버킷 수가 max_points를 넘지 않는 가장 세밀한 해상도를 고릅니다."""
+    range_seconds = max((until - since).total_seconds(), 0)
+    for resolution, seconds in RESOLUTIONS.items():
+        if range_seconds / seconds <= max_points:
+            return resolution
+    return "1h"
+
+def _new_aggregate(row: Any) -> Dict[str, Any]:
+    aggregate = {"sample_count": 1, "last_datetime": row.get_datetime}
+    for metric in METRICS:
+        value = getattr(row, metric)
+        aggregate[f"{metric}_count"] = 0 if value is None else 1
+        aggregate[f"{metric}_min"] = value
+        aggregate[f"{metric}_max"] = value
+        aggregate[f"{metric}_sum"] = value
+        aggregate[f"{metric}_last"] = value
+    return aggregate
+
+def _combine(function, left: Optional[float], right: Optional[float]) -> Optional[float]:
+    # NULL(값 없음)은 집계에서 제외
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return function(left, right)
+
+def _merge_aggregate(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """source 집계를 target에 병합합니다. last 값은 last_datetime이 더 최신인 쪽의 값(NULL 제외)을 따릅니다."""
+    target["sample_count"] += source["sample_count"]
+    newer = source["last_datetime"] >= target["last_datetime"]
+    for metric in METRICS:
+        target[f"{metric}_count"] += source[f"{metric}_count"]
+        target[f"{metric}_min"] = _combine(min, target[f"{metric}_min"], source[f"{metric}_min"])
+        target[f"{metric}_max"] = _combine(max, target[f"{metric}_max"], source[f"{metric}_max"])
+        target[f"{metric}_sum"] = _combine(operator.add, target[f"{metric}_sum"], source[f"{metric}_sum"])
+        if (newer and source[f"{metric}_last"] is not None) or target[f"{metric}_last"] is None:
+            target[f"{metric}_last"] = source[f"{metric}_last"]
+    if newer:
+        target["last_datetime"] = source["last_datetime"]
+
+def _aggregate_rows(rows: Iterable[Any], key_of) -> Dict[tuple, Dict[str, Any]]:
+    """원본 행을 해상도별 버킷으로 집계합니다. key_of(row)는 해상도/버킷을 제외한 식별 키입니다."""
+    aggregates: Dict[tuple, Dict[str, Any]] = {}
+    for row in rows:
+        if row.get_datetime is None or row.host_id is None:
+            continue
+        for resolution, seconds in RESOLUTIONS.items():
+            key = (resolution, *key_of(row), bucket_start(row.get_datetime, seconds))
+            sample = _new_aggregate(row)
+            if key in aggregates:
+                _merge_aggregate(aggregates[key], sample)
+            else:
+                aggregates[key] = sample
+    return aggregates
+
+def _apply_aggregates(db: Session, model, key_columns: Tuple[str, ...], aggregates: Dict[tuple, Dict[str, Any]]) -> None:
+    """
+    집계 결과를 롤업 테이블에 반영합니다. 기존 버킷 행은 병합 후 UPDATE, 없으면 INSERT합니다.
+
+    aggregates의 키는 key_columns 순서의 튜플이며 첫 값은 resolution, 마지막 값은 bucket_start입니다.
+    """
+    table = model.__table__
+    keys_by_resolution: Dict[str, List[tuple]] = {}
+    for key in aggregates:
+        keys_by_resolution.setdefault(key[0], []).append(key)
+
+    existing: Dict[tuple, Dict[str, Any]] = {}
+    for resolution, keys in keys_by_resolution.items():
+        buckets = [key[-1] for key in keys]
+        stmt = select(table).where(
+            table.c.resolution == resolution,
+            table.c.host_id.in_({key[1] for key in keys}),
+            table.c.bucket_start.between(min(buckets), max(buckets))
+        )
+        for row in db.execute(stmt).mappings():
+            key = tuple(row[column] for column in key_columns)
+            if key in aggregates:
+                existing[key] = dict(row)
+
+    inserts = []
+    updates = []
+    for key, aggregate in aggregates.items():
+        row = existing.get(key)
+        if row is None:
+            inserts.append({**dict(zip(key_columns, key)), **aggregate})
+        else:
+            _merge_aggregate(row, aggregate)
+            updates.append(row)
+
+    if inserts:
+        db.execute(insert(table), inserts)
+    if updates:
+        # 기본키 기준 bulk UPDATE (executemany)
+        db.execute(update(model), updates)
+
+def get_max_container_id(db: Session) -> int:
+    return db.execute(select(func.max(Container.id))).scalar() or 0
+
+def get_max_host_metric_id(db: Session) -> int:
+    return db.execute(select(func.max(HostMetric.id))).scalar() or 0
+
+def _claim_rows(db: Session, watermark_name: str, build_query, upper_id: int, batch_size: int) -> List[Any]:
+    """
+    watermark 이후부터 upper_id 이하의 원본 행을 최대 batch_size개 읽고 watermark를 마지막 행 ID로 옮깁니다.
+
+    watermark 갱신을 먼저 조건부 UPDATE(last_id가 읽은 값과 같을 때만)로 수행하므로
+    여러 서버 프로세스가 동시에 실행해도 같은 구간이 중복 집계되지 않습니다.
+    (처리할 행이 없거나 다른 프로세스가 먼저 가져갔으면 빈 목록)
+
+    Args:
+        build_query: last_id를 받아 id > last_id, id <= upper_id 조건의 id 순 SELECT를 만드는 함수
+    """
+    watermark = db.get(RollupWatermark, watermark_name)
+    if watermark is None:
+        try:
+            db.execute(insert(RollupWatermark.__table__).values(name=watermark_name, last_id=0, updated_at=datetime.utcnow()))
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+        watermark = db.get(RollupWatermark, watermark_name)
+
+    last_id = watermark.last_id
+    if last_id >= upper_id:
+        return []
+
+    rows = db.execute(build_query(last_id).limit(batch_size)).all()
+    if not rows:
+        return []
+
+    claimed = db.execute(
+        update(RollupWatermark.__table__)
+        .where(RollupWatermark.__table__.c.name == watermark_name, RollupWatermark.__table__.c.last_id == last_id)
+        .values(last_id=rows[-1].id, updated_at=datetime.utcnow())
+    )
+    if claimed.rowcount != 1:
+        db.rollback()
+        return []
+    return rows
+
+def process_rollups(db: Session, upper_id: int, batch_size: int) -> int:
+    """
+    containers 원본 행을 최대 batch_size개 컨테이너 롤업으로 집계합니다.
+
+    Returns:
+        int: 처리한 원본 행 수 (0이면 처리할 행이 없거나 다른 프로세스가 처리 중)
+    """
+    table = Container.__table__
+    rows = _claim_rows(
+        db, WATERMARK_NAME,
+        lambda last_id: (
+            select(table.c.id, table.c.host_id, ContainerSeries.container_name, table.c.get_datetime, *(table.c[metric] for metric in METRICS))
+            .join(ContainerSeries, table.c.series_id == ContainerSeries.id)
+            .where(table.c.id > last_id, table.c.id <= upper_id)
+            .order_by(table.c.id)
+        ),
+        upper_id, batch_size
+    )
+    if not rows:
+        return 0
+
+    aggregates = _aggregate_rows(rows, lambda row: (row.host_id, row.container_name))
+    _apply_aggregates(db, ContainerRollup, ("resolution", "host_id", "container_name", "bucket_start"), aggregates)
+    db.commit()
+    return len(rows)
+
+def process_host_rollups(db: Session, upper_id: int, batch_size: int) -> int:
+    """
+    host_metrics 원본 행을 최대 batch_size개 호스트 롤업으로 집계합니다.
+
+    Returns:
+        int: 처리한 원본 행 수 (0이면 처리할 행이 없거나 다른 프로세스가 처리 중)
+    """
+    table = HostMetric.__table__
+    rows = _claim_rows(
+        db, HOST_WATERMARK_NAME,
+        lambda last_id: (
+            select(table.c.id, table.c.host_id, table.c.get_datetime, *(table.c[metric] for metric in METRICS))
+            .where(table.c.id > last_id, table.c.id <= upper_id)
+            .order_by(table.c.id)
+        ),
+        upper_id, batch_size
+    )
+    if not rows:
+        return 0
+
+    aggregates = _aggregate_rows(rows, lambda row: (row.host_id,))
+    _apply_aggregates(db, HostRollup, ("resolution", "host_id", "bucket_start"), aggregates)
+    db.commit()
+    return len(rows)
+
+def get_watermark(db: Session, name: str = WATERMARK_NAME) -> int:
+    watermark = db.get(RollupWatermark, name)
+    return watermark.last_id if watermark else 0
+
+def _to_points(rows: Iterable[Any], include_container: bool) -> List[Dict[str, Any]]:
+    points = []
+    for row in rows:
+        point = {
+            "resolution": row.resolution,
+            "bucket_start": row.bucket_start,
+            "host_id": row.host_id,
+            "container_name": row.container_name if include_container else None,
+            "sample_count": row.sample_count
+        }
+        for metric in METRICS:
+            count = getattr(row, f"{metric}_count")
+            point[f"{metric}_min"] = getattr(row, f"{metric}_min")
+            point[f"{metric}_avg"] = getattr(row, f"{metric}_sum") / count if count else None
+            point[f"{metric}_max"] = getattr(row, f"{metric}_max")
+            point[f"{metric}_last"] = getattr(row, f"{metric}_last")
+        points.append(point)
+    return points
+
+RollupPage = Tuple[List[Dict[str, Any]], Optional[Tuple[datetime, int]]]
+
+def _rollup_page(db: Session, model, conditions: list, limit: int, after: Optional[Tuple[datetime, int]], include_container: bool) -> RollupPage:
+    """
+    롤업 버킷을 (bucket_start, id) 기준 keyset 페이지네이션으로 조회합니다.
+
+    Returns:
+        RollupPage: (버킷 목록, 다음 페이지의 기준 (bucket_start, id) - 다음 페이지가 없으면 None)
+    """
+    if after is not None:
+        after_bucket, after_id = after
+        conditions.append(model.bucket_start >= after_bucket)
+        conditions.append(or_(
+            model.bucket_start > after_bucket,
+            and_(model.bucket_start == after_bucket, model.id > after_id)
+        ))
+    stmt = (
+        select(model)
+        .where(*conditions)
+        .order_by(model.bucket_start, model.id)
+        .limit(limit + 1)
+    )
+    rows = list(db.execute(stmt).scalars())
+    next_after = (rows[limit - 1].bucket_start, rows[limit - 1].id) if len(rows) > limit else None
+    return _to_points(rows[:limit], include_container=include_container), next_after
+
+def get_container_rollups(
+    db: Session,
+    resolution: str,
+    since: datetime,
+    until: datetime,
+    limit: int,
+    host_id: Optional[int] = None,
+    container_name: Optional[str] = None,
+    after: Optional[Tuple[datetime, int]] = None
+) -> RollupPage:
+    conditions = [
+        ContainerRollup.resolution == resolution,
+        ContainerRollup.bucket_start >= bucket_start(since, RESOLUTIONS[resolution]),
+        ContainerRollup.bucket_start < until
+    ]
+    if host_id is not None:
+        conditions.append(ContainerRollup.host_id == host_id)
+    if container_name is not None:
+        conditions.append(ContainerRollup.container_name == container_name)
+    return _rollup_page(db, ContainerRollup, conditions, limit, after, include_container=True)
+
+def get_host_rollups(
+    db: Session,
+    resolution: str,
+    since: datetime,
+    until: datetime,
+    limit: int,
+    host_id: Optional[int] = None,
+    after: Optional[Tuple[datetime, int]] = None
+) -> RollupPage:
+    conditions = [
+        HostRollup.resolution == resolution,
+        HostRollup.bucket_start >= bucket_start(since, RESOLUTIONS[resolution]),
+        HostRollup.bucket_start < until
+    ]
+    if host_id is not None:
+        conditions.append(HostRollup.host_id == host_id)
+    return _rollup_page(db, HostRollup, conditions, limit, after, include_container=False)
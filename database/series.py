@@ -0,0 +1,124 @@
+"""
+컨테이너 시계열(series) - 컨테이너 식별 문자열을 container_series 차원 테이블의 ID로 변환합니다.
+
+수집 시에는 메모리 LRU 캐시에서 series ID를 찾고, 처음 보는 조합만 DB에서 조회/등록하므로
+대부분의 보고는 container_series에 대한 추가 왕복 없이 저장됩니다.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from model import ContainerSeries
+from config.config import config
+
+# series를 구분하는 컨테이너 식별 필드 (순서 고정 - 해시 계산에 사용)
+SERIES_FIELDS = ("engine_type", "cluster_name", "node_name", "container_name", "status")
+
+SeriesKey = Tuple[str, ...]
+
+def series_key(container_data) -> SeriesKey:
+    return tuple(getattr(container_data, field) for field in SERIES_FIELDS)
+
+def series_hash(key: SeriesKey) -> str:
+    return hashlib.sha1("\x1f".join(key).encode("utf-8")).hexdigest()
+
+class SeriesIdCache:
+    """
+    series 식별 필드 튜플 -> series ID LRU 캐시.
+
+    sync 모드에서는 여러 스레드풀 작업이 동시에 접근하므로 잠금으로 보호합니다.
+    트랜잭션이 롤백되면 새로 등록한 series ID가 사라지므로, 커밋이 끝난 매핑만 put_many로 기록합니다.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: "OrderedDict[SeriesKey, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get_many(self, keys: Iterable[SeriesKey]) -> Dict[SeriesKey, int]:
+        found = {}
+        with self._lock:
+            for key in keys:
+                series_id = self._items.get(key)
+                if series_id is None:
+                    self.misses += 1
+                    continue
+                self._items.move_to_end(key)
+                found[key] = series_id
+                self.hits += 1
+        return found
+
+    def put_many(self, items: Dict[SeriesKey, int]) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            for key, series_id in items.items():
+                self._items[key] = series_id
+                self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+# 전역 series ID 캐시 ([cache] series_cache_size)
+series_id_cache = SeriesIdCache(config.get_cache_series_cache_size())
+
+def _select_series_ids(db: Session, keys: Iterable[SeriesKey]) -> Dict[SeriesKey, int]:
+    keys_by_hash = {series_hash(key): key for key in keys}
+    rows = db.execute(
+        select(ContainerSeries.series_hash, ContainerSeries.id)
+        .where(ContainerSeries.series_hash.in_(list(keys_by_hash)))
+    ).all()
+    return {keys_by_hash[row.series_hash]: row.id for row in rows}
+
+def _insert_series(db: Session, keys: Iterable[SeriesKey]) -> None:
+    """series를 등록합니다. 다른 요청이 같은 series를 먼저 등록했으면 무시합니다."""
+    table = ContainerSeries.__table__
+    rows = [{"series_hash": series_hash(key), **dict(zip(SERIES_FIELDS, key))} for key in keys]
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "mysql":
+        stmt = mysql_insert(table).prefix_with("IGNORE")
+    elif dialect == "sqlite":
+        stmt = sqlite_insert(table).on_conflict_do_nothing(index_elements=[table.c.series_hash])
+    else:
+        stmt = insert(table)
+    db.execute(stmt, rows)
+
+def resolve_series_ids(db: Session, keys: Iterable[SeriesKey]) -> Dict[SeriesKey, int]:
+    """
+    series 식별 필드 튜플들의 series ID를 반환합니다. 없는 series는 새로 등록합니다.
+
+    캐시에 없는 키만 한 번의 IN 조회로 찾고, 그래도 없는 키만 INSERT 후 다시 조회합니다.
+    반환된 매핑은 커밋 후 series_id_cache.put_many로 캐시에 기록해야 합니다.
+    """
+    keys = set(keys)
+    resolved = series_id_cache.get_many(keys)
+    missing = keys.difference(resolved)
+    if missing:
+        resolved.update(_select_series_ids(db, missing))
+        new_keys = missing.difference(resolved)
+        if new_keys:
+            _insert_series(db, new_keys)
+            resolved.update(_select_series_ids(db, new_keys))
+    return resolved
+
+def get_series_cache_stats() -> Dict[str, int]:
+    return {
+        "size": len(series_id_cache),
+        "max_size": series_id_cache.max_size,
+        "hits": series_id_cache.hits,
+        "misses": series_id_cache.misses
+    }
@@ -2,10 +2,30 @@
 Logger 설정 모듈 - 애플리케이션 전체의 로깅 설정을 관리합니다.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 from pathlib import Path
-from config.config import config
+from typing import Optional
+from config.config import config, Settings
+
+# 백그라운드 로그 출력 리스너 (setup_logging에서 시작)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    로그 레코드를 메시지 포맷팅 없이 큐에 넣는 QueueHandler.
+
+    기본 QueueHandler는 호출 스레드에서 메시지를 미리 포맷팅하지만, 여기서는 msg % args 변환까지
+    리스너 스레드로 미룹니다. 예외 정보(traceback)만 호출 시점에 문자열로 변환합니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
 def setup_logging():
     """
@@ -13,7 +33,14 @@ def setup_logging():
     
     설정 파일(config.ini)에서 로깅 관련 설정을 읽어와서
     콘솔 출력과 파일 로그 로테이션을 설정합니다.
+    
+    로거는 큐에 레코드를 넣기만 하고, 포맷팅과 콘솔/파일 출력은 QueueListener 스레드가 수행하므로
+    요청 처리(이벤트 루프) 중에 파일 I/O로 블로킹되지 않습니다.
     """
+    global _listener
+    if _listener is not None:
+        return
+    
     log_level = getattr(logging, config.get_logging_level().upper())
     log_format = config.get_logging_format()
     log_file_path = config.get_logging_file_path()
@@ -22,21 +49,45 @@ def setup_logging():
     log_dir = Path(log_file_path).parent
     log_dir.mkdir(exist_ok=True)
     
+    formatter = logging.Formatter(log_format)
+    handlers = [
+        logging.StreamHandler(),  # 콘솔 출력
+        logging.handlers.RotatingFileHandler(
+            log_file_path,
+            maxBytes=config.get_logging_max_file_size(),
+            backupCount=config.get_logging_backup_count(),
+            encoding='utf-8'
+        )
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    # 프로세스 종료 시 큐에 남은 로그를 모두 출력
+    atexit.register(stop_logging)
+    
     # 루트 로거 설정
     logging.basicConfig(
         level=log_level,
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(),  # 콘솔 출력
-            logging.handlers.RotatingFileHandler(
-                log_file_path,
-                maxBytes=config.get_logging_max_file_size(),
-                backupCount=config.get_logging_backup_count(),
-                encoding='utf-8'
-            )
-        ]
+        handlers=[DeferredQueueHandler(log_queue)]
     )
 
+def _apply_logging_settings(settings: Settings) -> None:
+    """설정을 다시 읽었을 때 루트 로거 레벨을 변경합니다."""
+    level = getattr(logging, settings.logging_level.upper(), None)
+    if not isinstance(level, int):
+        raise ValueError(f"알 수 없는 로그 레벨: {settings.logging_level}")
+    logging.getLogger().setLevel(level)
+
+def stop_logging():
+    """큐에 남은 로그를 모두 출력하고 리스너 스레드를 종료합니다."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 def get_logger(name: str = __name__) -> logging.Logger:
     """
     지정된 이름으로 로거 인스턴스를 반환합니다.
@@ -51,6 +102,7 @@ def get_logger(name: str = __name__) -> logging.Logger:
 
 # 로깅 설정 초기화
 setup_logging()
+config.on_reload(_apply_logging_settings)
 
 # 기본 로거 인스턴스
 logger = get_logger(__name__) 
\ No newline at end of file
@@ -1,13 +1,37 @@
-from fastapi import FastAPI, Depends, HTTPException, status
-from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime
-from model import Host, Container, SystemResourceData, HostResponse, ContainerResponse
-from database import get_db, startup_db, shutdown_db
-from config.config import config, get_app_config, get_cors_config
-from utils import make_json_result, log_received_data, log_exception_with_traceback
+from fastapi import FastAPI, Depends, HTTPException, status, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from typing import List, Dict, Any, Optional
+from datetime import datetime, timedelta
+from model import (
+    SystemResourceData, SystemResourceDataListAdapter, HostResponse, HostMetricResponse, ContainerResponse, ContainerStateResponse,
+    RollupPoint, BatchItemResult, BatchResourceResponse, TopContainerResponse, UsageGroupResponse
+)
+from database import (
+    get_session, run_db, run_db_task, rollback_db, startup_db, shutdown_db, ASYNC_MODE, PARTITIONING_ENABLED,
+    save_resource_data, save_resource_batch, get_all_hosts, get_host, get_containers_page,
+    get_host_metrics_page, get_latest_host_metric, get_series_cache_stats,
+    iter_container_chunks, EXPORT_COLUMNS, HOST_METRIC_COLUMNS,
+    RESOLUTIONS, HOST_WATERMARK_NAME, choose_resolution, get_watermark, get_container_rollups, get_host_rollups,
+    AGGREGATE_METRICS, GROUP_FIELDS, get_top_containers, get_usage_by_group
+)
+from services import (
+    ingest_queue, QUEUE_MODE, latest_state, LATEST_STATE_ENABLED,
+    rollup_worker, ROLLUP_ENABLED, retention_worker, RETENTION_ENABLED, partition_maintenance, config_reloader,
+    db_health, query_cache, live_stream, STREAM_ENABLED
+)
+from config.config import config, get_app_config
+from utils import (
+    make_json_result, log_received_data, log_exception_with_traceback,
+    encode_cursor, decode_cursor, stream_export, accepts_gzip, EXPORT_MEDIA_TYPES,
+    MSGPACK_MEDIA_TYPES, is_msgpack_request, decode_msgpack_resource, RequestDecompressionMiddleware,
+    FastJSONResponse, dump_json, rows_to_dicts, ReloadableCORSMiddleware,
+    registry, MetricsMiddleware, METRICS_ENABLED, PROMETHEUS_CONTENT_TYPE, INGEST_PAYLOAD_BYTES,
+    ServerTimingMiddleware, ServerTimingRoute, server_timing
+)
 from logger import logger
+import asyncio
 import traceback
 
 # taskkill /PID 4364 /F
@@ -22,25 +46,60 @@ app = FastAPI(
     debug=app_config["debug"]
 )
 
-# CORS 설정
-cors_config = get_cors_config()
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=cors_config["allow_origins"],
-    allow_credentials=cors_config["allow_credentials"],
-    allow_methods=cors_config["allow_methods"],
-    allow_headers=cors_config["allow_headers"],
-)
+# 요청별 검증/DB/직렬화 시간 Server-Timing 헤더 ([metrics] server_timing_enabled)
+SERVER_TIMING_ENABLED = config.get_metrics_server_timing_enabled()
+if SERVER_TIMING_ENABLED:
+    app.router.route_class = ServerTimingRoute
+
+# CORS 설정 (설정을 다시 읽으면 새 [cors] 값 적용)
+app.add_middleware(ReloadableCORSMiddleware)
+
+# 수집 요청 본문 압축 해제 (Content-Encoding: gzip/zstd)
+app.add_middleware(RequestDecompressionMiddleware, max_body_bytes=config.get_ingest_max_body_mb() * 1024 * 1024)
+
+# 라우트별 요청 지연 시간 지표 (가장 바깥에서 압축 해제 시간까지 포함하여 측정)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+if SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
 
 # 데이터베이스 초기화 이벤트
 @app.on_event("startup")
 async def startup_event():
+    # 시작 작업이 모두 끝날 때까지 /ready는 503
+    app.state.ready = False
     await startup_db()
+    await db_health.start()
     logger.info("데이터베이스 연결 확인 및 테이블 초기화 완료")
-    logger.info(f"데이터베이스: {config.get_mysql_database()} (per-request 연결 방식)")
+    logger.info(f"데이터베이스: {config.get_mysql_database()} ({'async' if ASYNC_MODE else 'sync'} 모드, per-request 세션)")
+    if LATEST_STATE_ENABLED:
+        await latest_state.warm_up()
+    if QUEUE_MODE:
+        await ingest_queue.start()
+    if ROLLUP_ENABLED:
+        rollup_worker.start()
+    if RETENTION_ENABLED:
+        retention_worker.start()
+    if PARTITIONING_ENABLED:
+        partition_maintenance.start()
+    config_reloader.start()
+    app.state.ready = True
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    # 종료 중에는 로드밸런서가 새 요청을 보내지 않도록 /ready를 먼저 503으로 전환
+    app.state.ready = False
+    await config_reloader.stop()
+    await db_health.stop()
+    if PARTITIONING_ENABLED:
+        await partition_maintenance.stop()
+    if RETENTION_ENABLED:
+        await retention_worker.stop()
+    if ROLLUP_ENABLED:
+        await rollup_worker.stop()
+    if QUEUE_MODE:
+        # 큐에 남은 데이터를 모두 저장한 뒤 엔진 정리
+        await ingest_queue.stop()
     await shutdown_db()
     logger.info("데이터베이스 엔진 리소스 정리 완료")
 
@@ -54,167 +113,815 @@ def read_root():
 
 @app.get("/health")
 def health_check():
-    """서버 상태를 확인합니다."""
+    """
+    서버 상태를 확인합니다.
+    
+    DB 상태는 백그라운드 확인 작업의 마지막 결과를 사용하므로 이 요청은 DB 연결을 열지 않습니다.
+    DB에 연결할 수 없어도 서버 프로세스는 동작 중이므로 200으로 응답하고 status만 unhealthy로 표시합니다.
+    """
     return {
-        "status": "healthy", 
+        "status": "healthy" if db_health.ok else "unhealthy",
         "timestamp": datetime.utcnow(),
-        "version": config.get_app_version()
+        "version": config.get_app_version(),
+        "database": db_health.stats()
+    }
+
+@app.get("/ready")
+def readiness_check(response: Response):
+    """
+    로드밸런서용 준비 상태를 확인합니다.
+    
+    시작 작업(테이블 확인, 연결 풀 미리 열기 등)이 끝났고 마지막 DB 상태 확인이 성공했으면 200,
+    아니면 503을 반환합니다. /health와 마찬가지로 DB 연결을 열지 않습니다.
+    """
+    started = getattr(app.state, "ready", False)
+    ready = started and db_health.ok
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {
+        "status": "ready" if ready else "not_ready",
+        "started": started,
+        "database": db_health.stats()
     }
 
 @app.get("/config")
 def get_config():
     """현재 설정 정보를 반환합니다 (민감한 정보 제외)."""
+    # 응답 중간에 설정이 다시 읽혀도 한 시점의 값으로 응답하도록 스냅샷 하나에서 읽음
+    settings = config.settings
     return {
         "app": {
-            "title": config.get_app_title(),
-            "description": config.get_app_description(),
-            "version": config.get_app_version(),
-            "debug": config.get_app_debug()
+            "title": settings.app_title,
+            "description": settings.app_description,
+            "version": settings.app_version,
+            "debug": settings.app_debug
         },
         "server": {
-            "host": config.get_server_host(),
-            "port": config.get_server_port(),
-            "log_level": config.get_server_log_level()
+            "host": settings.server_host,
+            "port": settings.server_port,
+            "log_level": settings.server_log_level
         },
         "database": {
-            "echo": config.get_database_echo(),
-            "pool_size": config.get_database_pool_size(),
-            "max_overflow": config.get_database_max_overflow()
+            "echo": settings.database_echo,
+            "pool_size": settings.database_pool_size,
+            "max_overflow": settings.database_max_overflow,
+            "mode": settings.database_mode,
+            "partitioning": settings.database_partitioning
         },
         "mysql": {
-            "host": config.get_mysql_host(),
-            "port": config.get_mysql_port(),
-            "user": config.get_mysql_user(),
-            "database": config.get_mysql_database(),
-            "charset": config.get_mysql_charset()
+            "host": settings.mysql_host,
+            "port": settings.mysql_port,
+            "user": settings.mysql_user,
+            "database": settings.mysql_database,
+            "charset": settings.mysql_charset
             # password는 보안상 제외
         },
         "cors": {
-            "allow_origins": config.get_cors_allow_origins(),
-            "allow_methods": config.get_cors_allow_methods(),
-            "allow_credentials": config.get_cors_allow_credentials()
+            "allow_origins": settings.cors_allow_origins,
+            "allow_methods": settings.cors_allow_methods,
+            "allow_credentials": settings.cors_allow_credentials
+        },
+        "monitoring": {
+            "cleanup_enabled": settings.monitoring_cleanup_enabled,
+            "data_retention_days": settings.monitoring_data_retention_days,
+            "max_records_per_host": settings.monitoring_max_records_per_host,
+            "cleanup_interval_hours": settings.monitoring_cleanup_interval_hours
         },
         "logging": {
-            "level": config.get_logging_level(),
-            "file_path": config.get_logging_file_path()
-        }
+            "level": settings.logging_level,
+            "file_path": settings.logging_file_path,
+            "payload_mode": settings.logging_payload_mode,
+            "payload_sample_rate": settings.logging_payload_sample_rate
+        },
+        "reload": config_reloader.stats()
     }
 
 # Agent로부터 자원 사용량 데이터를 받는 엔드포인트
-@app.post("/api/resources", response_model=dict)
+def _inline_schema_refs(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """pydantic JSON 스키마의 $defs 참조를 펼쳐 OpenAPI 문서에 그대로 넣을 수 있게 합니다."""
+    definitions = schema.pop("$defs", {})
+    
+    def resolve(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+    
+    return resolve(schema)
+
+# /api/resources 요청 본문 스키마 (본문을 직접 파싱하므로 OpenAPI 문서에 명시)
+_RESOURCE_BODY_SCHEMA = _inline_schema_refs(SystemResourceData.model_json_schema())
+_RESOURCE_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {"schema": _RESOURCE_BODY_SCHEMA},
+        MSGPACK_MEDIA_TYPES[0]: {"schema": _RESOURCE_BODY_SCHEMA}
+    }
+}
+_BATCH_REQUEST_BODY = {
+    "required": True,
+    "content": {"application/json": {"schema": {"type": "array", "items": _RESOURCE_BODY_SCHEMA}}}
+}
+# 배치 중 잘못된 항목이 있을 때 항목별 검증으로 넘어가기 위한 검증기
+_BATCH_PAYLOADS_ADAPTER = TypeAdapter(List[Dict[str, Any]])
+
+def _to_request_validation_error(error: ValidationError) -> RequestValidationError:
+    return RequestValidationError(
+        [{**err, "loc": ("body", *err["loc"])} for err in error.errors(include_url=False)]
+    )
+
+async def _parse_resource_body(request: Request) -> SystemResourceData:
+    """
+    요청 본문을 Content-Type에 따라 JSON 또는 MessagePack으로 해석하여 검증합니다.
+    
+    JSON은 중간 dict 없이 model_validate_json으로 바로 검증하며,
+    MessagePack은 containers를 필드별 배열(columnar)로 보낼 수 있습니다.
+    """
+    body = await request.body()
+    msgpack_body = is_msgpack_request(request.headers.get("content-type"))
+    INGEST_PAYLOAD_BYTES.observe(len(body), ("resources", "msgpack" if msgpack_body else "json"))
+    try:
+        with server_timing("validation"):
+            if msgpack_body:
+                return SystemResourceData.model_validate(decode_msgpack_resource(body))
+            return SystemResourceData.model_validate_json(body)
+    except ValidationError as e:
+        raise _to_request_validation_error(e)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@app.post("/api/resources", response_model=dict, openapi_extra={"requestBody": _RESOURCE_REQUEST_BODY})
 async def receive_resource_data(
-    resource_data: SystemResourceData,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db = Depends(get_session)
 ):
     """
     Agent로부터 시스템 자원 사용량 데이터를 받아 데이터베이스에 저장합니다.
+    
+    본문은 JSON(기본) 또는 application/msgpack이며, Content-Encoding gzip/zstd 압축을 지원합니다.
+    
+    [ingest] mode = queue 인 경우 수집 큐에 적재하고 즉시 202를 반환하며,
+    실제 저장은 백그라운드 flusher가 일괄 처리합니다.
     """
+    resource_data = await _parse_resource_body(request)
     try:
         # 수신된 데이터 로깅
         log_received_data(resource_data.host, resource_data.containers, logger)
         
-        # 호스트 정보 처리
-        host_data = resource_data.host
-        
-        # 기존 호스트 확인
-        existing_host = db.query(Host).filter(Host.host_name == host_data.host_name).first()
-        
-        if existing_host:
-            # 기존 호스트 정보 업데이트
-            existing_host.cpu_percentage = host_data.cpu_percentage
-            existing_host.cpu_cores = host_data.cpu_cores
-            existing_host.cpu_threads = host_data.cpu_threads
-            existing_host.memory_usage = host_data.memory_usage
-            existing_host.memory_percentage = host_data.memory_percentage
-            existing_host.get_datetime = datetime.strptime(host_data.get_datetime, "%Y-%m-%d %H:%M:%S")
-            host_record = existing_host
-        else:
-            # 새로운 호스트 생성
-            host_record = Host(
-                host_name=host_data.host_name,
-                cpu_percentage=host_data.cpu_percentage,
-                cpu_cores=host_data.cpu_cores,
-                cpu_threads=host_data.cpu_threads,
-                memory_usage=host_data.memory_usage,
-                memory_percentage=host_data.memory_percentage,
-                get_datetime=datetime.strptime(host_data.get_datetime, "%Y-%m-%d %H:%M:%S")
-            )
-            db.add(host_record)
-        
-        db.commit()
-        db.refresh(host_record)
-        
-        # 컨테이너 정보 처리
-        container_records = []
-        for container_data in resource_data.containers:
-            container_record = Container(
-                engine_type=container_data.engine_type,
-                cluster_name=container_data.cluster_name,
-                node_name=container_data.node_name,
-                container_name=container_data.container_name,
-                status=container_data.status,
-                cpu_percentage=container_data.cpu_percentage,
-                memory_usage=container_data.memory_usage,
-                memory_percentage=container_data.memory_percentage,
-                get_datetime=datetime.strptime(container_data.get_datetime, "%Y-%m-%d %H:%M:%S"),
-                host_id=host_record.id
-            )
-            db.add(container_record)
-            container_records.append(container_record)
+        if QUEUE_MODE:
+            if not ingest_queue.put_nowait(resource_data):
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="수집 큐가 가득 찼습니다. 잠시 후 다시 시도해주세요.",
+                    headers={"Retry-After": "1"}
+                )
+            response.status_code = status.HTTP_202_ACCEPTED
+            return {
+                "status": "accepted",
+                "message": "자원 사용량 데이터가 수집 큐에 적재되었습니다.",
+                "containers_count": len(resource_data.containers),
+                "queue_depth": ingest_queue.depth,
+                "timestamp": datetime.utcnow()
+            }
         
-        db.commit()
+        # 호스트 upsert + 컨테이너 bulk INSERT를 하나의 트랜잭션으로 처리
+        host_data = resource_data.host
+        host_id, containers_count = await run_db(db, save_resource_data, resource_data)
+        if LATEST_STATE_ENABLED:
+            latest_state.update(host_id, resource_data)
+        if STREAM_ENABLED:
+            live_stream.publish(host_id, resource_data)
         
-        logger.info(f"호스트 '{host_data.host_name}'의 자원 사용량 데이터가 성공적으로 저장되었습니다. 컨테이너 수: {len(container_records)}")
+        logger.info(f"호스트 '{host_data.host_name}'의 자원 사용량 데이터가 성공적으로 저장되었습니다. 컨테이너 수: {containers_count}")
         
         return {
             "status": "success",
             "message": "자원 사용량 데이터가 성공적으로 저장되었습니다.",
-            "host_id": host_record.id,
-            "containers_count": len(container_records),
+            "host_id": host_id,
+            "containers_count": containers_count,
             "timestamp": datetime.utcnow()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
+        await rollback_db(db)
         log_exception_with_traceback(e, logger, "데이터 저장 중 오류 발생")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"데이터 저장 중 오류가 발생했습니다: {str(e)}"
         )
 
+# 데이터 보존 작업 상태 조회
+@app.get("/api/maintenance/retention")
+def get_retention_status():
+    """데이터 보존 정책 설정과 최근 정리 결과(삭제 행 수, 소요 시간)를 반환합니다."""
+    return {"enabled": RETENTION_ENABLED, **retention_worker.stats()}
+
+# 파티션 유지보수 작업 상태 조회
+@app.get("/api/maintenance/partitions")
+def get_partition_status():
+    """containers 일 단위 파티셔닝 사용 여부와 최근 유지보수 결과(생성/삭제한 파티션)를 반환합니다."""
+    return {"enabled": PARTITIONING_ENABLED, **partition_maintenance.stats()}
+
+# Prometheus 지표 조회
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """요청 지연 시간, 수집 행 수, 본문 크기, COMMIT/연결 풀 지표를 Prometheus 텍스트 형식으로 반환합니다."""
+    if not METRICS_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="지표 수집이 비활성화되어 있습니다. ([metrics] enabled)"
+        )
+    return Response(content=registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+# 수집 큐 상태 조회
+@app.get("/api/ingest/stats")
+def get_ingest_stats():
+    """수집 큐 깊이, flush 지연 시간 등 write-behind 수집 상태를 반환합니다."""
+    return {"mode": config.get_ingest_mode(), **ingest_queue.stats(), "series_cache": get_series_cache_stats()}
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in error.errors()
+    )
+
+# Agent가 버퍼링한 여러 스냅샷을 한 번에 받는 엔드포인트
+@app.post(
+    "/api/resources/batch", response_model=BatchResourceResponse,
+    openapi_extra={"requestBody": _BATCH_REQUEST_BODY}
+)
+async def receive_resource_batch(
+    request: Request,
+    db = Depends(get_session)
+):
+    """
+    여러 호스트의 자원 사용량 스냅샷 리스트를 받아 하나의 트랜잭션으로 저장합니다.
+    
+    항목별로 검증하므로 잘못된 스냅샷이 있어도 나머지는 저장되며,
+    응답의 results에 항목별 성공/실패가 입력 순서대로 담깁니다.
+    모든 항목이 올바르면 미리 만든 리스트 검증기로 본문 전체를 한 번에 검증합니다.
+    """
+    body = await request.body()
+    INGEST_PAYLOAD_BYTES.observe(len(body), ("batch", "json"))
+    results: List[BatchItemResult] = []
+    valid_payloads: List[SystemResourceData] = []
+    valid_results: List[BatchItemResult] = []
+    
+    with server_timing("validation"):
+        try:
+            valid_payloads = SystemResourceDataListAdapter.validate_json(body)
+        except ValidationError:
+            try:
+                payloads = _BATCH_PAYLOADS_ADAPTER.validate_json(body)
+            except ValidationError as e:
+                raise _to_request_validation_error(e)
+        
+            for index, payload in enumerate(payloads):
+                host = payload.get("host")
+                host_name = host.get("host_name") if isinstance(host, dict) else None
+                try:
+                    resource_data = SystemResourceData.model_validate(payload)
+                except ValidationError as e:
+                    results.append(BatchItemResult(index=index, success=False, host_name=host_name, error=_format_validation_error(e)))
+                    continue
+            
+                item_result = BatchItemResult(index=index, success=False, host_name=resource_data.host.host_name)
+                results.append(item_result)
+                valid_payloads.append(resource_data)
+                valid_results.append(item_result)
+        else:
+            valid_results = [
+                BatchItemResult(index=index, success=False, host_name=resource_data.host.host_name)
+                for index, resource_data in enumerate(valid_payloads)
+            ]
+            results = list(valid_results)
+    
+    try:
+        saved = await run_db(db, save_resource_batch, valid_payloads)
+    except Exception as e:
+        await rollback_db(db)
+        log_exception_with_traceback(e, logger, "배치 데이터 저장 중 오류 발생")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"배치 데이터 저장 중 오류가 발생했습니다: {str(e)}"
+        )
+    
+    for resource_data, item_result, saved_item in zip(valid_payloads, valid_results, saved):
+        if "error" in saved_item:
+            item_result.error = saved_item["error"]
+        else:
+            if LATEST_STATE_ENABLED:
+                latest_state.update(saved_item["host_id"], resource_data)
+            if STREAM_ENABLED:
+                live_stream.publish(saved_item["host_id"], resource_data)
+            item_result.success = True
+            item_result.host_id = saved_item["host_id"]
+            item_result.containers_count = saved_item["containers_count"]
+    
+    succeeded = sum(1 for item in results if item.success)
+    failed = len(results) - succeeded
+    logger.info(f"배치 데이터 수신: 총 {len(results)}건, 성공 {succeeded}건, 실패 {failed}건")
+    
+    return BatchResourceResponse(
+        status="success" if failed == 0 else ("partial" if succeeded else "failed"),
+        total=len(results),
+        succeeded=succeeded,
+        failed=failed,
+        results=results,
+        timestamp=datetime.utcnow()
+    )
+
 # 호스트 목록 조회
 @app.get("/api/hosts", response_model=List[HostResponse])
-async def get_hosts(db: Session = Depends(get_db)):
+async def get_hosts(db = Depends(get_session)):
     """
-    등록된 모든 호스트 정보를 조회합니다.
+    등록된 모든 호스트 정보를 가장 최근 자원 사용량과 함께 조회합니다.
     """
-    hosts = db.query(Host).all()
-    return hosts
+    hosts = await run_db(db, get_all_hosts)
+    return FastJSONResponse(hosts)
 
-# 특정 호스트의 컨테이너 조회
-@app.get("/api/hosts/{host_id}/containers", response_model=List[ContainerResponse])
-async def get_host_containers(host_id: int, db: Session = Depends(get_db)):
+class ContainerFilterParams:
+    """컨테이너 조회 API의 필터 쿼리 파라미터"""
+    
+    def __init__(
+        self,
+        since: Optional[datetime] = Query(None, description="조회 시작 시각 (이상)"),
+        until: Optional[datetime] = Query(None, description="조회 종료 시각 (미만)"),
+        cluster_name: Optional[str] = Query(None),
+        node_name: Optional[str] = Query(None),
+        container_name: Optional[str] = Query(None),
+        status: Optional[str] = Query(None)
+    ):
+        self.since = since
+        self.until = until
+        self.cluster_name = cluster_name
+        self.node_name = node_name
+        self.container_name = container_name
+        self.status = status
+    
+    def to_filters(self) -> Dict[str, Any]:
+        return {
+            "since": self.since,
+            "until": self.until,
+            "cluster_name": self.cluster_name,
+            "node_name": self.node_name,
+            "container_name": self.container_name,
+            "status": self.status
+        }
+
+class PageParams:
+    """keyset 페이지네이션 쿼리 파라미터"""
+    
+    def __init__(
+        self,
+        limit: int = Query(config.get_api_default_page_size(), ge=1, le=config.get_api_max_page_size(), description="페이지당 최대 행 수"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값")
+    ):
+        self.limit = limit
+        self.cursor = cursor
+
+def _decode_page_cursor(page: PageParams):
+    if not page.cursor:
+        return None
+    try:
+        return decode_cursor(page.cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+def _set_next_cursor(request: Request, response: Response, get_datetime: datetime, record_id: int) -> None:
+    # 다음 페이지 커서는 응답 헤더로 전달 (응답 본문 형식은 기존과 동일)
+    next_cursor = encode_cursor(get_datetime, record_id)
+    response.headers["X-Next-Cursor"] = next_cursor
+    response.headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
+
+async def _get_containers_page(
+    db,
+    page: PageParams,
+    filters: ContainerFilterParams,
+    request: Request,
+    host_id: Optional[int] = None
+) -> FastJSONResponse:
+    # ContainerResponse 필드 순서의 컬럼 튜플을 재검증 없이 바로 직렬화
+    containers, has_more = await run_db(
+        db, get_containers_page,
+        limit=page.limit,
+        after=_decode_page_cursor(page),
+        host_id=host_id,
+        **filters.to_filters()
+    )
+    response = FastJSONResponse(rows_to_dicts(EXPORT_COLUMNS, containers))
+    if has_more:
+        _set_next_cursor(request, response, containers[-1].get_datetime, containers[-1].id)
+    return response
+
+# 컨테이너 기록 내보내기 (스트리밍)
+@app.get("/api/containers/export")
+def export_containers(
+    request: Request,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson 또는 csv"),
+    compress: bool = Query(True, description="gzip 압축 여부 (Accept-Encoding에 gzip이 있을 때만 Content-Encoding: gzip으로 압축)"),
+    host_id: Optional[int] = Query(None),
+    filters: ContainerFilterParams = Depends()
+):
     """
-    특정 호스트의 모든 컨테이너 정보를 조회합니다.
+    컨테이너 기록을 NDJSON 또는 CSV로 스트리밍합니다.
+    
+    서버 사이드 커서로 [api] export_chunk_size 행씩 읽어 바로 인코딩/압축하여 전송하므로
+    조회 범위가 커져도 서버 메모리 사용량이 일정합니다.
+    gzip 압축은 클라이언트의 Accept-Encoding이 gzip을 허용할 때만 적용합니다.
     """
-    host = db.query(Host).filter(Host.id == host_id).first()
+    chunks = iter_container_chunks(config.get_api_export_chunk_size(), host_id=host_id, **filters.to_filters())
+    compress = compress and accepts_gzip(request.headers.get("accept-encoding", ""))
+    headers = {
+        "Content-Disposition": f'attachment; filename="containers_{datetime.utcnow():%Y%m%d%H%M%S}.{export_format}"',
+        "Vary": "Accept-Encoding"
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    
+    return StreamingResponse(
+        stream_export(EXPORT_COLUMNS, chunks, export_format, compress),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers=headers
+    )
+
+def _require_latest_state():
+    if not LATEST_STATE_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="최신 상태 캐시가 비활성화되어 있습니다. ([cache] latest_state_enabled)"
+        )
+
+# 호스트별 최신 상태 조회 (메모리 캐시)
+@app.get("/api/hosts/latest", response_model=List[HostResponse])
+async def get_latest_hosts():
+    """
+    모든 호스트의 가장 최근 스냅샷을 메모리 캐시에서 조회합니다 (DB 조회 없음).
+    """
+    _require_latest_state()
+    return latest_state.get_hosts()
+
+# 특정 호스트의 컨테이너 최신 상태 조회 (메모리 캐시)
+@app.get("/api/hosts/{host_id}/containers/latest", response_model=List[ContainerStateResponse])
+async def get_latest_host_containers(host_id: int):
+    """
+    특정 호스트의 컨테이너별 가장 최근 스냅샷을 메모리 캐시에서 조회합니다 (DB 조회 없음).
+    """
+    _require_latest_state()
+    if latest_state.get_host(host_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"호스트 ID {host_id}를 찾을 수 없습니다."
+        )
+    return latest_state.get_containers(host_id)
+
+# 전체 컨테이너 최신 상태 조회 (메모리 캐시)
+@app.get("/api/containers/latest", response_model=List[ContainerStateResponse])
+async def get_latest_containers():
+    """
+    모든 호스트의 컨테이너별 가장 최근 스냅샷을 메모리 캐시에서 조회합니다 (DB 조회 없음).
+    """
+    _require_latest_state()
+    return latest_state.get_containers()
+
+class AggregateFilterParams:
+    """집계 조회 API의 조회 구간/필터 쿼리 파라미터"""
+    
+    def __init__(
+        self,
+        minutes: int = Query(15, ge=1, le=10080, description="최근 몇 분 동안의 기록을 집계할지 (최대 7일)"),
+        host_id: Optional[int] = Query(None),
+        cluster_name: Optional[str] = Query(None),
+        node_name: Optional[str] = Query(None),
+        engine_type: Optional[str] = Query(None)
+    ):
+        self.minutes = minutes
+        self.host_id = host_id
+        self.cluster_name = cluster_name
+        self.node_name = node_name
+        self.engine_type = engine_type
+    
+    def cache_key(self) -> tuple:
+        # 시각이 아닌 구간 길이로 키를 만들어 같은 조건의 요청이 TTL 동안 결과를 공유
+        return (self.minutes, self.host_id, self.cluster_name, self.node_name, self.engine_type)
+    
+    def to_filters(self) -> Dict[str, Any]:
+        return {
+            "since": datetime.utcnow() - timedelta(minutes=self.minutes),
+            "host_id": self.host_id,
+            "cluster_name": self.cluster_name,
+            "node_name": self.node_name,
+            "engine_type": self.engine_type
+        }
+
+def _cached_response(result: List[Dict[str, Any]], cache_status: str) -> FastJSONResponse:
+    response = FastJSONResponse(result)
+    response.headers["X-Cache"] = cache_status
+    return response
+
+# 사용량 상위 컨테이너 조회
+@app.get("/api/containers/top", response_model=List[TopContainerResponse])
+async def get_top_container_usage(
+    metric: str = Query("cpu_percentage", pattern=f"^({'|'.join(AGGREGATE_METRICS)})$", description="순위를 매길 지표"),
+    function: str = Query("avg", pattern="^(avg|max)$", description="구간 내 집계 방식"),
+    limit: int = Query(10, ge=1, le=100, description="최대 컨테이너 수"),
+    filters: AggregateFilterParams = Depends()
+):
+    """
+    최근 minutes분 동안 metric의 평균/최대 값이 큰 컨테이너를 조회합니다.
+
+    집계는 DB에서 수행하며, 같은 조건의 요청은 [cache] query_ttl_seconds 동안 결과를 공유합니다.
+    X-Cache 헤더: HIT(캐시 결과), SHARED(진행 중인 계산 결과), MISS(새로 계산)
+    """
+    result, cache_status = await query_cache.get_or_compute(
+        ("top", metric, function, limit, *filters.cache_key()),
+        lambda: run_db_task(get_top_containers, metric=metric, function=function, limit=limit, **filters.to_filters())
+    )
+    return _cached_response(result, cache_status)
+
+# 그룹별 사용량 조회
+@app.get("/api/containers/usage", response_model=List[UsageGroupResponse])
+async def get_grouped_container_usage(
+    group_by: str = Query("cluster_name", pattern=f"^({'|'.join(GROUP_FIELDS)})$", description="묶을 필드"),
+    filters: AggregateFilterParams = Depends()
+):
+    """
+    최근 minutes분 동안 컨테이너별 평균 사용량을 group_by 필드별 합계/평균으로 조회합니다.
+
+    같은 조건의 요청은 [cache] query_ttl_seconds 동안 결과를 공유합니다. (X-Cache 헤더)
+    """
+    result, cache_status = await query_cache.get_or_compute(
+        ("usage", group_by, *filters.cache_key()),
+        lambda: run_db_task(get_usage_by_group, group_by=group_by, **filters.to_filters())
+    )
+    return _cached_response(result, cache_status)
+
+class StreamFilterParams:
+    """실시간 전송 구독 조건 쿼리 파라미터 (클러스터/컨테이너 조건이 있으면 호스트 샘플은 보내지 않음)"""
+    
+    def __init__(
+        self,
+        host_id: Optional[int] = Query(None),
+        cluster_name: Optional[str] = Query(None),
+        container_name: Optional[str] = Query(None)
+    ):
+        self.host_id = host_id
+        self.cluster_name = cluster_name
+        self.container_name = container_name
+    
+    def to_filters(self) -> Dict[str, Any]:
+        return {"host_id": self.host_id, "cluster_name": self.cluster_name, "container_name": self.container_name}
+
+def _encode_sse(events: List[Dict[str, Any]]) -> bytes:
+    return b"".join(b"event: " + event["type"].encode() + b"\ndata: " + dump_json(event["data"]) + b"\n\n" for event in events)
+
+async def _stream_sse(subscriber):
+    heartbeat_seconds = config.get_stream_heartbeat_seconds()
+    try:
+        while not subscriber.closed:
+            events = await subscriber.next_batch(heartbeat_seconds)
+            # 보낼 샘플이 없으면 주석 행으로 연결 유지 (프록시 유휴 연결 종료 방지)
+            yield _encode_sse(events) if events else b": keep-alive\n\n"
+    finally:
+        live_stream.unsubscribe(subscriber)
+
+# 수집 샘플 실시간 전송 (Server-Sent Events)
+@app.get("/api/stream")
+async def stream_samples(filters: StreamFilterParams = Depends()):
+    """
+    새로 저장된 호스트/컨테이너 샘플을 Server-Sent Events로 전송합니다.
+
+    이벤트 종류: host, container, dropped(느린 구독자 버퍼에서 버려지거나 최신 샘플로 대체된 샘플 수)
+    """
+    if not STREAM_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="실시간 전송이 비활성화되어 있습니다. ([stream] enabled)"
+        )
+    subscriber = live_stream.subscribe(**filters.to_filters())
+    if subscriber is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="실시간 전송 구독자 수가 상한에 도달했습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "5"}
+        )
+    return StreamingResponse(
+        _stream_sse(subscriber),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+async def _wait_websocket_close(websocket: WebSocket, subscriber) -> None:
+    # 클라이언트 메시지는 사용하지 않고, 연결 종료만 감지하여 전송 루프를 끝냄
+    try:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
+        subscriber.close()
+
+# 수집 샘플 실시간 전송 (WebSocket)
+@app.websocket("/api/stream/ws")
+async def stream_samples_websocket(websocket: WebSocket, filters: StreamFilterParams = Depends()):
+    """
+    새로 저장된 샘플을 WebSocket으로 전송합니다.
+
+    메시지마다 [{"type": "host" | "container" | "dropped", "data": {...}}, ...] 형식의 이벤트 묶음을 보냅니다.
+    """
+    if not STREAM_ENABLED:
+        await websocket.close(code=1008, reason="stream disabled")
+        return
+    subscriber = live_stream.subscribe(**filters.to_filters())
+    if subscriber is None:
+        # 1013: Try Again Later
+        await websocket.close(code=1013, reason="too many subscribers")
+        return
+    
+    await websocket.accept()
+    receiver = asyncio.create_task(_wait_websocket_close(websocket, subscriber))
+    heartbeat_seconds = config.get_stream_heartbeat_seconds()
+    try:
+        while not subscriber.closed:
+            events = await subscriber.next_batch(heartbeat_seconds)
+            if not subscriber.closed:
+                # 보낼 샘플이 없으면 빈 묶음([])으로 연결 유지
+                await websocket.send_text(dump_json(events).decode())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        live_stream.unsubscribe(subscriber)
+        receiver.cancel()
+
+# 실시간 전송 상태 조회
+@app.get("/api/stream/stats")
+def get_stream_stats():
+    """구독자별 조건, 버퍼에 쌓인 샘플 수, 버려진 샘플 수를 반환합니다."""
+    return live_stream.stats()
+
+def _resolve_rollup_range(resolution: str, since: datetime, until: Optional[datetime]):
+    until = until or datetime.utcnow()
+    if since >= until:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="since는 until보다 이전이어야 합니다.")
+    if resolution == "auto":
+        resolution = choose_resolution(since, until, config.get_rollup_max_points())
+    return resolution, until
+
+# 컨테이너 롤업 조회
+@app.get("/api/rollups/containers", response_model=List[RollupPoint])
+async def get_container_rollup_series(
+    request: Request,
+    response: Response,
+    since: datetime = Query(..., description="조회 시작 시각 (이상)"),
+    until: Optional[datetime] = Query(None, description="조회 종료 시각 (미만, 기본값: 현재)"),
+    resolution: str = Query("auto", pattern="^(auto|1m|5m|1h)$", description="auto면 조회 범위에 맞춰 자동 선택"),
+    host_id: Optional[int] = Query(None),
+    container_name: Optional[str] = Query(None),
+    page: PageParams = Depends(),
+    db = Depends(get_session)
+):
+    """
+    컨테이너별 1m/5m/1h 롤업(min/avg/max/last)을 버킷 시각순으로 페이지 단위 조회합니다.
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더의 값을 cursor 파라미터로 전달합니다.
+    """
+    resolution, until = _resolve_rollup_range(resolution, since, until)
+    points, next_after = await run_db(
+        db, get_container_rollups,
+        resolution=resolution, since=since, until=until, limit=page.limit,
+        host_id=host_id, container_name=container_name, after=_decode_page_cursor(page)
+    )
+    if next_after is not None:
+        _set_next_cursor(request, response, *next_after)
+    return points
+
+# 호스트 롤업 조회
+@app.get("/api/rollups/hosts", response_model=List[RollupPoint])
+async def get_host_rollup_series(
+    request: Request,
+    response: Response,
+    since: datetime = Query(..., description="조회 시작 시각 (이상)"),
+    until: Optional[datetime] = Query(None, description="조회 종료 시각 (미만, 기본값: 현재)"),
+    resolution: str = Query("auto", pattern="^(auto|1m|5m|1h)$", description="auto면 조회 범위에 맞춰 자동 선택"),
+    host_id: Optional[int] = Query(None),
+    page: PageParams = Depends(),
+    db = Depends(get_session)
+):
+    """
+    호스트별 1m/5m/1h 롤업(min/avg/max/last)을 버킷 시각순으로 페이지 단위 조회합니다.
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더의 값을 cursor 파라미터로 전달합니다.
+    """
+    resolution, until = _resolve_rollup_range(resolution, since, until)
+    points, next_after = await run_db(
+        db, get_host_rollups,
+        resolution=resolution, since=since, until=until, limit=page.limit,
+        host_id=host_id, after=_decode_page_cursor(page)
+    )
+    if next_after is not None:
+        _set_next_cursor(request, response, *next_after)
+    return points
+
+# 롤업 작업 상태 조회
+@app.get("/api/rollups/status")
+async def get_rollup_status(db = Depends(get_session)):
+    """롤업 작업 실행 상태와 처리 위치(watermark)를 반환합니다."""
+    return {
+        "enabled": ROLLUP_ENABLED,
+        "resolutions": list(RESOLUTIONS),
+        "watermark": await run_db(db, get_watermark),
+        "host_watermark": await run_db(db, get_watermark, HOST_WATERMARK_NAME),
+        **rollup_worker.task.stats()
+    }
+
+async def _require_host(db, host_id: int):
+    host = await run_db(db, get_host, host_id)
     if not host:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"호스트 ID {host_id}를 찾을 수 없습니다."
         )
+    return host
+
+# 특정 호스트의 자원 사용량 기록 조회
+@app.get("/api/hosts/{host_id}/metrics", response_model=List[HostMetricResponse])
+async def get_host_metrics(
+    host_id: int,
+    request: Request,
+    since: Optional[datetime] = Query(None, description="조회 시작 시각 (이상)"),
+    until: Optional[datetime] = Query(None, description="조회 종료 시각 (미만)"),
+    page: PageParams = Depends(),
+    db = Depends(get_session)
+):
+    """
+    특정 호스트의 자원 사용량 기록을 시간순으로 페이지 단위 조회합니다.
+    
+    다음 페이지가 있으면 X-Next-Cursor 헤더의 값을 cursor 파라미터로 전달합니다.
+    """
+    await _require_host(db, host_id)
+    metrics, has_more = await run_db(
+        db, get_host_metrics_page,
+        host_id=host_id,
+        limit=page.limit,
+        after=_decode_page_cursor(page),
+        since=since,
+        until=until
+    )
+    response = FastJSONResponse(rows_to_dicts(HOST_METRIC_COLUMNS, metrics))
+    if has_more:
+        _set_next_cursor(request, response, metrics[-1].get_datetime, metrics[-1].id)
+    return response
+
+# 특정 호스트의 가장 최근 자원 사용량 조회
+@app.get("/api/hosts/{host_id}/metrics/latest", response_model=HostMetricResponse)
+async def get_host_latest_metric(host_id: int, db = Depends(get_session)):
+    """
+    특정 호스트의 가장 최근 자원 사용량 기록 1건을 조회합니다. ((host_id, get_datetime, id) 인덱스 역순 1행)
+    """
+    metric = await run_db(db, get_latest_host_metric, host_id)
+    if metric is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"호스트 ID {host_id}의 자원 사용량 기록이 없습니다."
+        )
+    return metric
+
+# 특정 호스트의 컨테이너 조회
+@app.get("/api/hosts/{host_id}/containers", response_model=List[ContainerResponse])
+async def get_host_containers(
+    host_id: int,
+    request: Request,
+    page: PageParams = Depends(),
+    filters: ContainerFilterParams = Depends(),
+    db = Depends(get_session)
+):
+    """
+    특정 호스트의 컨테이너 기록을 시간순으로 페이지 단위 조회합니다.
     
-    containers = db.query(Container).filter(Container.host_id == host_id).all()
-    return containers
+    다음 페이지가 있으면 X-Next-Cursor 헤더의 값을 cursor 파라미터로 전달합니다.
+    """
+    await _require_host(db, host_id)
+    return await _get_containers_page(db, page, filters, request, host_id=host_id)
 
 # 모든 컨테이너 조회
 @app.get("/api/containers", response_model=List[ContainerResponse])
-async def get_all_containers(db: Session = Depends(get_db)):
+async def get_all_containers(
+    request: Request,
+    page: PageParams = Depends(),
+    filters: ContainerFilterParams = Depends(),
+    db = Depends(get_session)
+):
     """
-    모든 컨테이너 정보를 조회합니다.
+    모든 컨테이너 기록을 시간순으로 페이지 단위 조회합니다.
+    
+    다음 페이지가 있으면 X-Next-Cursor 헤더의 값을 cursor 파라미터로 전달합니다.
     """
-    containers = db.query(Container).all()
-    return containers
+    return await _get_containers_page(db, page, filters, request)
 
 
 
@@ -224,7 +931,8 @@ if __name__ == "__main__":
         "host": config.get_server_host(),
         "port": config.get_server_port(),
         "reload": config.get_server_reload(),
-        "log_level": config.get_server_log_level()
+        "log_level": config.get_server_log_level(),
+        "timeout_graceful_shutdown": config.get_server_graceful_shutdown_seconds()
     }
     logger.info(f"서버 시작: {server_config}")
     uvicorn.run(app, **server_config)
\ No newline at end of file
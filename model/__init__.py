@@ -5,24 +5,52 @@ Model 패키지 - 데이터베이스 모델과 API 모델들을 관리합니다.
 from .models import (
     # SQLAlchemy 모델
     Host,
+    ContainerSeries,
     Container,
+    HostMetric,
+    ContainerRollup,
+    HostRollup,
+    RollupWatermark,
     Base,
     
     # Pydantic 모델
     HostData,
     ContainerData,
     SystemResourceData,
+    AgentDatetime,
+    SystemResourceDataListAdapter,
     HostResponse,
-    ContainerResponse
+    HostMetricResponse,
+    ContainerResponse,
+    ContainerStateResponse,
+    RollupPoint,
+    TopContainerResponse,
+    UsageGroupResponse,
+    BatchItemResult,
+    BatchResourceResponse
 )
 
 __all__ = [
     "Host",
+    "ContainerSeries",
     "Container", 
+    "HostMetric",
+    "ContainerRollup",
+    "HostRollup",
+    "RollupWatermark",
     "Base",
     "HostData",
     "ContainerData",
     "SystemResourceData",
+    "AgentDatetime",
+    "SystemResourceDataListAdapter",
     "HostResponse",
-    "ContainerResponse"
+    "HostMetricResponse",
+    "ContainerResponse",
+    "ContainerStateResponse",
+    "RollupPoint",
+    "TopContainerResponse",
+    "UsageGroupResponse",
+    "BatchItemResult",
+    "BatchResourceResponse"
 ] 
\ No newline at end of file
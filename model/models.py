@@ -1,9 +1,9 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from pydantic import BaseModel
-from datetime import datetime
-from typing import List, Optional
+from pydantic import AfterValidator, BaseModel, TypeAdapter
+from datetime import datetime, timezone
+from typing import Annotated, List, Optional
 
 Base = declarative_base()
 
@@ -23,15 +23,36 @@ class Host(Base):
     # 관계 설정
     containers = relationship("Container", back_populates="host")
 
-class Container(Base):
-    __tablename__ = "containers"
+# 컨테이너 시계열 식별 정보 (engine_type, cluster_name, node_name, container_name, status 조합당 한 행)
+# 식별 문자열을 컨테이너 기록마다 반복 저장하지 않도록 containers는 series_id만 참조합니다.
+class ContainerSeries(Base):
+    __tablename__ = "container_series"
+    __table_args__ = (
+        Index("ix_container_series_container_name", "container_name"),
+        Index("ix_container_series_cluster_node", "cluster_name", "node_name"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
+    # 식별 필드 조합의 SHA-1 (5개 VARCHAR 복합 유니크 키는 MySQL 인덱스 길이 제한을 넘으므로 해시로 대체)
+    series_hash = Column(String(40), unique=True, nullable=False)
     engine_type = Column(String(100), nullable=False)
     cluster_name = Column(String(255), nullable=False)
     node_name = Column(String(255), nullable=False)
     container_name = Column(String(255), nullable=False)
     status = Column(String(50), nullable=False)
+
+class Container(Base):
+    __tablename__ = "containers"
+    __table_args__ = (
+        # keyset 페이지네이션 (get_datetime, id) 및 시간 범위 조회용
+        Index("ix_containers_get_datetime_id", "get_datetime", "id"),
+        # 호스트별/series별 시계열 조회용
+        Index("ix_containers_host_id_get_datetime_id", "host_id", "get_datetime", "id"),
+        Index("ix_containers_series_id_get_datetime", "series_id", "get_datetime"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    series_id = Column(Integer, ForeignKey("container_series.id"), nullable=False)
     cpu_percentage = Column(Float)
     memory_usage = Column(Float)
     memory_percentage = Column(Float)
@@ -42,6 +63,105 @@ class Container(Base):
     
     # 관계 설정
     host = relationship("Host", back_populates="containers")
+    series = relationship("ContainerSeries")
+
+# 호스트 자원 사용량 기록 (보고마다 한 행씩 추가만 하며, hosts 테이블은 호스트 식별 정보만 관리)
+class HostMetric(Base):
+    __tablename__ = "host_metrics"
+    __table_args__ = (
+        # 호스트별 시계열 조회 및 최신 기록 조회용
+        Index("ix_host_metrics_host_id_get_datetime_id", "host_id", "get_datetime", "id"),
+        # 보관 기간 정리용
+        Index("ix_host_metrics_get_datetime", "get_datetime"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    host_id = Column(Integer, ForeignKey("hosts.id"), nullable=False)
+    cpu_percentage = Column(Float)
+    cpu_cores = Column(Integer)
+    cpu_threads = Column(Integer)
+    memory_usage = Column(Float)
+    memory_percentage = Column(Float)
+    get_datetime = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+# 시계열 롤업 테이블 (1m/5m/1h 버킷별 min/avg/max/last)
+# avg는 sum / {지표}_count(값이 NULL이 아닌 샘플 수)로 계산하여 버킷 병합 시에도 정확하게 유지합니다.
+class ContainerRollup(Base):
+    __tablename__ = "container_rollups"
+    __table_args__ = (
+        UniqueConstraint("resolution", "host_id", "container_name", "bucket_start", name="uq_container_rollups_key"),
+        Index("ix_container_rollups_resolution_bucket_start", "resolution", "bucket_start"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    resolution = Column(String(8), nullable=False)
+    bucket_start = Column(DateTime, nullable=False)
+    host_id = Column(Integer, ForeignKey("hosts.id"), nullable=False)
+    container_name = Column(String(255), nullable=False)
+    sample_count = Column(Integer, nullable=False, default=0)
+    cpu_percentage_count = Column(Integer, nullable=False, default=0)
+    cpu_percentage_min = Column(Float)
+    cpu_percentage_max = Column(Float)
+    cpu_percentage_sum = Column(Float)
+    cpu_percentage_last = Column(Float)
+    memory_usage_count = Column(Integer, nullable=False, default=0)
+    memory_usage_min = Column(Float)
+    memory_usage_max = Column(Float)
+    memory_usage_sum = Column(Float)
+    memory_usage_last = Column(Float)
+    memory_percentage_count = Column(Integer, nullable=False, default=0)
+    memory_percentage_min = Column(Float)
+    memory_percentage_max = Column(Float)
+    memory_percentage_sum = Column(Float)
+    memory_percentage_last = Column(Float)
+    last_datetime = Column(DateTime)
+
+class HostRollup(Base):
+    __tablename__ = "host_rollups"
+    __table_args__ = (
+        UniqueConstraint("resolution", "host_id", "bucket_start", name="uq_host_rollups_key"),
+        Index("ix_host_rollups_resolution_bucket_start", "resolution", "bucket_start"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    resolution = Column(String(8), nullable=False)
+    bucket_start = Column(DateTime, nullable=False)
+    host_id = Column(Integer, ForeignKey("hosts.id"), nullable=False)
+    sample_count = Column(Integer, nullable=False, default=0)
+    cpu_percentage_count = Column(Integer, nullable=False, default=0)
+    cpu_percentage_min = Column(Float)
+    cpu_percentage_max = Column(Float)
+    cpu_percentage_sum = Column(Float)
+    cpu_percentage_last = Column(Float)
+    memory_usage_count = Column(Integer, nullable=False, default=0)
+    memory_usage_min = Column(Float)
+    memory_usage_max = Column(Float)
+    memory_usage_sum = Column(Float)
+    memory_usage_last = Column(Float)
+    memory_percentage_count = Column(Integer, nullable=False, default=0)
+    memory_percentage_min = Column(Float)
+    memory_percentage_max = Column(Float)
+    memory_percentage_sum = Column(Float)
+    memory_percentage_last = Column(Float)
+    last_datetime = Column(DateTime)
+
+# 롤업 등 증분 처리 작업의 진행 위치 (마지막으로 처리한 원본 행 ID)
+class RollupWatermark(Base):
+    __tablename__ = "rollup_watermarks"
+    
+    name = Column(String(50), primary_key=True)
+    last_id = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+def _to_naive_utc(value: datetime) -> datetime:
+    # 시간대가 있는 값(epoch 초, ISO 8601 오프셋)은 UTC로 변환하여 DB의 naive datetime과 맞춤
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+# Agent 수집 시각: "%Y-%m-%d %H:%M:%S" 문자열, ISO 8601 문자열, epoch 초(int/float)를 받아
+# pydantic-core가 검증 단계에서 바로 datetime으로 변환합니다.
+AgentDatetime = Annotated[datetime, AfterValidator(_to_naive_utc)]
 
 # Pydantic 모델 (API 요청/응답용)
 class HostData(BaseModel):
@@ -51,7 +171,7 @@ class HostData(BaseModel):
     cpu_threads: int
     memory_usage: float
     memory_percentage: float
-    get_datetime: str
+    get_datetime: AgentDatetime
 
 class ContainerData(BaseModel):
     engine_type: str
@@ -62,12 +182,15 @@ class ContainerData(BaseModel):
     cpu_percentage: float
     memory_usage: float
     memory_percentage: float
-    get_datetime: str
+    get_datetime: AgentDatetime
 
 class SystemResourceData(BaseModel):
     host: HostData
     containers: List[ContainerData]
 
+# 미리 만들어 둔 배치 검증기 - 요청마다 스키마를 다시 만들지 않고 리스트 전체를 한 번에 검증합니다.
+SystemResourceDataListAdapter = TypeAdapter(List[SystemResourceData])
+
 # 응답 모델
 class HostResponse(BaseModel):
     id: int
@@ -82,6 +205,19 @@ class HostResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class HostMetricResponse(BaseModel):
+    id: int
+    host_id: int
+    cpu_percentage: float
+    cpu_cores: int
+    cpu_threads: int
+    memory_usage: float
+    memory_percentage: float
+    get_datetime: datetime
+    
+    class Config:
+        from_attributes = True
+
 class ContainerResponse(BaseModel):
     id: int
     engine_type: str
@@ -98,4 +234,75 @@ class ContainerResponse(BaseModel):
     class Config:
         from_attributes = True
 
- 
\ No newline at end of file
+ 
+# 최신 상태 응답 모델 (메모리 캐시에서 제공하므로 컨테이너 행 ID 없음)
+class ContainerStateResponse(BaseModel):
+    host_id: int
+    engine_type: str
+    cluster_name: str
+    node_name: str
+    container_name: str
+    status: str
+    cpu_percentage: float
+    memory_usage: float
+    memory_percentage: float
+    get_datetime: datetime
+
+# 롤업 조회 응답 모델
+class RollupPoint(BaseModel):
+    resolution: str
+    bucket_start: datetime
+    host_id: int
+    container_name: Optional[str] = None
+    sample_count: int
+    cpu_percentage_min: Optional[float] = None
+    cpu_percentage_avg: Optional[float] = None
+    cpu_percentage_max: Optional[float] = None
+    cpu_percentage_last: Optional[float] = None
+    memory_usage_min: Optional[float] = None
+    memory_usage_avg: Optional[float] = None
+    memory_usage_max: Optional[float] = None
+    memory_usage_last: Optional[float] = None
+    memory_percentage_min: Optional[float] = None
+    memory_percentage_avg: Optional[float] = None
+    memory_percentage_max: Optional[float] = None
+    memory_percentage_last: Optional[float] = None
+
+# 집계 조회 응답 모델
+class TopContainerResponse(BaseModel):
+    host_id: int
+    engine_type: str
+    cluster_name: str
+    node_name: str
+    container_name: str
+    value: Optional[float] = None
+    sample_count: int
+    last_seen: datetime
+
+class UsageGroupResponse(BaseModel):
+    group: str
+    container_count: int
+    sample_count: int
+    cpu_percentage_sum: Optional[float] = None
+    cpu_percentage_avg: Optional[float] = None
+    memory_usage_sum: Optional[float] = None
+    memory_usage_avg: Optional[float] = None
+    memory_percentage_sum: Optional[float] = None
+    memory_percentage_avg: Optional[float] = None
+
+# 배치 수집 응답 모델
+class BatchItemResult(BaseModel):
+    index: int
+    success: bool
+    host_name: Optional[str] = None
+    host_id: Optional[int] = None
+    containers_count: int = 0
+    error: Optional[str] = None
+
+class BatchResourceResponse(BaseModel):
+    status: str
+    total: int
+    succeeded: int
+    failed: int
+    results: List[BatchItemResult]
+    timestamp: datetime
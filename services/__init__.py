@@ -0,0 +1,42 @@
+"""
+Services 패키지 - 백그라운드 작업 등 서버 내부에서 동작하는 구성 요소들을 관리합니다.
+"""
+
+from .background import PeriodicTask
+from .latest_state import LatestStateCache, latest_state, LATEST_STATE_ENABLED
+from .ingest_queue import IngestQueue, ingest_queue, QUEUE_MODE
+from .rollup import RollupWorker, rollup_worker, ROLLUP_ENABLED
+from .retention import RetentionWorker, retention_worker, RETENTION_ENABLED
+from .partition import PartitionMaintenance, partition_maintenance
+from .config_reload import ConfigReloader, config_reloader
+from .db_health import DatabaseHealthProbe, db_health
+from .query_cache import QueryCache, query_cache
+from .live_stream import StreamSubscriber, LiveStreamHub, live_stream, STREAM_ENABLED
+
+__all__ = [
+    "PeriodicTask",
+    "LatestStateCache",
+    "latest_state",
+    "LATEST_STATE_ENABLED",
+    "IngestQueue",
+    "ingest_queue",
+    "QUEUE_MODE",
+    "RollupWorker",
+    "rollup_worker",
+    "ROLLUP_ENABLED",
+    "RetentionWorker",
+    "retention_worker",
+    "RETENTION_ENABLED",
+    "PartitionMaintenance",
+    "partition_maintenance",
+    "ConfigReloader",
+    "config_reloader",
+    "DatabaseHealthProbe",
+    "db_health",
+    "QueryCache",
+    "query_cache",
+    "StreamSubscriber",
+    "LiveStreamHub",
+    "live_stream",
+    "STREAM_ENABLED"
+]
@@ -0,0 +1,98 @@
+"""
+주기 작업 - 일정 간격으로 실행되는 백그라운드 작업을 관리합니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+class PeriodicTask:
+    """
+    interval_seconds마다 비동기 함수를 실행하는 백그라운드 작업.
+
+    한 번의 실행이 끝난 뒤 다음 실행까지 interval_seconds를 기다리므로 실행이 겹치지 않으며,
+    실행 중 예외가 발생해도 로그만 남기고 다음 주기에 다시 실행합니다.
+    """
+
+    def __init__(self, name: str, interval_seconds: float, func: Callable[[], Awaitable[Any]], run_immediately: bool = False):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.func = func
+        self.run_immediately = run_immediately
+
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+
+        self.run_count = 0
+        self.failure_count = 0
+        self.last_started_at: Optional[float] = None
+        self.last_duration_seconds = 0.0
+        self.last_result: Any = None
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name=self.name)
+        logger.info(f"백그라운드 작업 시작: {self.name} (주기 {self.interval_seconds}초)")
+
+    async def stop(self) -> None:
+        """진행 중인 실행이 끝나기를 기다린 뒤 작업을 종료합니다."""
+        if not self.running:
+            return
+        self._stop_event.set()
+        await self._task
+        self._task = None
+        logger.info(f"백그라운드 작업 종료: {self.name}")
+
+    async def run_once(self) -> Any:
+        self.last_started_at = time.time()
+        started = time.perf_counter()
+        try:
+            self.last_result = await self.func()
+            self.last_error = None
+            return self.last_result
+        except Exception as e:
+            self.failure_count += 1
+            self.last_error = str(e)
+            logger.error(f"백그라운드 작업 실패: {self.name}: {str(e)}")
+        finally:
+            self.run_count += 1
+            self.last_duration_seconds = time.perf_counter() - started
+
+    async def _wait(self) -> bool:
+        """다음 주기까지 대기합니다. 종료 요청이 오면 True를 반환합니다."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), self.interval_seconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _run(self) -> None:
+        if not self.run_immediately and await self._wait():
+            return
+        while True:
+            await self.run_once()
+            if await self._wait():
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "running": self.running,
+            "interval_seconds": self.interval_seconds,
+            "run_count": self.run_count,
+            "failure_count": self.failure_count,
+            "last_started_at": self.last_started_at,
+            "last_duration_seconds": round(self.last_duration_seconds, 3),
+            "last_result": self.last_result,
+            "last_error": self.last_error
+        }
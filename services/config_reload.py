@@ -0,0 +1,93 @@
+"""
+설정 다시 읽기 - SIGHUP 신호 또는 설정 파일 변경 시 config.reload()로 실행 중 변경 가능한 설정을 반영합니다.
+
+    kill -HUP <서버 PID>
+"""
+
+import asyncio
+import os
+import signal
+import time
+from typing import Any, Dict, Optional
+from config.config import config
+from .background import PeriodicTask
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+class ConfigReloader:
+    """
+    SIGHUP 신호를 받거나 interval_seconds마다 설정 파일 수정 시각을 확인하여 바뀌었으면 설정을 다시 읽습니다.
+
+    다시 읽기에 실패하면(파일 삭제, 형식 오류 등) 기존 설정을 그대로 유지합니다.
+    """
+
+    def __init__(self, interval_seconds: int):
+        self.interval_seconds = interval_seconds
+        self.task = PeriodicTask("config_reload", interval_seconds, self.check_file) if interval_seconds > 0 else None
+        self.reload_count = 0
+        self.failure_count = 0
+        self.last_reloaded_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._mtime: Optional[float] = None
+        self._signal_installed = False
+
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(config.config_file).st_mtime
+        except OSError:
+            return None
+
+    def reload(self) -> Dict[str, Any]:
+        """설정을 다시 읽고 반영된 설정을 {이름: 새 값}으로 반환합니다."""
+        self._mtime = self._file_mtime()
+        try:
+            changed = config.reload()
+        except Exception as e:
+            self.failure_count += 1
+            self.last_error = str(e)
+            logger.error(f"설정 다시 읽기 실패 (기존 설정 유지): {str(e)}")
+            return {}
+        self.reload_count += 1
+        self.last_reloaded_at = time.time()
+        self.last_error = None
+        return {name: after for name, (_, after) in changed.items()}
+
+    async def check_file(self) -> bool:
+        """설정 파일 수정 시각이 바뀌었으면 다시 읽습니다."""
+        if self._file_mtime() == self._mtime:
+            return False
+        self.reload()
+        return True
+
+    def start(self) -> None:
+        self._mtime = self._file_mtime()
+        # SIGHUP은 POSIX 전용이며, 이벤트 루프가 메인 스레드에서 실행될 때만 등록 가능
+        if hasattr(signal, "SIGHUP"):
+            try:
+                asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, self.reload)
+                self._signal_installed = True
+            except (NotImplementedError, RuntimeError, ValueError) as e:
+                logger.warning(f"SIGHUP 설정 다시 읽기를 등록하지 못했습니다: {str(e)}")
+        if self.task is not None:
+            self.task.start()
+
+    async def stop(self) -> None:
+        if self._signal_installed:
+            asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
+            self._signal_installed = False
+        if self.task is not None:
+            await self.task.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "watch_interval_seconds": self.interval_seconds,
+            "signal": self._signal_installed,
+            "reload_count": self.reload_count,
+            "failure_count": self.failure_count,
+            "last_reloaded_at": self.last_reloaded_at,
+            "last_error": self.last_error
+        }
+
+# 전역 설정 다시 읽기 인스턴스 ([app] config_reload_interval_seconds, 0이면 SIGHUP으로만 다시 읽음)
+config_reloader = ConfigReloader(config.get_app_config_reload_interval_seconds())
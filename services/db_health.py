@@ -0,0 +1,93 @@
+"""
+DB 상태 확인 - 백그라운드에서 주기적으로 DB 연결을 확인하고 결과를 캐시합니다.
+
+/health, /ready는 캐시된 결과만 읽으므로 자주 호출되어도 DB 연결을 열지 않으며,
+확인은 상태 확인 전용 연결 1개(health_engine)로 수행하여 수집 요청과 연결 풀 슬롯을 다투지 않습니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+from starlette.concurrency import run_in_threadpool
+from database import ping_database
+from config.config import config
+from utils.metrics import registry
+from .background import PeriodicTask
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+class DatabaseHealthProbe:
+    """
+    interval_seconds마다 SELECT 1을 실행하여 DB 상태를 기록하는 백그라운드 작업.
+
+    마지막 확인이 interval_seconds의 3배 이상 지났으면(확인 작업이 멈춘 경우 등) 비정상으로 간주합니다.
+    상태가 바뀔 때만 로그를 남깁니다.
+    """
+
+    def __init__(self, interval_seconds: int, timeout_seconds: int):
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.healthy: Optional[bool] = None
+        self.checked_at: Optional[float] = None
+        self.latency_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.consecutive_failures = 0
+        self.task = PeriodicTask("db_health", interval_seconds, self.check)
+
+    async def check(self) -> bool:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(run_in_threadpool(ping_database), self.timeout_seconds)
+            error = None
+        except asyncio.TimeoutError:
+            error = f"{self.timeout_seconds}초 안에 응답하지 않았습니다."
+        except Exception as e:
+            error = str(e)
+
+        healthy = error is None
+        if healthy and self.healthy is False:
+            logger.info(f"DB 연결이 복구되었습니다. (연속 실패 {self.consecutive_failures}회)")
+        elif not healthy and self.healthy is not False:
+            logger.error(f"DB 상태 확인 실패: {error}")
+
+        self.healthy = healthy
+        self.checked_at = time.time()
+        self.latency_ms = round((time.perf_counter() - started) * 1000, 2)
+        self.last_error = error
+        self.consecutive_failures = 0 if healthy else self.consecutive_failures + 1
+        return healthy
+
+    @property
+    def stale(self) -> bool:
+        return self.checked_at is None or time.time() - self.checked_at > self.interval_seconds * 3
+
+    @property
+    def ok(self) -> bool:
+        """마지막 확인이 성공했고 결과가 오래되지 않았으면 True"""
+        return bool(self.healthy) and not self.stale
+
+    async def start(self) -> None:
+        """첫 확인을 마친 뒤 주기 작업을 시작합니다. (시작 직후 /ready가 확인 결과를 사용할 수 있도록)"""
+        await self.check()
+        self.task.start()
+
+    async def stop(self) -> None:
+        await self.task.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "status": "up" if self.ok else ("unknown" if self.checked_at is None else "down"),
+            "checked_at": self.checked_at,
+            "latency_ms": self.latency_ms,
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error
+        }
+
+# 전역 DB 상태 확인 인스턴스 ([database] health_check_interval_seconds, health_check_timeout_seconds)
+db_health = DatabaseHealthProbe(
+    interval_seconds=max(1, config.get_database_health_check_interval_seconds()),
+    timeout_seconds=config.get_database_health_check_timeout_seconds()
+)
+
+registry.gauge("db_up", "마지막 DB 상태 확인 결과 (1: 정상, 0: 실패 또는 확인 결과 오래됨)", lambda: [((), 1 if db_health.ok else 0)])
@@ -0,0 +1,227 @@
+"""
+Write-behind 수집 큐 - 수신한 데이터를 메모리 큐에 적재하고 백그라운드에서 일괄 저장합니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+from model import SystemResourceData
+from database import run_db_task, save_resource_batch
+from config.config import config
+from .latest_state import latest_state, LATEST_STATE_ENABLED
+from .live_stream import live_stream, STREAM_ENABLED
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# flusher 종료 신호
+_STOP = object()
+# 저장 실패 후 재시도 대기 시간 상한 (초)
+_MAX_RETRY_DELAY = 30.0
+
+class IngestQueue:
+    """
+    제한된 크기의 메모리 큐와 백그라운드 flusher.
+
+    flusher는 첫 데이터가 들어온 뒤 flush_interval_ms가 지나거나
+    누적 행 수가 flush_max_rows에 도달하면 큐에 쌓인 데이터를 한 번에 저장합니다.
+
+    DB 중단 등으로 저장이 실패하면 배치를 보관해 두고 flush_interval_ms부터 두 배씩 늘어나는 간격으로
+    (최대 _MAX_RETRY_DELAY초) 새 데이터가 없어도 다시 저장을 시도하며, flush_max_retries회를 넘으면 폐기합니다.
+    """
+
+    def __init__(self, max_size: int, flush_interval_ms: int, flush_max_rows: int, flush_max_retries: int = 3):
+        self.max_size = max_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.flush_max_rows = flush_max_rows
+        self.flush_max_retries = flush_max_retries
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # 저장에 실패하여 다음 flush에서 재시도할 데이터와 시도 횟수
+        self._retry_batch: List[SystemResourceData] = []
+        self._retry_count = 0
+        self._retry_at = 0.0
+
+        self.enqueued_total = 0
+        self.rejected_total = 0
+        self.flushed_payloads_total = 0
+        self.flushed_rows_total = 0
+        self.dropped_payloads_total = 0
+        self.flush_count = 0
+        self.flush_failures = 0
+        self.last_flush_latency_ms = 0.0
+        self.max_flush_latency_ms = 0.0
+        self.total_flush_latency_ms = 0.0
+        self.last_error: Optional[str] = None
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def put_nowait(self, payload: SystemResourceData) -> bool:
+        """데이터를 큐에 적재합니다. 큐가 가득 찼거나 실행 중이 아니면 False를 반환합니다."""
+        if not self.running:
+            self.rejected_total += 1
+            return False
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.rejected_total += 1
+            return False
+        self.enqueued_total += 1
+        return True
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"수집 큐 flusher 시작 (max_size={self.max_size}, "
+            f"flush_interval_ms={int(self.flush_interval * 1000)}, flush_max_rows={self.flush_max_rows})"
+        )
+
+    async def stop(self) -> None:
+        """남은 데이터를 모두 저장한 뒤 flusher를 종료합니다."""
+        if not self.running:
+            return
+        logger.info(f"수집 큐 flusher 종료 중 (남은 데이터: {self.depth}건)")
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        logger.info("수집 큐 flusher 종료 완료")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            if self._retry_batch:
+                # 재시도할 배치가 있으면 새 데이터가 들어오지 않아도 재시도 시각에 저장
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), max(0.0, self._retry_at - loop.time()))
+                except asyncio.TimeoutError:
+                    await self._flush([])
+                    continue
+            else:
+                item = await self._queue.get()
+            batch: List[SystemResourceData] = []
+            rows = 0
+            # 재시도 대기 중에 들어온 데이터는 재시도 시각까지 모아서 함께 저장
+            deadline = max(loop.time() + self.flush_interval, self._retry_at)
+
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+                rows += max(1, len(item.containers))
+                if rows >= self.flush_max_rows:
+                    break
+
+                if not self._queue.empty():
+                    item = self._queue.get_nowait()
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            if stopping:
+                # 종료 신호 이후 적재된 데이터까지 모두 저장
+                while not self._queue.empty():
+                    item = self._queue.get_nowait()
+                    if item is not _STOP:
+                        batch.append(item)
+
+            await self._flush(batch, final=stopping)
+
+    async def _flush(self, batch: List[SystemResourceData], final: bool = False) -> None:
+        batch = self._retry_batch + batch
+        self._retry_batch = []
+        if not batch:
+            return
+
+        started = time.perf_counter()
+        try:
+            results = await run_db_task(save_resource_batch, batch)
+        except Exception as e:
+            self.flush_failures += 1
+            self.last_error = str(e)
+            self._retry_count += 1
+            if final or self._retry_count > self.flush_max_retries:
+                self.dropped_payloads_total += len(batch)
+                self._retry_count = 0
+                logger.error(f"수집 큐 저장 실패로 {len(batch)}건을 폐기합니다: {str(e)}")
+            else:
+                self._retry_batch = batch
+                delay = min(self.flush_interval * 2 ** (self._retry_count - 1), _MAX_RETRY_DELAY)
+                self._retry_at = asyncio.get_running_loop().time() + delay
+                logger.warning(
+                    f"수집 큐 저장 실패, {delay:.1f}초 후 재시도합니다 ({self._retry_count}/{self.flush_max_retries}): {str(e)}"
+                )
+            return
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        self._retry_count = 0
+        self._retry_at = 0.0
+        self.flush_count += 1
+        self.last_flush_latency_ms = latency_ms
+        self.max_flush_latency_ms = max(self.max_flush_latency_ms, latency_ms)
+        self.total_flush_latency_ms += latency_ms
+
+        if LATEST_STATE_ENABLED or STREAM_ENABLED:
+            for payload, result in zip(batch, results):
+                if "host_id" in result:
+                    if LATEST_STATE_ENABLED:
+                        latest_state.update(result["host_id"], payload)
+                    if STREAM_ENABLED:
+                        live_stream.publish(result["host_id"], payload)
+
+        failed = [result["error"] for result in results if "error" in result]
+        self.flushed_payloads_total += len(batch) - len(failed)
+        self.flushed_rows_total += sum(result.get("containers_count", 0) for result in results)
+        if failed:
+            self.dropped_payloads_total += len(failed)
+            self.last_error = failed[-1]
+            logger.warning(f"수집 큐 flush 중 {len(failed)}건 저장 실패: {failed[-1]}")
+
+        logger.debug(f"수집 큐 flush 완료: {len(batch)}건, {latency_ms:.1f}ms")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "queue_depth": self.depth,
+            "queue_max_size": self.max_size,
+            "retry_pending": len(self._retry_batch),
+            "enqueued_total": self.enqueued_total,
+            "rejected_total": self.rejected_total,
+            "flushed_payloads_total": self.flushed_payloads_total,
+            "flushed_rows_total": self.flushed_rows_total,
+            "dropped_payloads_total": self.dropped_payloads_total,
+            "flush_count": self.flush_count,
+            "flush_failures": self.flush_failures,
+            "last_flush_latency_ms": round(self.last_flush_latency_ms, 3),
+            "max_flush_latency_ms": round(self.max_flush_latency_ms, 3),
+            "avg_flush_latency_ms": round(self.total_flush_latency_ms / self.flush_count, 3) if self.flush_count else 0.0,
+            "last_error": self.last_error
+        }
+
+# 수집 방식 설정 ([ingest] mode = queue)
+QUEUE_MODE = config.get_ingest_mode() == "queue"
+
+# 전역 수집 큐 인스턴스
+ingest_queue = IngestQueue(
+    max_size=config.get_ingest_queue_max_size(),
+    flush_interval_ms=config.get_ingest_flush_interval_ms(),
+    flush_max_rows=config.get_ingest_flush_max_rows(),
+    flush_max_retries=config.get_ingest_flush_max_retries()
+)
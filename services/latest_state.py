@@ -0,0 +1,110 @@
+"""
+최신 상태 캐시 - 호스트별/컨테이너별 가장 최근 스냅샷을 메모리에 유지합니다.
+
+대시보드의 "현재 상태" 조회가 DB를 거치지 않도록 수집 시점에 갱신하고,
+서버 시작 시 DB에서 한 번의 GROUP BY 쿼리로 미리 채웁니다.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from model import SystemResourceData
+from database import run_db_task, get_all_hosts, get_latest_container_rows
+from config.config import config
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+class LatestStateCache:
+    """
+    host_id -> 호스트 스냅샷, host_id -> {container_name -> 컨테이너 스냅샷} 매핑.
+
+    Agent 보고에는 해당 호스트의 전체 컨테이너 목록이 담기므로, 더 최신 보고가 오면
+    호스트의 컨테이너 맵을 통째로 교체하여 사라진 컨테이너가 남지 않도록 합니다.
+    모든 갱신/조회는 이벤트 루프에서 수행됩니다.
+    """
+
+    def __init__(self):
+        self._hosts: Dict[int, Dict[str, Any]] = {}
+        self._containers: Dict[int, Dict[str, Dict[str, Any]]] = {}
+
+    def update(self, host_id: int, resource_data: SystemResourceData) -> None:
+        """저장이 완료된 보고로 캐시를 갱신합니다. 이미 더 최신 보고가 반영되어 있으면 무시합니다."""
+        host_data = resource_data.host
+        host_datetime = host_data.get_datetime
+        current = self._hosts.get(host_id)
+        if current is not None and current["get_datetime"] > host_datetime:
+            return
+
+        self._hosts[host_id] = {
+            "id": host_id,
+            "host_name": host_data.host_name,
+            "cpu_percentage": host_data.cpu_percentage,
+            "cpu_cores": host_data.cpu_cores,
+            "cpu_threads": host_data.cpu_threads,
+            "memory_usage": host_data.memory_usage,
+            "memory_percentage": host_data.memory_percentage,
+            "get_datetime": host_datetime
+        }
+        self._containers[host_id] = {
+            container_data.container_name: {
+                "host_id": host_id,
+                "engine_type": container_data.engine_type,
+                "cluster_name": container_data.cluster_name,
+                "node_name": container_data.node_name,
+                "container_name": container_data.container_name,
+                "status": container_data.status,
+                "cpu_percentage": container_data.cpu_percentage,
+                "memory_usage": container_data.memory_usage,
+                "memory_percentage": container_data.memory_percentage,
+                "get_datetime": container_data.get_datetime
+            }
+            for container_data in resource_data.containers
+        }
+
+    def get_hosts(self) -> List[Dict[str, Any]]:
+        return list(self._hosts.values())
+
+    def get_host(self, host_id: int) -> Optional[Dict[str, Any]]:
+        return self._hosts.get(host_id)
+
+    def get_containers(self, host_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        if host_id is not None:
+            return list(self._containers.get(host_id, {}).values())
+        return [container for containers in self._containers.values() for container in containers.values()]
+
+    def _load(self, db) -> None:
+        hosts = get_all_hosts(db)
+        warmup_hours = config.get_cache_latest_warmup_hours()
+        since = datetime.utcnow() - timedelta(hours=warmup_hours) if warmup_hours > 0 else None
+        containers = get_latest_container_rows(db, since)
+
+        self._hosts = {host["id"]: host for host in hosts}
+        container_map: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        for container in containers:
+            container_map.setdefault(container.host_id, {})[container.container_name] = {
+                "host_id": container.host_id,
+                "engine_type": container.engine_type,
+                "cluster_name": container.cluster_name,
+                "node_name": container.node_name,
+                "container_name": container.container_name,
+                "status": container.status,
+                "cpu_percentage": container.cpu_percentage,
+                "memory_usage": container.memory_usage,
+                "memory_percentage": container.memory_percentage,
+                "get_datetime": container.get_datetime
+            }
+        self._containers = container_map
+
+    async def warm_up(self) -> None:
+        """DB에서 호스트 목록과 컨테이너별 최신 기록을 읽어 캐시를 채웁니다."""
+        await run_db_task(self._load)
+        logger.info(
+            f"최신 상태 캐시 로드 완료: 호스트 {len(self._hosts)}개, "
+            f"컨테이너 {sum(len(containers) for containers in self._containers.values())}개"
+        )
+
+# 최신 상태 캐시 사용 여부 ([cache] latest_state_enabled)
+LATEST_STATE_ENABLED = config.get_cache_latest_state_enabled()
+
+# 전역 최신 상태 캐시 인스턴스
+latest_state = LatestStateCache()
@@ -0,0 +1,205 @@
+"""
+실시간 전송 - 저장이 완료된 호스트/컨테이너 샘플을 SSE/WebSocket 구독자에게 전달합니다.
+
+대시보드가 /api/containers를 반복 조회하지 않고 새 샘플을 바로 받을 수 있도록,
+수집 경로에서 publish()를 호출하면 조건에 맞는 구독자의 버퍼에 샘플을 넣기만 하고 즉시 반환합니다.
+실제 전송은 구독자별 연결 처리 코루틴이 버퍼를 비우며 수행하므로 느린 클라이언트가 수집을 늦추지 않습니다.
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Set
+from model import SystemResourceData
+from config.config import config
+from utils.metrics import registry
+
+STREAM_EVENTS_DISCARDED = registry.counter(
+    "stream_events_discarded_total",
+    "구독자 버퍼에서 전송되지 못한 샘플 수 (coalesced: 같은 대상의 최신 샘플로 대체, dropped: 버퍼가 가득 차 버림)",
+    labels=("reason",)
+)
+
+class StreamSubscriber:
+    """
+    구독 조건과 전송 대기 버퍼를 가진 구독자 한 명.
+
+    버퍼는 (종류, host_id, container_name) -> 이벤트 매핑이며, 같은 대상의 샘플이 전송 전에 다시 오면
+    최신 샘플로 대체(coalesce)합니다. 버퍼가 가득 차면 가장 오래된 대상의 샘플을 버립니다.
+    버려지거나 대체된 샘플 수는 다음 전송 묶음의 "dropped" 이벤트로 알려줍니다.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int,
+        host_id: Optional[int] = None,
+        cluster_name: Optional[str] = None,
+        container_name: Optional[str] = None
+    ):
+        self.buffer_size = max(1, buffer_size)
+        self.host_id = host_id
+        self.cluster_name = cluster_name
+        self.container_name = container_name
+        self.closed = False
+        self.sent_total = 0
+        self.discarded_total = 0
+        self._buffer: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._discarded = 0
+        self._ready = asyncio.Event()
+
+    @property
+    def wants_hosts(self) -> bool:
+        """클러스터/컨테이너 조건이 없을 때만 호스트 샘플을 받습니다."""
+        return self.cluster_name is None and self.container_name is None
+
+    def matches_host(self, host_id: int) -> bool:
+        return self.host_id is None or self.host_id == host_id
+
+    def matches_container(self, container: Dict[str, Any]) -> bool:
+        return (
+            (self.cluster_name is None or self.cluster_name == container["cluster_name"])
+            and (self.container_name is None or self.container_name == container["container_name"])
+        )
+
+    def push(self, key: Hashable, event: Dict[str, Any]) -> None:
+        if key in self._buffer:
+            self._discarded += 1
+            STREAM_EVENTS_DISCARDED.inc(labels=("coalesced",))
+            del self._buffer[key]
+        elif len(self._buffer) >= self.buffer_size:
+            self._buffer.popitem(last=False)
+            self._discarded += 1
+            STREAM_EVENTS_DISCARDED.inc(labels=("dropped",))
+        self._buffer[key] = event
+        self._ready.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._ready.set()
+
+    async def next_batch(self, timeout: float) -> List[Dict[str, Any]]:
+        """
+        버퍼에 쌓인 이벤트를 모두 꺼내 반환합니다.
+
+        timeout 동안 새 이벤트가 없거나 구독이 닫혔으면 빈 목록을 반환합니다.
+        """
+        if not self._buffer and not self.closed:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._ready.clear()
+
+        events = list(self._buffer.values())
+        self._buffer.clear()
+        if self._discarded:
+            events.insert(0, {"type": "dropped", "data": {"count": self._discarded}})
+            self.discarded_total += self._discarded
+            self._discarded = 0
+        self.sent_total += len(events)
+        return events
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "host_id": self.host_id,
+            "cluster_name": self.cluster_name,
+            "container_name": self.container_name,
+            "buffered": len(self._buffer),
+            "sent_total": self.sent_total,
+            "discarded_total": self.discarded_total
+        }
+
+class LiveStreamHub:
+    """
+    구독자 목록을 관리하고 새 샘플을 조건에 맞는 구독자 버퍼로 나눠 넣습니다.
+
+    모든 구독/발행은 이벤트 루프에서 수행되며, publish()는 대기 없이 버퍼에 넣기만 합니다.
+    """
+
+    def __init__(self, max_subscribers: int, buffer_size: int):
+        self.max_subscribers = max_subscribers
+        self.buffer_size = buffer_size
+        self.published_total = 0
+        self.rejected_total = 0
+        self._subscribers: Set[StreamSubscriber] = set()
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, **filters) -> Optional[StreamSubscriber]:
+        """구독자를 등록합니다. 구독자 수가 상한에 도달했으면 None을 반환합니다."""
+        if len(self._subscribers) >= self.max_subscribers:
+            self.rejected_total += 1
+            return None
+        subscriber = StreamSubscriber(self.buffer_size, **filters)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: StreamSubscriber) -> None:
+        subscriber.close()
+        self._subscribers.discard(subscriber)
+
+    def publish(self, host_id: int, resource_data: SystemResourceData) -> None:
+        """저장이 완료된 보고를 구독자에게 전달합니다. (구독자가 없으면 이벤트를 만들지 않음)"""
+        if not self._subscribers:
+            return
+        self.published_total += 1
+
+        host_data = resource_data.host
+        host_event = {
+            "type": "host",
+            "data": {
+                "id": host_id,
+                "host_name": host_data.host_name,
+                "cpu_percentage": host_data.cpu_percentage,
+                "cpu_cores": host_data.cpu_cores,
+                "cpu_threads": host_data.cpu_threads,
+                "memory_usage": host_data.memory_usage,
+                "memory_percentage": host_data.memory_percentage,
+                "get_datetime": host_data.get_datetime
+            }
+        }
+        containers = [
+            {
+                "host_id": host_id,
+                "engine_type": container_data.engine_type,
+                "cluster_name": container_data.cluster_name,
+                "node_name": container_data.node_name,
+                "container_name": container_data.container_name,
+                "status": container_data.status,
+                "cpu_percentage": container_data.cpu_percentage,
+                "memory_usage": container_data.memory_usage,
+                "memory_percentage": container_data.memory_percentage,
+                "get_datetime": container_data.get_datetime
+            }
+            for container_data in resource_data.containers
+        ]
+
+        for subscriber in self._subscribers:
+            if not subscriber.matches_host(host_id):
+                continue
+            if subscriber.wants_hosts:
+                subscriber.push(("host", host_id), host_event)
+            for container in containers:
+                if subscriber.matches_container(container):
+                    subscriber.push(("container", host_id, container["container_name"]), {"type": "container", "data": container})
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": STREAM_ENABLED,
+            "max_subscribers": self.max_subscribers,
+            "buffer_size": self.buffer_size,
+            "published_total": self.published_total,
+            "rejected_total": self.rejected_total,
+            "subscribers": [subscriber.stats() for subscriber in self._subscribers]
+        }
+
+# 실시간 전송 사용 여부 ([stream] enabled)
+STREAM_ENABLED = config.get_stream_enabled()
+
+# 전역 실시간 전송 허브 ([stream] max_subscribers, buffer_size)
+live_stream = LiveStreamHub(
+    max_subscribers=config.get_stream_max_subscribers(),
+    buffer_size=config.get_stream_buffer_size()
+)
+
+registry.gauge("stream_subscribers", "실시간 전송 구독자 수", lambda: [((), len(live_stream))])
@@ -0,0 +1,54 @@
+"""
+파티션 유지보수 작업 - containers 일 단위 파티션을 미리 만들고 보관 기간이 지난 파티션을 삭제합니다.
+"""
+
+from typing import Any, Dict
+from database import run_db_task, maintain_partitions
+from config.config import config, Settings
+from .background import PeriodicTask
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+class PartitionMaintenance:
+    """
+    interval_hours마다 future_days일 뒤까지의 파티션을 만들고
+    retention_days보다 오래된 파티션을 DROP PARTITION으로 삭제하는 백그라운드 작업.
+    """
+
+    def __init__(self, interval_hours: int, future_days: int, retention_days: int):
+        self.future_days = future_days
+        self.retention_days = retention_days
+        self.task = PeriodicTask("partition", interval_hours * 3600, self.run, run_immediately=True)
+
+    async def run(self) -> Dict[str, Any]:
+        result = await run_db_task(maintain_partitions, self.future_days, self.retention_days)
+        if result["created"] or result["dropped"]:
+            logger.info(f"파티션 유지보수 완료: 생성 {result['created']}, 삭제 {result['dropped']}")
+        return result
+
+    def start(self) -> None:
+        self.task.start()
+
+    async def stop(self) -> None:
+        await self.task.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "future_days": self.future_days,
+            "retention_days": self.retention_days,
+            **self.task.stats()
+        }
+
+# 전역 파티션 유지보수 작업 인스턴스 ([database] partitioning = daily일 때 실행)
+partition_maintenance = PartitionMaintenance(
+    interval_hours=config.get_database_partition_maintenance_interval_hours(),
+    future_days=config.get_database_partition_future_days(),
+    retention_days=config.get_monitoring_data_retention_days()
+)
+
+def _apply_partition_settings(settings: Settings) -> None:
+    """설정을 다시 읽었을 때 파티션 보관 기간을 변경합니다. (다음 유지보수 실행부터 적용)"""
+    partition_maintenance.retention_days = settings.monitoring_data_retention_days
+
+config.on_reload(_apply_partition_settings)
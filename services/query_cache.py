@@ -0,0 +1,82 @@
+"""
+조회 결과 캐시 - 같은 조건의 집계 조회를 짧은 시간 동안 한 번만 계산하여 공유합니다.
+
+여러 대시보드가 같은 질문을 동시에 보내도 DB 집계는 한 번만 실행되며(single-flight),
+계산이 끝난 결과는 ttl_seconds 동안 그대로 반환합니다.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+from config.config import config
+from utils.metrics import registry
+
+QUERY_CACHE_REQUESTS = registry.counter(
+    "query_cache_requests_total", "집계 조회 캐시 요청 수 (hit: 캐시 결과, shared: 진행 중인 계산 공유, miss: 새로 계산)",
+    labels=("result",)
+)
+
+class QueryCache:
+    """
+    키 -> (만료 시각, 결과) TTL 캐시.
+
+    캐시에 없는 키는 첫 요청이 계산 작업(Task)을 시작하고, 계산 중에 들어온 같은 키 요청은 그 작업의 결과를 기다립니다.
+    요청이 취소되어도(클라이언트 연결 종료 등) 다른 요청이 기다리는 계산은 계속 진행됩니다.
+    계산이 실패하면 캐시하지 않고, 기다리던 요청 모두에 같은 예외를 전달합니다.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Tuple[Any, str]:
+        """
+        캐시된 결과 또는 새로 계산한 결과를 반환합니다.
+
+        Returns:
+            Tuple[Any, str]: (결과, "HIT" | "SHARED" | "MISS")
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                QUERY_CACHE_REQUESTS.inc(labels=("hit",))
+                return entry[1], "HIT"
+            del self._entries[key]
+
+        task = self._pending.get(key)
+        if task is not None:
+            QUERY_CACHE_REQUESTS.inc(labels=("shared",))
+            return await asyncio.shield(task), "SHARED"
+
+        QUERY_CACHE_REQUESTS.inc(labels=("miss",))
+        task = asyncio.ensure_future(compute())
+        self._pending[key] = task
+        task.add_done_callback(lambda done: self._store(key, done))
+        return await asyncio.shield(task), "MISS"
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+# 전역 집계 조회 캐시 ([cache] query_ttl_seconds, query_max_entries)
+query_cache = QueryCache(
+    ttl_seconds=config.get_cache_query_ttl_seconds(),
+    max_entries=config.get_cache_query_max_entries()
+)
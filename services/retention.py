@@ -0,0 +1,125 @@
+"""
+데이터 보존 작업 - [monitoring] 설정에 따라 containers/host_metrics 기록을 주기적으로 정리합니다.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict
+from database import (
+    run_db_task, delete_expired_chunk, delete_expired_host_metrics_chunk, get_host_ids,
+    get_host_retention_boundary, delete_host_excess_chunk, get_host_metrics_retention_boundary, delete_host_metrics_excess_chunk
+)
+from config.config import config, Settings
+from .background import PeriodicTask
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+class RetentionWorker:
+    """
+    보관 기간(data_retention_days)과 호스트별 최대 기록 수(max_records_per_host)를 적용하는 백그라운드 작업.
+    호스트별 최대 기록 수는 containers와 host_metrics에 각각 적용합니다.
+
+    batch_size행씩 삭제/커밋하고 batch_pause_ms만큼 쉬어서 수집 트랜잭션과 잠금 경합을 최소화합니다.
+    """
+
+    def __init__(self, retention_days: int, max_records_per_host: int, interval_hours: int, batch_size: int, batch_pause_ms: int):
+        self.purged_total = 0
+        self.task = PeriodicTask("retention", max(1, interval_hours) * 3600, self.run, run_immediately=True)
+        self.configure(retention_days, max_records_per_host, interval_hours, batch_size, batch_pause_ms)
+
+    def configure(self, retention_days: int, max_records_per_host: int, interval_hours: int, batch_size: int, batch_pause_ms: int) -> None:
+        """
+        보존 정책을 변경합니다. 실행 중인 정리 작업에는 다음 배치부터, 주기는 다음 대기부터 적용됩니다.
+
+        batch_size와 interval_hours는 최소 1로 맞춥니다.
+        (0이면 삭제 루프가 끝나지 않거나 정리 작업이 대기 없이 반복 실행됨)
+        """
+        self.retention_days = retention_days
+        self.max_records_per_host = max_records_per_host
+        self.batch_size = max(1, batch_size)
+        self.batch_pause = max(0, batch_pause_ms) / 1000
+        self.task.interval_seconds = max(1, interval_hours) * 3600
+
+    async def _delete_until_done(self, func, *args) -> int:
+        deleted = 0
+        while True:
+            batch_size = self.batch_size
+            count = await run_db_task(func, *args, batch_size)
+            deleted += count
+            if count < batch_size:
+                return deleted
+            await asyncio.sleep(self.batch_pause)
+
+    async def run(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        expired_rows = 0
+        excess_rows = 0
+
+        if self.retention_days > 0:
+            cutoff = datetime.utcnow() - timedelta(days=self.retention_days)
+            expired_rows = await self._delete_until_done(delete_expired_chunk, cutoff)
+            expired_rows += await self._delete_until_done(delete_expired_host_metrics_chunk, cutoff)
+
+        if self.max_records_per_host > 0:
+            for host_id in await run_db_task(get_host_ids):
+                for get_boundary, delete_chunk in (
+                    (get_host_retention_boundary, delete_host_excess_chunk),
+                    (get_host_metrics_retention_boundary, delete_host_metrics_excess_chunk)
+                ):
+                    boundary = await run_db_task(get_boundary, host_id, self.max_records_per_host)
+                    if boundary is not None:
+                        excess_rows += await self._delete_until_done(delete_chunk, host_id, boundary)
+
+        duration = time.perf_counter() - started
+        self.purged_total += expired_rows + excess_rows
+        logger.info(
+            f"데이터 보존 정리 완료: 기간 초과 {expired_rows}행, 호스트별 개수 초과 {excess_rows}행 삭제 "
+            f"({duration:.2f}초)"
+        )
+        return {
+            "expired_rows": expired_rows,
+            "excess_rows": excess_rows,
+            "purged_rows": expired_rows + excess_rows,
+            "duration_seconds": round(duration, 3)
+        }
+
+    def start(self) -> None:
+        self.task.start()
+
+    async def stop(self) -> None:
+        await self.task.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retention_days": self.retention_days,
+            "max_records_per_host": self.max_records_per_host,
+            "batch_size": self.batch_size,
+            "purged_total": self.purged_total,
+            **self.task.stats()
+        }
+
+# 데이터 보존 작업 사용 여부 ([monitoring] cleanup_enabled)
+RETENTION_ENABLED = config.get_monitoring_cleanup_enabled()
+
+# 전역 데이터 보존 작업 인스턴스
+retention_worker = RetentionWorker(
+    retention_days=config.get_monitoring_data_retention_days(),
+    max_records_per_host=config.get_monitoring_max_records_per_host(),
+    interval_hours=config.get_monitoring_cleanup_interval_hours(),
+    batch_size=config.get_monitoring_cleanup_batch_size(),
+    batch_pause_ms=config.get_monitoring_cleanup_batch_pause_ms()
+)
+
+def _apply_retention_settings(settings: Settings) -> None:
+    """설정을 다시 읽었을 때 보존 정책을 변경합니다."""
+    retention_worker.configure(
+        retention_days=settings.monitoring_data_retention_days,
+        max_records_per_host=settings.monitoring_max_records_per_host,
+        interval_hours=settings.monitoring_cleanup_interval_hours,
+        batch_size=settings.monitoring_cleanup_batch_size,
+        batch_pause_ms=settings.monitoring_cleanup_batch_pause_ms
+    )
+
+config.on_reload(_apply_retention_settings)
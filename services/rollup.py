@@ -0,0 +1,69 @@
+"""
+롤업 작업 - containers/host_metrics 원본 기록을 주기적으로 롤업 테이블에 증분 집계합니다.
+"""
+
+from typing import Any, Dict, Optional
+from database import run_db_task, get_max_container_id, get_max_host_metric_id, process_rollups, process_host_rollups
+from config.config import config
+from .background import PeriodicTask
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+class RollupWorker:
+    """
+    주기적으로 watermark 이후의 새 원본 행을 집계하는 백그라운드 작업.
+
+    트랜잭션은 ID 할당 순서와 다르게 커밋될 수 있으므로, 직전 실행에서 관측한
+    MAX(id)까지만 처리하여 한 주기 동안 커밋이 끝나지 않은 행을 건너뛰지 않도록 합니다.
+    """
+
+    # 원본 이름 -> (MAX(id) 조회 함수, 집계 함수)
+    SOURCES = {
+        "containers": (get_max_container_id, process_rollups),
+        "host_metrics": (get_max_host_metric_id, process_host_rollups),
+    }
+
+    def __init__(self, interval_seconds: int, batch_size: int, max_batches_per_run: int):
+        self.batch_size = batch_size
+        self.max_batches_per_run = max_batches_per_run
+        self._upper_ids: Dict[str, Optional[int]] = {source: None for source in self.SOURCES}
+        self.task = PeriodicTask("rollup", interval_seconds, self.run, run_immediately=True)
+
+    async def _run_source(self, source: str) -> int:
+        get_max_id, process = self.SOURCES[source]
+        observed_max_id = await run_db_task(get_max_id)
+        upper_id, self._upper_ids[source] = self._upper_ids[source], observed_max_id
+        if upper_id is None:
+            return 0
+
+        processed = 0
+        for _ in range(self.max_batches_per_run):
+            count = await run_db_task(process, upper_id, self.batch_size)
+            processed += count
+            if count < self.batch_size:
+                break
+
+        if processed:
+            logger.info(f"롤업 집계 완료: {source} 원본 {processed}행 처리 (upper_id={upper_id})")
+        return processed
+
+    async def run(self) -> Dict[str, Any]:
+        processed = {source: await self._run_source(source) for source in self.SOURCES}
+        return {"processed_rows": processed, "upper_ids": dict(self._upper_ids)}
+
+    def start(self) -> None:
+        self.task.start()
+
+    async def stop(self) -> None:
+        await self.task.stop()
+
+# 롤업 작업 사용 여부 ([rollup] enabled)
+ROLLUP_ENABLED = config.get_rollup_enabled()
+
+# 전역 롤업 작업 인스턴스
+rollup_worker = RollupWorker(
+    interval_seconds=config.get_rollup_interval_seconds(),
+    batch_size=config.get_rollup_batch_size(),
+    max_batches_per_run=config.get_rollup_max_batches_per_run()
+)
@@ -0,0 +1,169 @@
+"""
+집계 조회(database/aggregates.py)와 조회 결과 캐시(QueryCache) 테스트
+"""
+
+import asyncio
+import importlib
+from datetime import datetime, timedelta
+import pytest
+from database import save_resource_data, get_top_containers, get_usage_by_group
+from services import query_cache
+from services.query_cache import QueryCache
+
+# services 패키지는 같은 이름의 전역 인스턴스(query_cache)를 내보내므로 모듈은 import_module로 가져옴
+query_cache_module = importlib.import_module("services.query_cache")
+
+START = datetime(2025, 6, 23, 3, 0, 0)
+
+def _save_reports(db, make_payload) -> None:
+    """
+    host-1(cluster-1): container-0 cpu 0/2, container-1 cpu 1/3 (두 번째 보고는 status만 바뀜)
+    host-2(cluster-2): container-0 cpu 5, 10분 전 보고 1건
+    """
+    for minute, offset in ((0, 0.0), (1, 2.0)):
+        payload = make_payload("host-1", containers=2, when=START + timedelta(minutes=minute))
+        for container in payload.containers:
+            container.cpu_percentage += offset
+            if minute:
+                container.status = "exited"
+        save_resource_data(db, payload)
+    payload = make_payload("host-2", containers=1, when=START + timedelta(minutes=1), cluster_name="cluster-2")
+    payload.containers[0].cpu_percentage = 5.0
+    save_resource_data(db, payload)
+    save_resource_data(db, make_payload("host-2", containers=1, when=START - timedelta(minutes=10), cluster_name="cluster-2"))
+
+def test_top_containers_rank_by_avg_and_max(db, make_payload):
+    _save_reports(db, make_payload)
+
+    by_avg = get_top_containers(db, "cpu_percentage", "avg", since=START, limit=10)
+    by_max = get_top_containers(db, "cpu_percentage", "max", since=START, limit=2)
+
+    # status가 바뀌어도 같은 컨테이너로 집계하며, since 이전 기록은 제외
+    assert [(row["host_id"], row["container_name"], row["value"], row["sample_count"]) for row in by_avg] == [
+        (2, "container-0", 5.0, 1), (1, "container-1", 2.0, 2), (1, "container-0", 1.0, 2)
+    ]
+    assert by_avg[1]["last_seen"] == START + timedelta(minutes=1)
+    assert [(row["host_id"], row["value"]) for row in by_max] == [(2, 5.0), (1, 3.0)]
+
+def test_top_containers_apply_filters_and_until(db, make_payload):
+    _save_reports(db, make_payload)
+
+    filtered = get_top_containers(db, "cpu_percentage", "avg", since=START, limit=10, cluster_name="cluster-1")
+    before = get_top_containers(db, "cpu_percentage", "max", since=START, until=START + timedelta(minutes=1), limit=10, host_id=1)
+
+    assert [row["container_name"] for row in filtered] == ["container-1", "container-0"]
+    assert [(row["container_name"], row["value"]) for row in before] == [("container-1", 1.0), ("container-0", 0.0)]
+
+def test_usage_by_group_sums_per_container_averages(db, make_payload):
+    _save_reports(db, make_payload)
+
+    groups = get_usage_by_group(db, "cluster_name", since=START)
+
+    assert [(row["group"], row["container_count"], row["sample_count"]) for row in groups] == [
+        ("cluster-1", 2, 4), ("cluster-2", 1, 1)
+    ]
+    # 컨테이너별 평균(1.0, 2.0)의 합계/평균
+    assert groups[0]["cpu_percentage_sum"] == pytest.approx(3.0)
+    assert groups[0]["cpu_percentage_avg"] == pytest.approx(1.5)
+    assert groups[0]["memory_usage_sum"] == pytest.approx(300.0)
+    assert get_usage_by_group(db, "engine_type", since=START, host_id=2)[0]["group"] == "docker"
+
+def _run(coro):
+    return asyncio.run(coro)
+
+def test_query_cache_hit_and_miss():
+    cache = QueryCache(ttl_seconds=60, max_entries=10)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return len(calls)
+
+    async def scenario():
+        return [await cache.get_or_compute(key, compute) for key in ("a", "a", "b")]
+
+    assert _run(scenario()) == [(1, "MISS"), (1, "HIT"), (2, "MISS")]
+    assert len(cache) == 2
+
+def test_query_cache_expires_after_ttl(monkeypatch):
+    cache = QueryCache(ttl_seconds=10, max_entries=10)
+    now = {"value": 1000.0}
+    monkeypatch.setattr(query_cache_module.time, "monotonic", lambda: now["value"])
+    results = iter(["first", "second"])
+
+    async def compute():
+        return next(results)
+
+    async def get():
+        return await cache.get_or_compute("key", compute)
+
+    assert _run(get()) == ("first", "MISS")
+    now["value"] += 9.9
+    assert _run(get()) == ("first", "HIT")
+    now["value"] += 0.2
+    assert _run(get()) == ("second", "MISS")
+
+def test_query_cache_shares_concurrent_miss():
+    cache = QueryCache(ttl_seconds=60, max_entries=10)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_or_compute("key", compute) for _ in range(5)))
+
+    results = _run(scenario())
+
+    assert len(calls) == 1
+    assert sorted(status for _, status in results) == ["MISS"] + ["SHARED"] * 4
+    assert {result for result, _ in results} == {"result"}
+
+def test_query_cache_does_not_store_failures():
+    cache = QueryCache(ttl_seconds=60, max_entries=10)
+    attempts = []
+
+    async def compute():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        if len(attempts) == 1:
+            raise RuntimeError("DB 오류")
+        return "ok"
+
+    async def scenario():
+        failures = await asyncio.gather(
+            cache.get_or_compute("key", compute), cache.get_or_compute("key", compute), return_exceptions=True
+        )
+        return failures, await cache.get_or_compute("key", compute)
+
+    failures, retried = _run(scenario())
+
+    # 기다리던 요청 모두 같은 예외를 받고, 다음 요청은 다시 계산
+    assert [type(error) for error in failures] == [RuntimeError, RuntimeError]
+    assert retried == ("ok", "MISS")
+
+def test_query_cache_evicts_oldest_entries():
+    cache = QueryCache(ttl_seconds=60, max_entries=2)
+
+    async def scenario():
+        for key in ("a", "b", "c"):
+            await cache.get_or_compute(key, lambda key=key: asyncio.sleep(0, result=key))
+        return await cache.get_or_compute("a", lambda: asyncio.sleep(0, result="a2"))
+
+    assert _run(scenario()) == ("a2", "MISS")
+    assert len(cache) == 2
+
+def test_top_api_reports_cache_status(client, db, make_payload):
+    query_cache.clear()
+    save_resource_data(db, make_payload(containers=2, when=datetime.utcnow() - timedelta(minutes=1)))
+
+    first = client.get("/api/containers/top", params={"minutes": 5})
+    second = client.get("/api/containers/top", params={"minutes": 5})
+    other = client.get("/api/containers/usage", params={"minutes": 5})
+
+    assert (first.headers["X-Cache"], second.headers["X-Cache"], other.headers["X-Cache"]) == ("MISS", "HIT", "MISS")
+    assert [row["container_name"] for row in first.json()] == ["container-1", "container-0"]
+    assert first.json() == second.json()
+    query_cache.clear()
@@ -0,0 +1,90 @@
+"""
+설정 다시 읽기(Config.reload) 테스트
+"""
+
+import shutil
+import pytest
+from config import Config
+
+@pytest.fixture
+def reloadable(tmp_path, monkeypatch):
+    """config.ini.example을 복사한 설정 파일과 해당 파일을 읽는 Config (파일 내용을 바꿔 reload 확인)"""
+    # 환경변수는 설정 파일보다 우선하므로 테스트 대상 설정의 환경변수를 제거
+    for env_key in (
+        "LOGGING_LEVEL", "LOGGING_PAYLOAD_MODE", "MONITORING_DATA_RETENTION_DAYS",
+        "MONITORING_CLEANUP_BATCH_SIZE", "MONITORING_CLEANUP_INTERVAL_HOURS"
+    ):
+        monkeypatch.delenv(env_key, raising=False)
+    config_file = tmp_path / "config.ini"
+    shutil.copy("config/config.ini.example", config_file)
+    config = Config(str(config_file))
+
+    def rewrite(old: str, new: str) -> None:
+        content = config_file.read_text(encoding="utf-8")
+        assert old in content
+        config_file.write_text(content.replace(old, new, 1), encoding="utf-8")
+
+    return config, rewrite
+
+def test_reload_applies_valid_live_settings(reloadable):
+    config, rewrite = reloadable
+    applied = []
+    config.on_reload(lambda settings: applied.append(settings.logging_level))
+    rewrite("level = INFO", "level = DEBUG")
+
+    changed = config.reload()
+
+    assert changed["logging_level"] == ("INFO", "DEBUG")
+    assert config.get_logging_level() == "DEBUG"
+    assert applied == ["DEBUG"]
+
+@pytest.mark.parametrize("old, new", [
+    ("level = INFO", "level = VERBOSE"),
+    ("payload_mode = summary", "payload_mode = everything"),
+    ("data_retention_days = 30", "data_retention_days = -1"),
+    ("cleanup_batch_size = 1000", "cleanup_batch_size = 0"),
+    ("cleanup_interval_hours = 24", "cleanup_interval_hours = 0"),
+])
+def test_reload_rejects_invalid_live_settings(reloadable, old, new):
+    config, rewrite = reloadable
+    applied = []
+    config.on_reload(applied.append)
+    before = config.settings
+    rewrite(old, new)
+
+    with pytest.raises(ValueError):
+        config.reload()
+
+    assert config.settings is before
+    assert applied == []
+
+def test_reload_keeps_snapshot_when_listener_fails(reloadable):
+    config, rewrite = reloadable
+    applied = []
+    config.on_reload(lambda settings: applied.append(settings.logging_level))
+
+    def failing_listener(settings):
+        raise RuntimeError("반영 실패")
+
+    config.on_reload(failing_listener)
+    before = config.settings
+    rewrite("level = INFO", "level = DEBUG")
+
+    with pytest.raises(RuntimeError):
+        config.reload()
+
+    assert config.settings is before
+    # 먼저 반영한 함수에는 기존 설정이 다시 전달됨
+    assert applied == ["DEBUG", "INFO"]
+
+@pytest.mark.parametrize("old, new", [
+    ("level = INFO", "level = VERBOSE"),
+    ("payload_mode = summary", "payload_mode = everything"),
+    ("cleanup_batch_size = 1000", "cleanup_batch_size = 0"),
+])
+def test_startup_rejects_invalid_live_settings(reloadable, old, new):
+    config, rewrite = reloadable
+    rewrite(old, new)
+
+    with pytest.raises(ValueError):
+        Config(config.config_file)
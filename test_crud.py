@@ -0,0 +1,80 @@
+"""
+수집 데이터 저장(save_resource_batch) 테스트
+"""
+
+from types import SimpleNamespace
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from model import Container, Host, HostMetric
+from database import save_resource_batch, save_resource_data, upsert_host
+from database.crud import _host_id_cache
+
+def _host_values(host_name: str, cpu_cores: int = 4) -> dict:
+    return {"host_name": host_name, "cpu_cores": cpu_cores, "cpu_threads": 8}
+
+@pytest.mark.parametrize("dialect_name", ["sqlite", "postgresql"])
+def test_upsert_host_keeps_id_stable(engine, db, monkeypatch, dialect_name):
+    # postgresql: ON CONFLICT/ON DUPLICATE KEY를 쓰지 않는 SELECT 후 INSERT/UPDATE 경로
+    monkeypatch.setattr(engine.dialect, "name", dialect_name)
+
+    first = upsert_host(db, _host_values("host-1"))
+    other = upsert_host(db, _host_values("host-2"))
+    again = upsert_host(db, _host_values("host-1", cpu_cores=16))
+    db.commit()
+
+    assert first == again != other
+    assert db.execute(select(Host.host_name, Host.cpu_cores).order_by(Host.id)).all() == [("host-1", 16), ("host-2", 4)]
+
+def test_upsert_host_mysql_returns_existing_id_via_last_insert_id():
+    statements = []
+
+    class RecordingSession:
+        def get_bind(self):
+            return SimpleNamespace(dialect=SimpleNamespace(name="mysql"))
+
+        def execute(self, stmt):
+            statements.append(stmt)
+            return SimpleNamespace(lastrowid=7)
+
+    assert upsert_host(RecordingSession(), _host_values("host-1")) == 7
+    sql = str(statements[0].compile(dialect=mysql.dialect()))
+    assert "ON DUPLICATE KEY UPDATE id = last_insert_id(hosts.id)" in sql
+    assert "cpu_cores = VALUES(cpu_cores)" in sql and "host_name = VALUES(host_name)" not in sql
+
+def test_save_resource_data_reuses_host_id(db, make_payload):
+    first_id, _ = save_resource_data(db, make_payload("host-1"))
+    # 다른 프로세스(빈 캐시)에서 같은 호스트가 다시 보고한 경우
+    _host_id_cache.clear()
+    second_id, containers_count = save_resource_data(db, make_payload("host-1", containers=3))
+
+    assert first_id == second_id
+    assert containers_count == 3
+    assert db.scalar(select(func.count()).select_from(Host)) == 1
+    assert db.scalars(select(HostMetric.host_id)).all() == [first_id, first_id]
+
+def test_save_resource_batch_saves_all_items(db, make_payload):
+    results = save_resource_batch(db, [make_payload("host-1"), make_payload("host-2", containers=3)])
+
+    assert [result["containers_count"] for result in results] == [2, 3]
+    assert db.scalar(select(func.count()).select_from(Container)) == 5
+
+def test_save_resource_batch_isolates_invalid_item(db, make_payload):
+    invalid = make_payload("host-2")
+    invalid.host.host_name = None
+
+    results = save_resource_batch(db, [make_payload("host-1"), invalid])
+
+    assert "host_id" in results[0]
+    assert "NOT NULL" in results[1]["error"]
+    assert db.scalars(select(Host.host_name)).all() == ["host-1"]
+
+def test_save_resource_batch_raises_when_database_unavailable(make_payload, tmp_path):
+    # DB 중단은 항목별 오류로 바꾸지 않고 예외로 전달해야 호출자(수집 큐)가 배치를 재시도할 수 있음
+    unavailable = create_engine(f"sqlite:///{tmp_path}/missing/monitor.db")
+    with Session(unavailable) as db:
+        with pytest.raises(OperationalError):
+            save_resource_batch(db, [make_payload("host-1"), make_payload("host-2")])
+    unavailable.dispose()
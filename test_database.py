@@ -10,7 +10,7 @@ from sqlalchemy.exc import OperationalError, ProgrammingError
 import pymysql
 
 from config.config import config
-from model import Base, Host, Container
+from model import Base, Host, ContainerSeries, Container
 from logger import logger
 
 def test_basic_mysql_connection():
@@ -180,12 +180,16 @@ def test_real_data_insert():
         
         # 실제 Container 데이터 INSERT
         logger.info("   2) 실제 Container 데이터 INSERT")
-        real_container = Container(
+        real_series = ContainerSeries(
+            series_hash="test-desktop-zinopc-tomcat1",
             engine_type="docker",
             cluster_name="DESKTOP-ZINOPC",
             node_name="DESKTOP-ZINOPC",
             container_name="tomcat1",
-            status="running",
+            status="running"
+        )
+        real_container = Container(
+            series=real_series,
             cpu_percentage=0.0,
             memory_usage=119.5,
             memory_percentage=0.8,
@@ -195,7 +199,7 @@ def test_real_data_insert():
         
         db.add(real_container)
         db.commit()
-        logger.info(f"   ✅ Container 데이터 INSERT 성공: ID={real_container.id}, 컨테이너명={real_container.container_name}")
+        logger.info(f"   ✅ Container 데이터 INSERT 성공: ID={real_container.id}, 컨테이너명={real_container.series.container_name}")
         
         # 관계 확인
         logger.info("   3) 관계 확인")
@@ -206,6 +210,7 @@ def test_real_data_insert():
         # 테스트 데이터 정리
         logger.info("   4) 테스트 데이터 정리")
         db.delete(real_container)
+        db.delete(real_series)
         db.delete(real_host)
         db.commit()
         logger.info("   ✅ 테스트 데이터 정리 완료")
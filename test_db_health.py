@@ -0,0 +1,37 @@
+"""
+DB 상태 확인(DatabaseHealthProbe) 테스트
+"""
+
+import asyncio
+import time
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from database import ping_database
+from database.database import HEALTH_CHECK_TIMEOUT, health_connect_args, health_engine
+from services.db_health import DatabaseHealthProbe
+
+def test_health_engine_waits_at_most_probe_timeout():
+    assert health_engine.pool.timeout() == HEALTH_CHECK_TIMEOUT
+
+def test_health_connect_args_use_probe_timeout():
+    assert health_connect_args("mysql+pymysql://monitor:secret@db:3306/monitor", 5) == {
+        "connect_timeout": 5, "read_timeout": 5, "write_timeout": 5
+    }
+    assert health_connect_args("sqlite:///monitor.db", 5) == {"check_same_thread": False, "timeout": 5}
+
+def test_ping_gives_up_when_health_connection_is_stuck(engine):
+    # 이전 확인이 연결을 반환하지 못한 상태: 다음 확인 스레드도 제한 시간 안에 끝나야 함
+    with health_engine.connect():
+        started = time.perf_counter()
+        with pytest.raises(PoolTimeoutError):
+            ping_database()
+        assert time.perf_counter() - started < HEALTH_CHECK_TIMEOUT + 1
+
+def test_probe_reports_unhealthy_when_ping_times_out(engine):
+    probe = DatabaseHealthProbe(interval_seconds=10, timeout_seconds=HEALTH_CHECK_TIMEOUT)
+    with health_engine.connect():
+        assert asyncio.run(probe.check()) is False
+    assert probe.healthy is False
+    assert probe.consecutive_failures == 1
+    # 연결이 반환된 뒤에는 다시 정상
+    assert asyncio.run(probe.check()) is True
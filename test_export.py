@@ -0,0 +1,37 @@
+"""
+컨테이너 기록 내보내기(/api/containers/export) 테스트
+"""
+
+import json
+import pytest
+from database import save_resource_data
+from utils import accepts_gzip
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip, deflate, br", True),
+    ("br;q=1.0, gzip;q=0.5", True),
+    ("*", True),
+    ("", False),
+    ("identity", False),
+    ("deflate, br", False),
+    ("gzip;q=0", False),
+    ("*;q=0.1, gzip;q=0", False),
+])
+def test_accepts_gzip(accept_encoding, expected):
+    assert accepts_gzip(accept_encoding) is expected
+
+def test_export_is_gzipped_only_when_client_accepts_it(client, db, make_payload):
+    save_resource_data(db, make_payload(containers=2))
+
+    gzipped = client.get("/api/containers/export", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/api/containers/export", headers={"Accept-Encoding": "identity"})
+    opted_out = client.get("/api/containers/export", params={"compress": "false"}, headers={"Accept-Encoding": "gzip"})
+
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    for response in (plain, opted_out):
+        assert "Content-Encoding" not in response.headers
+        assert [json.loads(line)["container_name"] for line in response.text.splitlines()] == ["container-0", "container-1"]
+    # 클라이언트(httpx)가 gzip을 풀어 같은 내용이 나와야 함
+    assert gzipped.text == plain.text
+    # CORS 미들웨어가 Origin을 덧붙일 수 있으므로 포함 여부만 확인
+    assert all("Accept-Encoding" in response.headers["Vary"] for response in (gzipped, plain, opted_out))
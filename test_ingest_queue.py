@@ -0,0 +1,73 @@
+"""
+Write-behind 수집 큐 테스트
+"""
+
+import asyncio
+import importlib
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from model import Container
+from services.ingest_queue import IngestQueue
+
+# services 패키지는 같은 이름의 전역 인스턴스(ingest_queue)를 내보내므로 모듈은 import_module로 가져옴
+ingest_queue_module = importlib.import_module("services.ingest_queue")
+
+def _patch_database(monkeypatch, engine, unavailable, failures: int) -> None:
+    """처음 failures번의 저장은 연결할 수 없는 DB로, 이후에는 테스트 DB로 실행합니다."""
+    remaining = {"failures": failures}
+
+    async def run_db_task(fn, *args, **kwargs):
+        bind = engine
+        if remaining["failures"] > 0:
+            remaining["failures"] -= 1
+            bind = unavailable
+        with Session(bind) as db:
+            return fn(db, *args, **kwargs)
+
+    monkeypatch.setattr(ingest_queue_module, "run_db_task", run_db_task)
+
+async def _enqueue_and_wait(queue: IngestQueue, payloads, until) -> dict:
+    await queue.start()
+    for payload in payloads:
+        assert queue.put_nowait(payload)
+    # 적재 이후 새 데이터가 없어도 재시도가 진행되어야 함
+    for _ in range(200):
+        if until(queue):
+            break
+        await asyncio.sleep(0.01)
+    stats = queue.stats()
+    await queue.stop()
+    return stats
+
+def test_queue_retries_batch_after_database_outage(engine, make_payload, monkeypatch, tmp_path):
+    unavailable = create_engine(f"sqlite:///{tmp_path}/missing/monitor.db")
+    _patch_database(monkeypatch, engine, unavailable, failures=2)
+    queue = IngestQueue(max_size=100, flush_interval_ms=10, flush_max_rows=1000, flush_max_retries=3)
+
+    stats = asyncio.run(_enqueue_and_wait(
+        queue, [make_payload("host-1"), make_payload("host-2")],
+        until=lambda queue: queue.flushed_payloads_total == 2
+    ))
+
+    assert stats["flush_failures"] == 2
+    assert stats["flushed_payloads_total"] == 2
+    assert stats["dropped_payloads_total"] == 0
+    assert stats["retry_pending"] == 0
+    with Session(engine) as db:
+        assert db.scalar(select(func.count()).select_from(Container)) == 4
+    unavailable.dispose()
+
+def test_queue_drops_batch_after_max_retries(engine, make_payload, monkeypatch, tmp_path):
+    unavailable = create_engine(f"sqlite:///{tmp_path}/missing/monitor.db")
+    _patch_database(monkeypatch, engine, unavailable, failures=10)
+    queue = IngestQueue(max_size=100, flush_interval_ms=10, flush_max_rows=1000, flush_max_retries=1)
+
+    stats = asyncio.run(_enqueue_and_wait(
+        queue, [make_payload("host-1"), make_payload("host-2")],
+        until=lambda queue: queue.dropped_payloads_total == 2
+    ))
+
+    assert stats["flush_failures"] == 2
+    assert stats["flushed_payloads_total"] == 0
+    assert stats["dropped_payloads_total"] == 2
+    unavailable.dispose()
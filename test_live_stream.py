@@ -0,0 +1,110 @@
+"""
+실시간 전송 허브(LiveStreamHub, StreamSubscriber) 테스트
+"""
+
+import asyncio
+from datetime import datetime
+from services.live_stream import LiveStreamHub, StreamSubscriber
+
+def _next_batch(subscriber: StreamSubscriber, timeout: float = 0.01) -> list:
+    return asyncio.run(subscriber.next_batch(timeout))
+
+def _event(name: str) -> dict:
+    return {"type": "container", "data": {"container_name": name}}
+
+def test_subscriber_coalesces_same_key():
+    subscriber = StreamSubscriber(buffer_size=10)
+    subscriber.push(("container", 1, "web"), {"type": "container", "data": {"cpu_percentage": 1.0}})
+    subscriber.push(("container", 1, "web"), {"type": "container", "data": {"cpu_percentage": 2.0}})
+
+    events = _next_batch(subscriber)
+
+    assert events == [
+        {"type": "dropped", "data": {"count": 1}},
+        {"type": "container", "data": {"cpu_percentage": 2.0}}
+    ]
+    assert subscriber.stats()["discarded_total"] == 1
+
+def test_subscriber_drops_oldest_when_buffer_is_full():
+    subscriber = StreamSubscriber(buffer_size=2)
+    for name in ("a", "b", "c"):
+        subscriber.push(("container", 1, name), _event(name))
+
+    events = _next_batch(subscriber)
+
+    assert events == [{"type": "dropped", "data": {"count": 1}}, _event("b"), _event("c")]
+    # 전달한 뒤에는 dropped 개수가 초기화됨
+    subscriber.push(("container", 1, "d"), _event("d"))
+    assert _next_batch(subscriber) == [_event("d")]
+    assert subscriber.stats()["sent_total"] == 4
+
+def test_next_batch_returns_empty_on_timeout_and_close():
+    subscriber = StreamSubscriber(buffer_size=10)
+
+    async def scenario():
+        timed_out = await subscriber.next_batch(0.01)
+        asyncio.get_running_loop().call_later(0.01, subscriber.close)
+        return timed_out, await subscriber.next_batch(5)
+
+    assert asyncio.run(scenario()) == ([], [])
+    assert subscriber.closed
+
+def test_hub_applies_subscriber_filters(make_payload):
+    hub = LiveStreamHub(max_subscribers=10, buffer_size=100)
+    everything = hub.subscribe()
+    host_2 = hub.subscribe(host_id=2)
+    web = hub.subscribe(container_name="container-1")
+    other_cluster = hub.subscribe(cluster_name="cluster-2")
+
+    hub.publish(1, make_payload("host-1", containers=2))
+    hub.publish(2, make_payload("host-2", containers=2))
+
+    def received(subscriber):
+        return [
+            (event["type"], event["data"].get("host_id", event["data"].get("id")), event["data"].get("container_name"))
+            for event in _next_batch(subscriber)
+        ]
+
+    assert received(everything) == [
+        ("host", 1, None), ("container", 1, "container-0"), ("container", 1, "container-1"),
+        ("host", 2, None), ("container", 2, "container-0"), ("container", 2, "container-1")
+    ]
+    assert received(host_2) == [("host", 2, None), ("container", 2, "container-0"), ("container", 2, "container-1")]
+    # 클러스터/컨테이너 조건이 있으면 호스트 샘플은 보내지 않음
+    assert received(web) == [("container", 1, "container-1"), ("container", 2, "container-1")]
+    assert received(other_cluster) == []
+    assert hub.published_total == 2
+
+def test_hub_publishes_sample_fields(make_payload):
+    hub = LiveStreamHub(max_subscribers=1, buffer_size=10)
+    subscriber = hub.subscribe(container_name="container-0")
+    when = datetime(2025, 6, 23, 3, 2, 50)
+
+    hub.publish(7, make_payload(containers=1, when=when))
+
+    [event] = _next_batch(subscriber)
+    assert event["data"] == {
+        "host_id": 7, "engine_type": "docker", "cluster_name": "cluster-1", "node_name": "node-1",
+        "container_name": "container-0", "status": "running", "cpu_percentage": 0.0,
+        "memory_usage": 100.0, "memory_percentage": 2.0, "get_datetime": when
+    }
+
+def test_hub_rejects_subscribers_over_limit():
+    hub = LiveStreamHub(max_subscribers=2, buffer_size=10)
+    first = hub.subscribe()
+    assert hub.subscribe() is not None
+
+    assert hub.subscribe() is None
+    assert hub.rejected_total == 1
+
+    hub.unsubscribe(first)
+    assert first.closed
+    assert hub.subscribe() is not None
+    assert len(hub) == 2
+
+def test_publish_without_subscribers_is_noop(make_payload):
+    hub = LiveStreamHub(max_subscribers=2, buffer_size=10)
+
+    hub.publish(1, make_payload())
+
+    assert hub.published_total == 0
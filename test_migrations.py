@@ -0,0 +1,162 @@
+"""
+스키마 마이그레이션 테스트
+"""
+
+from datetime import datetime
+import pytest
+from sqlalchemy import inspect, text
+from database import save_resource_batch
+from database.series import series_hash
+from database.migrations import (
+    ManualMigrationRequired, _0002_container_series, _0003_rollup_metric_counts, _migration_metadata,
+    get_applied_versions, run_migrations
+)
+
+METRICS = ("cpu_percentage", "memory_usage", "memory_percentage")
+
+@pytest.fixture(autouse=True)
+def _clear_migration_history(engine):
+    """적용 이력 테이블은 모델 메타데이터에 없으므로 테스트마다 직접 비웁니다."""
+    _migration_metadata.drop_all(bind=engine)
+
+# container_series 분리 이전의 containers 테이블
+LEGACY_CONTAINERS_DDL = """
+CREATE TABLE containers (
+    id INTEGER PRIMARY KEY,
+    host_id INTEGER REFERENCES hosts (id),
+    engine_type VARCHAR(100) NOT NULL,
+    cluster_name VARCHAR(255) NOT NULL,
+    node_name VARCHAR(255) NOT NULL,
+    container_name VARCHAR(255) NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    cpu_percentage FLOAT,
+    memory_usage FLOAT,
+    memory_percentage FLOAT,
+    get_datetime DATETIME
+)
+"""
+
+def _create_legacy_containers(engine, rows: int = 5) -> None:
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE containers"))
+        connection.execute(text(LEGACY_CONTAINERS_DDL))
+        connection.execute(text(
+            "CREATE INDEX ix_containers_container_name_get_datetime ON containers (container_name, get_datetime)"
+        ))
+        connection.execute(text("INSERT INTO hosts (host_name) VALUES ('host-1')"))
+        connection.execute(text(
+            "INSERT INTO containers (host_id, engine_type, cluster_name, node_name, container_name, status, "
+            "cpu_percentage, memory_usage, memory_percentage, get_datetime) "
+            "VALUES (1, 'docker', 'cluster-1', 'node-1', :name, 'running', :cpu, 100.0, 1.0, :when)"
+        ), [{"name": f"web-{index % 2}", "cpu": float(index), "when": datetime(2025, 6, 23, 3, index)} for index in range(rows)])
+
+def _assert_migrated(engine, rows: int = 5) -> None:
+    with engine.connect() as connection:
+        inspector = inspect(connection)
+        columns = {column["name"]: column for column in inspector.get_columns("containers")}
+        assert set(columns) == {"id", "series_id", "cpu_percentage", "memory_usage", "memory_percentage", "get_datetime", "host_id"}
+        assert columns["series_id"]["nullable"] is False
+        assert any(
+            foreign_key["referred_table"] == "container_series" and foreign_key["constrained_columns"] == ["series_id"]
+            for foreign_key in inspector.get_foreign_keys("containers")
+        )
+        assert "ix_containers_series_id_get_datetime" in {index["name"] for index in inspector.get_indexes("containers")}
+        migrated = connection.execute(text(
+            "SELECT c.id, s.container_name, c.cpu_percentage FROM containers c "
+            "JOIN container_series s ON s.id = c.series_id ORDER BY c.id"
+        )).all()
+        assert [tuple(row) for row in migrated] == [(index + 1, f"web-{index % 2}", float(index)) for index in range(rows)]
+        assert connection.execute(text("SELECT COUNT(*) FROM container_series")).scalar() == 2
+
+def test_0002_upgrades_legacy_containers(engine, db, make_payload):
+    _create_legacy_containers(engine)
+
+    applied = run_migrations(engine)
+
+    assert "0002" in applied
+    _assert_migrated(engine)
+    # 마이그레이션 이후 수집 저장이 정상 동작
+    [result] = save_resource_batch(db, [make_payload("host-1")])
+    assert result["containers_count"] == 2
+
+def test_0002_resumes_after_partial_backfill(engine):
+    _create_legacy_containers(engine)
+    # series_id 컬럼 추가, series 일부 등록, 일부 행만 채운 상태에서 중단된 경우
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE containers ADD COLUMN series_id INTEGER"))
+        connection.execute(text(
+            "INSERT INTO container_series (series_hash, engine_type, cluster_name, node_name, container_name, status) "
+            "VALUES (:hash, 'docker', 'cluster-1', 'node-1', 'web-0', 'running')"
+        ), {"hash": series_hash(("docker", "cluster-1", "node-1", "web-0", "running"))})
+        connection.execute(text("UPDATE containers SET series_id = 1 WHERE id = 1"))
+
+    with engine.connect() as connection:
+        _0002_container_series(connection)
+        connection.commit()
+
+    _assert_migrated(engine)
+
+def test_0002_finishes_constraints_when_columns_already_dropped(engine):
+    # 식별 컬럼 삭제 후 NOT NULL/외래키 변경 전에 중단된 경우
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE containers"))
+        connection.execute(text(
+            "CREATE TABLE containers (id INTEGER PRIMARY KEY, host_id INTEGER, series_id INTEGER, "
+            "cpu_percentage FLOAT, memory_usage FLOAT, memory_percentage FLOAT, get_datetime DATETIME)"
+        ))
+
+    with engine.connect() as connection:
+        _0002_container_series(connection)
+        connection.commit()
+
+    with engine.connect() as connection:
+        inspector = inspect(connection)
+        assert {column["name"]: column for column in inspector.get_columns("containers")}["series_id"]["nullable"] is False
+        assert [foreign_key["referred_table"] for foreign_key in inspector.get_foreign_keys("containers")].count("container_series") == 1
+
+def test_startup_does_not_apply_0002_to_legacy_schema(engine):
+    _create_legacy_containers(engine)
+
+    with pytest.raises(ManualMigrationRequired):
+        run_migrations(engine, allow_manual=False)
+
+    assert "0002" not in get_applied_versions(engine)
+    with engine.connect() as connection:
+        assert "container_name" in {column["name"] for column in inspect(connection).get_columns("containers")}
+
+def test_startup_records_0002_for_new_schema(engine):
+    applied = run_migrations(engine, allow_manual=False)
+
+    assert applied == ["0001", "0002", "0003"]
+
+def test_0003_adds_metric_counts_and_resets_host_rollups(engine):
+    with engine.begin() as connection:
+        for table_name in ("container_rollups", "host_rollups"):
+            for metric in METRICS:
+                connection.execute(text(f"ALTER TABLE {table_name} DROP COLUMN {metric}_count"))
+        connection.execute(text("INSERT INTO hosts (host_name) VALUES ('host-1')"))
+        connection.execute(text(
+            "INSERT INTO container_rollups (resolution, bucket_start, host_id, container_name, sample_count, "
+            "cpu_percentage_sum, memory_usage_sum, memory_percentage_sum) VALUES ('1h', :bucket, 1, 'web', 6, 3.0, 600.0, 12.0)"
+        ), {"bucket": datetime(2025, 6, 23, 3)})
+        connection.execute(text(
+            "INSERT INTO host_rollups (resolution, bucket_start, host_id, sample_count, cpu_percentage_sum) "
+            "VALUES ('1h', :bucket, 1, 6, 3.0)"
+        ), {"bucket": datetime(2025, 6, 23, 3)})
+        connection.execute(text("INSERT INTO rollup_watermarks (name, last_id) VALUES ('host_rollup', 42)"))
+
+    # 중간에 중단된 뒤 다시 실행되어도 같은 결과
+    for _ in range(2):
+        with engine.begin() as connection:
+            _0003_rollup_metric_counts(connection)
+
+    with engine.connect() as connection:
+        for table_name in ("container_rollups", "host_rollups"):
+            columns = {column["name"] for column in inspect(connection).get_columns(table_name)}
+            assert {f"{metric}_count" for metric in METRICS} <= columns
+        counts = connection.execute(text(
+            "SELECT cpu_percentage_count, memory_usage_count, memory_percentage_count FROM container_rollups"
+        )).one()
+        assert tuple(counts) == (6, 6, 6)
+        assert connection.execute(text("SELECT COUNT(*) FROM host_rollups")).scalar() == 0
+        assert connection.execute(text("SELECT COUNT(*) FROM rollup_watermarks WHERE name = 'host_rollup'")).scalar() == 0
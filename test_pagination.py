@@ -0,0 +1,85 @@
+"""
+keyset 페이지네이션(/api/containers, /api/hosts/{host_id}/containers, 커서 인코딩) 테스트
+"""
+
+from datetime import datetime, timedelta
+import pytest
+from database import save_resource_data
+from utils import encode_cursor, decode_cursor
+
+START = datetime(2025, 6, 23, 3, 0, 0)
+
+def _collect_pages(client, path: str, **params) -> tuple:
+    """X-Next-Cursor를 따라 모든 페이지를 읽어 (행 목록, 페이지 수)를 반환합니다."""
+    rows, pages, cursor = [], 0, None
+    while True:
+        response = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        rows.extend(response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return rows, pages
+        assert pages < 100
+
+def test_cursor_round_trip():
+    when = datetime(2025, 6, 23, 3, 2, 50, 123456)
+    assert decode_cursor(encode_cursor(when, 42)) == (when, 42)
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(START, 1)[:-3], "MjAyNS0wNi0yM3xhYmM"])
+def test_decode_cursor_rejects_malformed_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+def test_pages_are_continuous_across_equal_timestamps(client, db, make_payload):
+    # 같은 수집 시각의 기록 7행이 페이지 경계(limit=3)에 걸치는 경우
+    save_resource_data(db, make_payload("host-1", containers=7, when=START))
+    save_resource_data(db, make_payload("host-2", containers=2, when=START + timedelta(minutes=1)))
+
+    rows, pages = _collect_pages(client, "/api/containers", limit=3)
+
+    assert pages == 3
+    assert [row["id"] for row in rows] == list(range(1, 10))
+    assert [(row["host_id"], row["container_name"]) for row in rows[:7]] == [(1, f"container-{index}") for index in range(7)]
+
+def test_next_cursor_only_when_more_rows(client, db, make_payload):
+    save_resource_data(db, make_payload(containers=3, when=START))
+
+    exact = client.get("/api/containers", params={"limit": 3})
+    partial = client.get("/api/containers", params={"limit": 2})
+
+    assert "X-Next-Cursor" not in exact.headers
+    assert partial.headers["X-Next-Cursor"] == encode_cursor(START, 2)
+    assert 'rel="next"' in partial.headers["Link"]
+
+@pytest.mark.parametrize("path", ["/api/containers", "/api/hosts/1/containers"])
+def test_bad_cursor_returns_400(client, db, make_payload, path):
+    save_resource_data(db, make_payload(containers=1, when=START))
+
+    response = client.get(path, params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert "커서" in response.json()["detail"]
+
+def test_filters_apply_on_every_page(client, db, make_payload):
+    for minute in range(4):
+        save_resource_data(db, make_payload("host-1", containers=3, when=START + timedelta(minutes=minute)))
+        save_resource_data(db, make_payload("host-2", containers=3, when=START + timedelta(minutes=minute), cluster_name="cluster-2"))
+
+    rows, pages = _collect_pages(
+        client, "/api/hosts/1/containers", limit=2,
+        container_name="container-1", since=(START + timedelta(minutes=1)).isoformat()
+    )
+
+    assert pages == 2
+    assert [(row["host_id"], row["container_name"], row["get_datetime"]) for row in rows] == [
+        (1, "container-1", (START + timedelta(minutes=minute)).isoformat()) for minute in (1, 2, 3)
+    ]
+
+    rows, _ = _collect_pages(client, "/api/containers", limit=5, cluster_name="cluster-2")
+    assert len(rows) == 12
+    assert {row["cluster_name"] for row in rows} == {"cluster-2"}
+    assert [row["id"] for row in rows] == sorted(row["id"] for row in rows)
+
+def test_unknown_host_returns_404(client, engine):
+    assert client.get("/api/hosts/999/containers").status_code == 404
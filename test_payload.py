@@ -0,0 +1,164 @@
+"""
+MessagePack 컬럼 형식 본문과 요청 본문 압축 해제(RequestDecompressionMiddleware) 테스트
+"""
+
+import gzip
+import json
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from model import Container
+from utils import RequestDecompressionMiddleware
+from utils.payload import columnar_to_rows, decode_msgpack_resource
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 선택 의존성이 없으면 해당 테스트만 건너뜀
+requires_msgpack = pytest.mark.skipif(msgpack is None, reason="msgpack 패키지 필요")
+ZSTD = pytest.param(
+    "zstd", lambda data: zstandard.ZstdCompressor().compress(data),
+    marks=pytest.mark.skipif(zstandard is None, reason="zstandard 패키지 필요")
+)
+
+MAX_BODY_BYTES = 1024
+
+def _columnar_body(payload) -> dict:
+    data = payload.model_dump(mode="json")
+    rows = data["containers"]
+    data["containers"] = {name: [row[name] for row in rows] for name in rows[0]}
+    return data
+
+def test_columnar_to_rows():
+    assert columnar_to_rows({"a": [1, 2], "b": ["x", "y"]}) == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+    assert columnar_to_rows({}) == []
+
+@pytest.mark.parametrize("columns, message", [
+    ({"a": [1, 2], "b": ["x"]}, "길이"),
+    ({"a": [1, 2], "b": "x"}, "배열"),
+])
+def test_columnar_to_rows_rejects_malformed_columns(columns, message):
+    with pytest.raises(ValueError, match=message):
+        columnar_to_rows(columns)
+
+@requires_msgpack
+def test_decode_msgpack_resource_rejects_corrupt_body():
+    with pytest.raises(ValueError):
+        decode_msgpack_resource(b"\xc1")
+
+@requires_msgpack
+def test_msgpack_columnar_report_is_saved(client, db, make_payload):
+    body = msgpack.packb(_columnar_body(make_payload(containers=3)))
+
+    response = client.post("/api/resources", content=body, headers={"Content-Type": "application/msgpack"})
+
+    assert response.status_code == 200
+    assert db.scalars(select(Container.cpu_percentage).order_by(Container.id)).all() == [0.0, 1.0, 2.0]
+
+@requires_msgpack
+def test_msgpack_mismatched_column_lengths_return_400(client, db, make_payload):
+    data = _columnar_body(make_payload(containers=3))
+    data["containers"]["container_name"].pop()
+
+    response = client.post("/api/resources", content=msgpack.packb(data), headers={"Content-Type": "application/msgpack"})
+
+    assert response.status_code == 400
+    assert db.scalars(select(Container.id)).all() == []
+
+@requires_msgpack
+def test_msgpack_missing_column_returns_422(client, db, make_payload):
+    data = _columnar_body(make_payload(containers=2))
+    del data["containers"]["status"]
+
+    response = client.post("/api/resources", content=msgpack.packb(data), headers={"Content-Type": "application/msgpack"})
+
+    assert response.status_code == 422
+    assert db.scalars(select(Container.id)).all() == []
+
+@requires_msgpack
+@pytest.mark.parametrize("encoding, compress", [
+    ("gzip", gzip.compress),
+    ZSTD,
+])
+def test_compressed_reports_are_decoded(client, db, make_payload, encoding, compress):
+    json_body = make_payload(containers=2).model_dump_json().encode()
+    msgpack_body = msgpack.packb(_columnar_body(make_payload("host-2", containers=2)))
+
+    json_response = client.post(
+        "/api/resources", content=compress(json_body),
+        headers={"Content-Type": "application/json", "Content-Encoding": encoding}
+    )
+    msgpack_response = client.post(
+        "/api/resources", content=compress(msgpack_body),
+        headers={"Content-Type": "application/msgpack", "Content-Encoding": encoding}
+    )
+
+    assert (json_response.status_code, msgpack_response.status_code) == (200, 200)
+    assert len(db.scalars(select(Container.id)).all()) == 4
+
+@pytest.fixture
+def echo_client():
+    """압축 해제된 본문 길이와 헤더를 돌려주는 최소 앱 (본문 최대 MAX_BODY_BYTES)"""
+    async def echo(request):
+        body = await request.body()
+        return Response(json.dumps({
+            "length": len(body),
+            "content_length": request.headers.get("content-length"),
+            "content_encoding": request.headers.get("content-encoding")
+        }))
+
+    app = Starlette(routes=[Route("/", echo, methods=["POST"])])
+    return TestClient(RequestDecompressionMiddleware(app, max_body_bytes=MAX_BODY_BYTES))
+
+@pytest.mark.parametrize("encoding, compress", [
+    ("gzip", gzip.compress),
+    ("x-gzip", gzip.compress),
+    ZSTD,
+])
+def test_middleware_replaces_body_and_headers(echo_client, encoding, compress):
+    response = echo_client.post("/", content=compress(b"a" * MAX_BODY_BYTES), headers={"Content-Encoding": encoding})
+
+    assert response.json() == {"length": MAX_BODY_BYTES, "content_length": str(MAX_BODY_BYTES), "content_encoding": None}
+
+@pytest.mark.parametrize("encoding, compress", [
+    ("gzip", gzip.compress),
+    ZSTD,
+])
+def test_decompression_bomb_returns_413(echo_client, encoding, compress):
+    # 압축된 크기는 작지만 풀면 최대 크기를 넘는 본문
+    body = compress(b"\0" * (MAX_BODY_BYTES * 100))
+    assert len(body) < MAX_BODY_BYTES
+
+    response = echo_client.post("/", content=body, headers={"Content-Encoding": encoding})
+
+    assert response.status_code == 413
+
+def test_compressed_body_over_limit_returns_413(echo_client):
+    response = echo_client.post("/", content=b"\0" * (MAX_BODY_BYTES + 1), headers={"Content-Encoding": "gzip"})
+
+    assert response.status_code == 413
+
+def test_unknown_encoding_returns_415(echo_client):
+    response = echo_client.post("/", content=b"data", headers={"Content-Encoding": "br"})
+
+    assert response.status_code == 415
+    assert "br" in response.json()["detail"]
+
+def test_truncated_gzip_returns_400(echo_client):
+    response = echo_client.post("/", content=gzip.compress(b"a" * 100)[:-10], headers={"Content-Encoding": "gzip"})
+
+    assert response.status_code == 400
+
+def test_identity_body_is_passed_through(echo_client):
+    response = echo_client.post("/", content=b"plain", headers={"Content-Encoding": "identity"})
+
+    assert response.json()["length"] == 5
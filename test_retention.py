@@ -0,0 +1,146 @@
+"""
+데이터 보존 정리(RetentionWorker, database/retention.py) 테스트
+"""
+
+import asyncio
+import importlib
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from sqlalchemy import func, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session
+from model import Container, HostMetric
+from database import (
+    save_resource_data, delete_expired_chunk, delete_expired_host_metrics_chunk,
+    get_host_retention_boundary, delete_host_excess_chunk
+)
+from database.retention import _delete_chunk
+from services.retention import RetentionWorker
+
+# services 패키지는 같은 이름의 전역 인스턴스(retention_worker)를 내보내므로 모듈은 import_module로 가져옴
+retention_module = importlib.import_module("services.retention")
+
+START = datetime(2025, 6, 23, 3, 0, 0)
+
+def _patch_database(monkeypatch, engine) -> list:
+    """run_db_task를 테스트 DB에서 바로 실행하도록 바꾸고, 호출한 함수 이름 목록을 반환합니다."""
+    calls = []
+
+    async def run_db_task(fn, *args, **kwargs):
+        calls.append(fn.__name__)
+        assert len(calls) < 100, "삭제 루프가 끝나지 않습니다."
+        with Session(engine) as db:
+            return fn(db, *args, **kwargs)
+
+    monkeypatch.setattr(retention_module, "run_db_task", run_db_task)
+    return calls
+
+def _make_worker(**overrides) -> RetentionWorker:
+    options = {"retention_days": 0, "max_records_per_host": 0, "interval_hours": 24, "batch_size": 1000, "batch_pause_ms": 0}
+    options.update(overrides)
+    return RetentionWorker(**options)
+
+def test_zero_batch_size_and_interval_are_clamped(engine, db, make_payload, monkeypatch):
+    calls = _patch_database(monkeypatch, engine)
+    for minute in range(3):
+        save_resource_data(db, make_payload(containers=1, when=START + timedelta(minutes=minute)))
+    worker = _make_worker(retention_days=1, interval_hours=0, batch_size=0)
+
+    result = asyncio.run(worker.run())
+
+    assert (worker.batch_size, worker.task.interval_seconds) == (1, 3600)
+    assert result["expired_rows"] == 6
+    assert db.scalar(select(func.count()).select_from(Container)) == 0
+    # 1행씩 삭제하며 마지막 빈 배치에서 종료
+    assert calls.count("delete_expired_chunk") == 4
+    assert calls.count("delete_expired_host_metrics_chunk") == 4
+
+def test_max_records_per_host_applies_to_host_metrics(engine, db, make_payload, monkeypatch):
+    _patch_database(monkeypatch, engine)
+    for minute in range(5):
+        save_resource_data(db, make_payload("host-1", containers=1, when=START + timedelta(minutes=minute)))
+        save_resource_data(db, make_payload("host-2", containers=1, when=START + timedelta(minutes=minute)))
+    worker = _make_worker(max_records_per_host=2, batch_size=2)
+
+    result = asyncio.run(worker.run())
+
+    # 호스트 2개 x (containers 3행 + host_metrics 3행)
+    assert result["excess_rows"] == 12
+    for model in (Container, HostMetric):
+        kept = db.execute(select(model.host_id, model.get_datetime).order_by(model.host_id, model.get_datetime)).all()
+        assert [tuple(row) for row in kept] == [
+            (host_id, START + timedelta(minutes=minute)) for host_id in (1, 2) for minute in (3, 4)
+        ]
+
+def test_expired_chunks_delete_only_rows_before_cutoff(db, make_payload):
+    for minute in range(4):
+        save_resource_data(db, make_payload(containers=2, when=START + timedelta(minutes=minute)))
+    cutoff = START + timedelta(minutes=2)
+
+    assert delete_expired_chunk(db, cutoff, batch_size=3) == 3
+    assert delete_expired_chunk(db, cutoff, batch_size=3) == 1
+    assert delete_expired_chunk(db, cutoff, batch_size=3) == 0
+    assert delete_expired_host_metrics_chunk(db, cutoff, batch_size=10) == 2
+
+    for model in (Container, HostMetric):
+        assert db.scalar(select(func.min(model.get_datetime))) == cutoff
+    assert db.scalar(select(func.count()).select_from(Container)) == 4
+
+def test_host_boundary_breaks_ties_on_equal_get_datetime(db, make_payload):
+    # 같은 수집 시각의 기록 5행 중 id가 큰 2행만 남겨야 함
+    save_resource_data(db, make_payload(containers=5, when=START))
+    save_resource_data(db, make_payload("host-2", containers=5, when=START))
+    ids = db.scalars(select(Container.id).where(Container.host_id == 1).order_by(Container.id)).all()
+
+    boundary = get_host_retention_boundary(db, host_id=1, keep=2)
+
+    assert boundary == (START, ids[2])
+    assert delete_host_excess_chunk(db, 1, boundary, batch_size=2) == 2
+    assert delete_host_excess_chunk(db, 1, boundary, batch_size=2) == 1
+    assert delete_host_excess_chunk(db, 1, boundary, batch_size=2) == 0
+    assert db.scalars(select(Container.id).where(Container.host_id == 1).order_by(Container.id)).all() == ids[3:]
+    # 다른 호스트의 기록은 그대로
+    assert db.scalar(select(func.count()).select_from(Container).where(Container.host_id == 2)) == 5
+    assert get_host_retention_boundary(db, host_id=1, keep=2) is None
+
+class _RecordingSession:
+    """실행한 문장을 기록하는 세션 (MySQL 분기는 SQL만 확인)"""
+
+    def __init__(self, dialect_name: str):
+        self.dialect_name = dialect_name
+        self.statements = []
+        self.committed = False
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name=self.dialect_name))
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(rowcount=2, scalars=lambda: SimpleNamespace(all=lambda: [1, 2]))
+
+    def commit(self):
+        self.committed = True
+
+def test_mysql_deletes_with_limit_in_one_statement():
+    db = _RecordingSession("mysql")
+    table = Container.__table__
+
+    deleted = _delete_chunk(db, table, [table.c.get_datetime < START], [table.c.get_datetime, table.c.id], 500)
+
+    [stmt] = db.statements
+    sql = str(stmt.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert sql.startswith("DELETE FROM containers WHERE")
+    assert sql.endswith("LIMIT 500")
+    assert (deleted, db.committed) == (2, True)
+
+def test_other_databases_select_ids_then_delete():
+    db = _RecordingSession("sqlite")
+    table = Container.__table__
+
+    deleted = _delete_chunk(db, table, [table.c.get_datetime < START], [table.c.get_datetime, table.c.id], 500)
+
+    select_stmt, delete_stmt = db.statements
+    select_sql = str(select_stmt.compile(compile_kwargs={"literal_binds": True}))
+    assert "ORDER BY containers.get_datetime, containers.id" in select_sql and "LIMIT 500" in select_sql
+    assert str(delete_stmt.compile(compile_kwargs={"literal_binds": True})).endswith("WHERE containers.id IN (1, 2)")
+    assert (deleted, db.committed) == (2, True)
@@ -0,0 +1,116 @@
+"""
+시계열 롤업 집계 테스트
+"""
+
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert, select
+from model import HostMetric
+from database import (
+    save_resource_data, get_max_container_id, get_max_host_metric_id, process_rollups, process_host_rollups,
+    get_container_rollups, get_host_rollups
+)
+
+START = datetime(2025, 6, 23, 3, 0, 0)
+UNTIL = START + timedelta(hours=1)
+
+def _process_all(db, batch_size: int = 1000) -> None:
+    container_upper_id = get_max_container_id(db)
+    host_upper_id = get_max_host_metric_id(db)
+    while process_rollups(db, container_upper_id, batch_size):
+        pass
+    while process_host_rollups(db, host_upper_id, batch_size):
+        pass
+
+def test_host_rollups_use_host_metrics(db, make_payload):
+    for minute in range(3):
+        save_resource_data(db, make_payload(
+            containers=2, when=START + timedelta(minutes=minute), host_cpu=1.5, host_memory_percentage=10.0
+        ))
+
+    _process_all(db)
+
+    [host], _ = get_host_rollups(db, "1h", START, UNTIL, limit=10)
+    assert host["sample_count"] == 3
+    assert host["cpu_percentage_avg"] == pytest.approx(1.5)
+    assert host["memory_percentage_avg"] == pytest.approx(10.0)
+    assert host["memory_usage_max"] == pytest.approx(1024.0)
+
+    containers, _ = get_container_rollups(db, "1h", START, UNTIL, limit=10)
+    assert [point["container_name"] for point in containers] == ["container-0", "container-1"]
+    assert [point["sample_count"] for point in containers] == [3, 3]
+    assert [point["cpu_percentage_avg"] for point in containers] == [0.0, 1.0]
+
+def test_incremental_batches_match_single_pass(db, make_payload):
+    for minute in range(4):
+        save_resource_data(db, make_payload(containers=3, when=START + timedelta(minutes=minute), host_cpu=float(minute)))
+
+    _process_all(db, batch_size=2)
+
+    [host], _ = get_host_rollups(db, "1h", START, UNTIL, limit=10)
+    assert host["sample_count"] == 4
+    assert (host["cpu_percentage_min"], host["cpu_percentage_max"], host["cpu_percentage_last"]) == (0.0, 3.0, 3.0)
+    assert host["cpu_percentage_avg"] == pytest.approx(1.5)
+    assert [point["sample_count"] for point in get_container_rollups(db, "1h", START, UNTIL, limit=10)[0]] == [4, 4, 4]
+
+def test_null_metrics_are_excluded(db, make_payload):
+    save_resource_data(db, make_payload(containers=0, when=START, host_cpu=4.0))
+    host_id = db.scalar(select(HostMetric.host_id))
+    db.execute(insert(HostMetric), [
+        {"host_id": host_id, "cpu_percentage": None, "memory_usage": None, "memory_percentage": None,
+         "get_datetime": START + timedelta(minutes=1)},
+        {"host_id": host_id, "cpu_percentage": 2.0, "memory_usage": None, "memory_percentage": None,
+         "get_datetime": START + timedelta(minutes=2)},
+    ])
+    db.commit()
+
+    _process_all(db, batch_size=1)
+
+    [host], _ = get_host_rollups(db, "1h", START, UNTIL, limit=10)
+    assert host["sample_count"] == 3
+    assert (host["cpu_percentage_min"], host["cpu_percentage_max"], host["cpu_percentage_last"]) == (2.0, 4.0, 2.0)
+    assert host["cpu_percentage_avg"] == pytest.approx(3.0)
+    assert host["memory_usage_avg"] == pytest.approx(1024.0)
+    assert host["memory_usage_last"] == pytest.approx(1024.0)
+
+    # 모든 값이 NULL인 버킷은 0이 아닌 null로 응답
+    minute_buckets = {point["bucket_start"]: point for point in get_host_rollups(db, "1m", START, UNTIL, limit=10)[0]}
+    null_bucket = minute_buckets[START + timedelta(minutes=1)]
+    assert null_bucket["sample_count"] == 1
+    assert null_bucket["cpu_percentage_min"] is None
+    assert null_bucket["cpu_percentage_avg"] is None
+
+def test_rollup_pages_cover_range_without_gaps(db, make_payload):
+    for minute in range(5):
+        save_resource_data(db, make_payload(containers=3, when=START + timedelta(minutes=minute)))
+    _process_all(db)
+
+    # 같은 bucket_start의 컨테이너 3개가 페이지 경계에 걸치도록 limit=4로 조회
+    points, after, pages = [], None, 0
+    while True:
+        page, after = get_container_rollups(db, "1m", START, UNTIL, limit=4, after=after)
+        points.extend(page)
+        pages += 1
+        if after is None:
+            break
+
+    assert pages == 4
+    assert len(points) == 15
+    assert {(point["bucket_start"], point["container_name"]) for point in points} == {
+        (START + timedelta(minutes=minute), f"container-{index}") for minute in range(5) for index in range(3)
+    }
+    assert [point["bucket_start"] for point in points] == sorted(point["bucket_start"] for point in points)
+
+def test_rollup_api_returns_next_cursor(client, db, make_payload):
+    for minute in range(3):
+        save_resource_data(db, make_payload(containers=2, when=START + timedelta(minutes=minute)))
+    _process_all(db)
+    params = {"since": START.isoformat(), "until": UNTIL.isoformat(), "resolution": "1m", "limit": 4}
+
+    first = client.get("/api/rollups/containers", params=params)
+    second = client.get("/api/rollups/containers", params={**params, "cursor": first.headers["X-Next-Cursor"]})
+
+    assert (first.status_code, len(first.json())) == (200, 4)
+    assert (second.status_code, len(second.json())) == (200, 2)
+    assert "X-Next-Cursor" not in second.headers
+    assert client.get("/api/rollups/hosts", params={**params, "cursor": "bad"}).status_code == 400
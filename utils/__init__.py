@@ -5,11 +5,47 @@ Utils 패키지 - 유틸리티 함수들을 관리합니다.
 from .utils import (
     make_json_result,
     log_received_data,
-    log_exception_with_traceback
+    log_exception_with_traceback,
+    encode_cursor,
+    decode_cursor
+)
+from .export import stream_export, accepts_gzip, EXPORT_MEDIA_TYPES
+from .payload import MSGPACK_MEDIA_TYPES, is_msgpack_request, decode_msgpack_resource
+from .compression import RequestDecompressionMiddleware, get_supported_encodings
+from .serialization import FastJSONResponse, dump_json, rows_to_dicts
+from .cors import ReloadableCORSMiddleware
+from .timing import ServerTimingMiddleware, ServerTimingRoute, server_timing
+from .metrics import (
+    registry, MetricsMiddleware, METRICS_ENABLED, PROMETHEUS_CONTENT_TYPE,
+    INGEST_HOST_ROWS, INGEST_CONTAINER_ROWS, INGEST_PAYLOAD_BYTES
 )
 
 __all__ = [
     "make_json_result",
     "log_received_data",
-    "log_exception_with_traceback"
+    "log_exception_with_traceback",
+    "encode_cursor",
+    "decode_cursor",
+    "stream_export",
+    "accepts_gzip",
+    "EXPORT_MEDIA_TYPES",
+    "MSGPACK_MEDIA_TYPES",
+    "is_msgpack_request",
+    "decode_msgpack_resource",
+    "RequestDecompressionMiddleware",
+    "get_supported_encodings",
+    "FastJSONResponse",
+    "dump_json",
+    "rows_to_dicts",
+    "ReloadableCORSMiddleware",
+    "registry",
+    "MetricsMiddleware",
+    "METRICS_ENABLED",
+    "PROMETHEUS_CONTENT_TYPE",
+    "INGEST_HOST_ROWS",
+    "INGEST_CONTAINER_ROWS",
+    "INGEST_PAYLOAD_BYTES",
+    "ServerTimingMiddleware",
+    "ServerTimingRoute",
+    "server_timing"
 ] 
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""
+요청 본문 압축 해제 - Content-Encoding: gzip/zstd 요청 본문을 풀어 애플리케이션에 전달합니다.
+"""
+
+import io
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 (Content-Encoding: zstd 요청에만 필요)
+    zstandard = None
+
+class DecompressedBodyTooLarge(ValueError):
+    pass
+
+def _decompress_gzip(body: bytes, max_bytes: int) -> bytes:
+    # wbits=47: gzip/zlib 헤더 자동 인식
+    decompressor = zlib.decompressobj(wbits=47)
+    data = decompressor.decompress(body, max_bytes + 1)
+    if len(data) > max_bytes or decompressor.unconsumed_tail:
+        raise DecompressedBodyTooLarge()
+    if not decompressor.eof:
+        raise ValueError("gzip 데이터가 완전하지 않습니다.")
+    return data
+
+def _decompress_zstd(body: bytes, max_bytes: int) -> bytes:
+    chunks = []
+    size = 0
+    with zstandard.ZstdDecompressor().stream_reader(io.BytesIO(body)) as reader:
+        while True:
+            chunk = reader.read(64 * 1024)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise DecompressedBodyTooLarge()
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+def get_supported_encodings() -> Dict[str, Callable[[bytes, int], bytes]]:
+    decoders = {"gzip": _decompress_gzip, "x-gzip": _decompress_gzip}
+    if zstandard is not None:
+        decoders["zstd"] = _decompress_zstd
+    return decoders
+
+class RequestDecompressionMiddleware:
+    """
+    Content-Encoding이 지정된 요청 본문의 압축을 풀어 전달하는 ASGI 미들웨어.
+
+    압축 해제 후 Content-Encoding 헤더를 제거하고 Content-Length를 갱신하므로
+    엔드포인트는 압축 여부와 무관하게 동일하게 본문을 처리합니다.
+    압축 폭탄을 막기 위해 압축 해제 크기가 max_body_bytes를 넘으면 413을 반환합니다.
+    """
+
+    def __init__(self, app, max_body_bytes: int):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.decoders = get_supported_encodings()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = Headers(scope=scope).get("content-encoding", "").strip().lower()
+        if not encoding or encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+
+        decoder = self.decoders.get(encoding)
+        if decoder is None:
+            response = JSONResponse(
+                {"detail": f"지원하지 않는 Content-Encoding입니다: {encoding} (지원: {', '.join(self.decoders)})"},
+                status_code=415
+            )
+            await response(scope, receive, send)
+            return
+
+        body = await self._read_body(receive)
+        if body is None:
+            response = JSONResponse(
+                {"detail": f"요청 본문이 최대 크기({self.max_body_bytes} bytes)를 넘습니다."},
+                status_code=413
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            body = decoder(body, self.max_body_bytes)
+        except DecompressedBodyTooLarge:
+            response = JSONResponse(
+                {"detail": f"압축 해제한 요청 본문이 최대 크기({self.max_body_bytes} bytes)를 넘습니다."},
+                status_code=413
+            )
+            await response(scope, receive, send)
+            return
+        except Exception as e:
+            response = JSONResponse({"detail": f"요청 본문 압축 해제 실패 ({encoding}): {str(e)}"}, status_code=400)
+            await response(scope, receive, send)
+            return
+
+        headers: List[Tuple[bytes, bytes]] = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+
+        sent = False
+
+        async def receive_decompressed():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        # scope를 복사하지 않고 갱신하여 바깥 미들웨어도 라우팅 결과(scope["route"])를 볼 수 있게 함
+        scope["headers"] = headers
+        await self.app(scope, receive_decompressed, send)
+
+    async def _read_body(self, receive) -> Optional[bytes]:
+        """압축된 요청 본문을 읽습니다. max_body_bytes를 넘으면 None을 반환합니다."""
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
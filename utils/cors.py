@@ -0,0 +1,33 @@
+"""
+CORS 처리 - 설정을 다시 읽으면 새 [cors] 설정으로 CORS 미들웨어를 교체합니다.
+"""
+
+from typing import Optional
+from starlette.middleware.cors import CORSMiddleware
+from config.config import config, get_cors_config, Settings
+
+class ReloadableCORSMiddleware:
+    """
+    현재 설정 스냅샷의 [cors] 값으로 만든 CORSMiddleware에 요청을 넘기는 ASGI 미들웨어.
+
+    CORSMiddleware는 생성 시점에 허용 목록을 계산하므로, 설정 스냅샷이 교체된 뒤 첫 요청에서만 다시 만듭니다.
+    (요청마다 스냅샷 객체 비교 한 번만 수행)
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._settings: Optional[Settings] = None
+        self._cors: Optional[CORSMiddleware] = None
+
+    def _current(self) -> CORSMiddleware:
+        settings = config.settings
+        if settings is not self._settings:
+            self._cors = CORSMiddleware(self.app, **get_cors_config())
+            self._settings = settings
+        return self._cors
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await self._current()(scope, receive, send)
@@ -0,0 +1,112 @@
+"""
+데이터 내보내기 - 조회 결과를 NDJSON/CSV 바이트 스트림으로 변환합니다.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Sequence
+
+# 압축 출력 버퍼 크기 (이 크기가 쌓이면 클라이언트로 전송)
+FLUSH_BYTES = 64 * 1024
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv"
+}
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Accept-Encoding 헤더가 gzip 응답을 허용하는지 확인합니다.
+    
+    gzip 또는 *가 q=0이 아닌 값으로 포함되어 있으면 True를 반환합니다. (gzip;q=0은 거부로 처리)
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"직렬화할 수 없는 타입입니다: {type(value)}")
+
+def _encode_ndjson(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(columns, row)), default=_json_default, ensure_ascii=False) + "\n"
+        for row in rows
+    ).encode("utf-8")
+
+def _encode_csv(rows: Iterable[Sequence[Any]]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows(
+        [value.isoformat() if isinstance(value, datetime) else value for value in row]
+        for row in rows
+    )
+    return buffer.getvalue().encode("utf-8")
+
+def stream_export(
+    columns: Sequence[str],
+    chunks: Iterable[Sequence[Sequence[Any]]],
+    export_format: str = "ndjson",
+    compress: bool = True
+) -> Iterator[bytes]:
+    """
+    행 묶음(chunk) 이터레이터를 NDJSON 또는 CSV 바이트 스트림으로 변환합니다.
+    
+    chunk 단위로 인코딩/압축하여 바로 내보내므로 전체 결과 크기와 무관하게
+    메모리 사용량이 일정하게 유지됩니다.
+    
+    Args:
+        columns: 컬럼 이름 (NDJSON 키, CSV 헤더)
+        chunks: 행 튜플 리스트의 이터레이터
+        export_format: "ndjson" 또는 "csv"
+        compress: True면 gzip 스트림으로 압축
+        
+    Returns:
+        Iterator[bytes]: 응답 본문 바이트 조각
+    """
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise ValueError(f"지원하지 않는 형식입니다: {export_format}")
+    
+    # wbits=31: gzip 헤더/트레일러 포함
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    pending = []
+    pending_size = 0
+    
+    def encode(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+    
+    if export_format == "csv":
+        pending.append(encode(_encode_csv([columns])))
+    
+    for rows in chunks:
+        if export_format == "ndjson":
+            data = encode(_encode_ndjson(columns, rows))
+        else:
+            data = encode(_encode_csv(rows))
+        
+        if data:
+            pending.append(data)
+            pending_size += len(data)
+        if pending_size >= FLUSH_BYTES:
+            yield b"".join(pending)
+            pending = []
+            pending_size = 0
+    
+    if compressor:
+        pending.append(compressor.flush())
+    if pending:
+        yield b"".join(pending)
@@ -0,0 +1,218 @@
+"""
+운영 지표 - Prometheus 텍스트 형식(/metrics)으로 노출하는 카운터/게이지/히스토그램을 관리합니다.
+
+지표 갱신은 잠금 한 번과 정수/실수 덧셈만 수행하므로 요청 처리 경로에 거의 비용을 더하지 않으며,
+문자열 변환은 /metrics 조회 시에만 일어납니다. 외부 패키지(prometheus_client) 없이 동작합니다.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from config.config import config
+
+# 지표 수집 설정 ([metrics] enabled)
+METRICS_ENABLED = config.get_metrics_enabled()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 기본 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 요청 본문 크기 버킷 (bytes)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+
+LabelValues = Tuple[str, ...]
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    """단조 증가 카운터 (rate()로 초당 처리량 계산)"""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, labels: LabelValues = ()) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: LabelValues = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items()) or ([((), 0)] if not self.label_names else [])
+        lines = self._header()
+        for labels, value in values:
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}")
+        return lines
+
+class Gauge(_Metric):
+    """조회 시점에 콜백으로 값을 읽는 게이지 (갱신 비용 없음)"""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], Iterable[Tuple[LabelValues, float]]], labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, value in self.callback():
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}")
+        return lines
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (histogram_quantile()로 p50/p95/p99 계산)"""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float] = LATENCY_BUCKETS, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 -> [버킷별 개수(+Inf 포함), 합계]
+        self._series: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, labels: LabelValues = ()) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            snapshot = [(labels, list(counts), total) for labels, (counts, total) in self._series.items()]
+        lines = self._header()
+        for labels, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                bucket_label = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, bucket_label)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, buckets: Sequence[float] = LATENCY_BUCKETS, labels: Sequence[str] = ()) -> Histogram:
+        return self.register(Histogram(name, documentation, buckets, labels))
+
+    def gauge(self, name: str, documentation: str, callback: Callable[[], Iterable[Tuple[LabelValues, float]]], labels: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, callback, labels))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# 전역 지표 레지스트리
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (라우트별)", labels=("method", "route")
+)
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP 요청 수 (라우트/상태 코드별)", labels=("method", "route", "status")
+)
+INGEST_HOST_ROWS = registry.counter(
+    "ingest_host_rows_total", "저장된 호스트 자원 사용량 행 수 (host_metrics)"
+)
+INGEST_CONTAINER_ROWS = registry.counter(
+    "ingest_container_rows_total", "저장된 컨테이너 자원 사용량 행 수 (containers)"
+)
+INGEST_PAYLOAD_BYTES = registry.histogram(
+    "ingest_payload_bytes", "수집 요청 본문 크기 (압축 해제 후)", buckets=SIZE_BUCKETS, labels=("endpoint", "format")
+)
+DB_COMMIT_DURATION = registry.histogram(
+    "db_commit_duration_seconds", "세션 COMMIT 소요 시간 (flush 포함)"
+)
+DB_POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds", "연결 풀에서 연결을 얻기까지 걸린 시간", labels=("engine",)
+)
+DB_POOL_CHECKOUTS = registry.counter(
+    "db_pool_checkouts_total", "연결 풀 체크아웃 수", labels=("engine",)
+)
+
+class MetricsMiddleware:
+    """
+    라우트별 요청 처리 시간/요청 수를 기록하는 ASGI 미들웨어.
+
+    라벨은 실제 경로가 아닌 라우트 경로 템플릿(/api/hosts/{host_id})을 사용하여 시계열 수가 늘어나지 않게 합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - start, (method, route_path))
+            HTTP_REQUESTS.inc(labels=(method, route_path, str(status_code)))
@@ -0,0 +1,71 @@
+"""
+수집 데이터 디코딩 - MessagePack 요청 본문과 컬럼 형식(columnar) 컨테이너 데이터를 변환합니다.
+
+MessagePack 본문은 JSON과 같은 구조이되, containers를 필드별 배열로 보낼 수 있습니다.
+
+    {
+        "host": {"host_name": "...", "cpu_percentage": 3.9, ...},
+        "containers": {
+            "engine_type": ["docker", "docker"],
+            "container_name": ["tomcat1", "tomcat2"],
+            ...
+        }
+    }
+"""
+
+from typing import Any, Dict, List, Optional
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성 (application/msgpack 요청에만 필요)
+    msgpack = None
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+def is_msgpack_request(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+def unpack_msgpack(body: bytes) -> Any:
+    """
+    MessagePack 본문을 디코딩합니다.
+
+    Raises:
+        RuntimeError: msgpack 패키지가 설치되지 않은 경우
+        ValueError: 올바른 MessagePack 데이터가 아닌 경우
+    """
+    if msgpack is None:
+        raise RuntimeError("MessagePack 요청을 처리하려면 msgpack 패키지가 필요합니다.")
+    try:
+        # timestamp=3: MessagePack Timestamp 확장 타입을 datetime(UTC)으로 디코딩
+        return msgpack.unpackb(body, raw=False, timestamp=3)
+    except Exception as e:
+        raise ValueError(f"잘못된 MessagePack 본문입니다: {str(e) or type(e).__name__}")
+
+def columnar_to_rows(columns: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    필드별 배열({"필드": [값, ...]})을 행 목록([{"필드": 값}, ...])으로 변환합니다.
+
+    Raises:
+        ValueError: 배열이 아닌 값이 있거나 배열 길이가 서로 다른 경우
+    """
+    for name, values in columns.items():
+        if not isinstance(values, list):
+            raise ValueError(f"containers.{name}는 배열이어야 합니다.")
+    if len({len(values) for values in columns.values()}) > 1:
+        raise ValueError("containers의 필드별 배열 길이가 서로 다릅니다.")
+
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+def decode_msgpack_resource(body: bytes) -> Any:
+    """
+    MessagePack 본문을 SystemResourceData 검증에 넘길 dict로 변환합니다.
+
+    containers가 필드별 배열(dict)이면 행 목록으로 펼치고, 행 목록(list)이면 그대로 사용합니다.
+    """
+    data = unpack_msgpack(body)
+    if isinstance(data, dict) and isinstance(data.get("containers"), dict):
+        data["containers"] = columnar_to_rows(data["containers"])
+    return data
@@ -0,0 +1,27 @@
+"""
+응답 직렬화 - 조회 결과를 응답 모델 재검증 없이 바로 JSON으로 렌더링합니다.
+
+목록 조회 엔드포인트는 DB에서 응답 모델 필드 순서의 컬럼 튜플을 받아 dict로 묶고,
+FastJSONResponse(orjson)로 바로 인코딩합니다. 엔드포인트의 response_model은 그대로 두므로
+OpenAPI 문서의 응답 스키마는 바뀌지 않습니다.
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence
+import orjson
+from starlette.responses import Response
+
+def dump_json(content: Any) -> bytes:
+    """content를 JSON 바이트로 인코딩합니다. (naive datetime은 pydantic과 같은 ISO 8601 문자열)"""
+    return orjson.dumps(content)
+
+class FastJSONResponse(Response):
+    """응답 모델 검증/jsonable_encoder를 거치지 않고 content를 바로 인코딩하는 JSON 응답"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+def rows_to_dicts(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> List[Dict[str, Any]]:
+    """컬럼 튜플 행들을 {컬럼: 값} dict 목록으로 변환합니다."""
+    return [dict(zip(columns, row)) for row in rows]
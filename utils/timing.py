@@ -0,0 +1,118 @@
+"""
+요청별 처리 시간 분석 - 검증/DB/직렬화 구간 시간을 모아 Server-Timing 응답 헤더로 반환합니다.
+
+ServerTimingMiddleware가 요청마다 RequestTimings를 ContextVar에 넣고, 각 구간은 server_timing(name)으로 감쌉니다.
+스레드풀(sync 모드 DB 작업, sync 엔드포인트)에도 컨텍스트가 복사되므로 같은 RequestTimings에 기록됩니다.
+
+    Server-Timing: validation;dur=0.42, db;dur=3.10, serialization;dur=0.08, total;dur=4.05
+"""
+
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from fastapi.routing import APIRoute
+
+class RequestTimings:
+    """한 요청의 구간 이름 -> 누적 시간(초)"""
+
+    __slots__ = ("durations", "endpoint_done")
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+        # 엔드포인트 함수가 반환한 시각 (이후 응답 생성까지를 serialization으로 기록)
+        self.endpoint_done: Optional[float] = None
+
+    def add(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def header_value(self, total: float) -> str:
+        entries: List[Tuple[str, float]] = list(self.durations.items())
+        entries.append(("total", total))
+        return ", ".join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in entries)
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("server_timing", default=None)
+
+@contextmanager
+def server_timing(name: str) -> Iterator[None]:
+    """현재 요청의 name 구간 시간을 기록합니다. Server-Timing이 꺼져 있으면 아무것도 하지 않습니다."""
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - start)
+
+def _mark_endpoint_done() -> None:
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.endpoint_done = time.perf_counter()
+
+def _wrap_endpoint(endpoint: Callable) -> Callable:
+    # functools.wraps로 시그니처(__wrapped__)를 유지하므로 FastAPI의 파라미터/응답 모델 분석은 그대로 동작
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _mark_endpoint_done()
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def sync_wrapper(*args, **kwargs):
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            _mark_endpoint_done()
+    return sync_wrapper
+
+class ServerTimingRoute(APIRoute):
+    """엔드포인트 함수가 반환한 뒤 응답 객체가 만들어질 때까지(응답 모델 검증 + JSON 인코딩)를 serialization으로 기록하는 라우트"""
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _wrap_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request):
+            response = await handler(request)
+            timings = _current_timings.get()
+            if timings is not None and timings.endpoint_done is not None:
+                timings.add("serialization", time.perf_counter() - timings.endpoint_done)
+                timings.endpoint_done = None
+            return response
+
+        return timed_handler
+
+class ServerTimingMiddleware:
+    """요청마다 구간별 처리 시간을 모아 응답 시작 시 Server-Timing 헤더를 추가하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        start = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                header = timings.header_value(time.perf_counter() - start)
+                message["headers"] = [*message.get("headers", []), (b"server-timing", header.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_timings.reset(token)
@@ -1,11 +1,29 @@
 from collections import OrderedDict
-from typing import Any, Optional
+from datetime import datetime
+from typing import Any, Optional, Tuple
+import base64
+import itertools
 import traceback
 import logging
+from config.config import config, Settings
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# 수신 데이터 로그 방식 ([logging] payload_mode, payload_sample_rate)
+PAYLOAD_LOG_MODE = config.get_logging_payload_mode()
+PAYLOAD_LOG_SAMPLE_RATE = max(1, config.get_logging_payload_sample_rate())
+
+_payload_counter = itertools.count()
+
+def _apply_payload_log_settings(settings: Settings) -> None:
+    """설정을 다시 읽었을 때 수신 데이터 로그 방식을 변경합니다."""
+    global PAYLOAD_LOG_MODE, PAYLOAD_LOG_SAMPLE_RATE
+    PAYLOAD_LOG_MODE = settings.logging_payload_mode
+    PAYLOAD_LOG_SAMPLE_RATE = max(1, settings.logging_payload_sample_rate)
+
+config.on_reload(_apply_payload_log_settings)
+
 def make_json_result(is_success: bool, result_code: str, result_message: str, data: Optional[Any] = None) -> OrderedDict:
     """
     표준화된 JSON 응답 형식을 생성합니다.
@@ -28,18 +46,34 @@ def make_json_result(is_success: bool, result_code: str, result_message: str, da
 
 def log_received_data(host_data: Any, containers_data: Any, logger: logging.Logger) -> None:
     """
-    수신된 데이터를 로그에 출력합니다.
+    수신된 데이터를 [logging] payload_mode에 따라 로그에 출력합니다.
+    
+    - off: 기록하지 않음
+    - summary: 호스트 이름, 수집 시각, 컨테이너 수만 한 줄로 기록
+    - sample: payload_sample_rate건 중 1건만 호스트/컨테이너 전체 내용을 기록
+    
+    메시지는 %-포맷 인자로 넘기므로 INFO 레벨이 꺼져 있으면 문자열 변환이 일어나지 않고,
+    켜져 있어도 포맷팅은 로그 리스너 스레드에서 수행됩니다.
     
     Args:
         host_data: 호스트 정보
         containers_data: 컨테이너 정보 리스트
         logger: 로거 인스턴스
     """
-    logger.info("=" * 50)
-    logger.info("수신된 데이터:")
-    logger.info(f"호스트 정보: {host_data}")
-    logger.info(f"컨테이너 정보 (총 {len(containers_data)}개): {containers_data}")
-    logger.info("=" * 50)
+    if PAYLOAD_LOG_MODE == "off" or not logger.isEnabledFor(logging.INFO):
+        return
+    if PAYLOAD_LOG_MODE == "sample":
+        if next(_payload_counter) % PAYLOAD_LOG_SAMPLE_RATE:
+            return
+        logger.info(
+            "수신된 데이터 (%d건 중 1건 샘플) - 호스트 정보: %s / 컨테이너 정보 (총 %d개): %s",
+            PAYLOAD_LOG_SAMPLE_RATE, host_data, len(containers_data), containers_data
+        )
+        return
+    logger.info(
+        "수신된 데이터 - 호스트: %s, 수집 시각: %s, 컨테이너: %d개",
+        host_data.host_name, host_data.get_datetime, len(containers_data)
+    )
 
 def log_exception_with_traceback(exception: Exception, logger: logging.Logger, context: str = "") -> None:
     """
@@ -53,4 +87,33 @@ def log_exception_with_traceback(exception: Exception, logger: logging.Logger, c
     error_msg = f"[ERROR] {context}: {str(exception)}"
     logger.error(error_msg)
     logger.error("상세 오류 정보:")
-    logger.error(traceback.format_exc()) 
\ No newline at end of file
+    logger.error(traceback.format_exc()) 
+
+def encode_cursor(get_datetime: datetime, record_id: int) -> str:
+    """
+    keyset 페이지네이션 커서를 생성합니다.
+    
+    Args:
+        get_datetime: 마지막 행의 수집 시각
+        record_id: 마지막 행의 ID
+        
+    Returns:
+        str: URL-safe base64 커서 문자열
+    """
+    raw = f"{get_datetime.isoformat()}|{record_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    encode_cursor로 만든 커서를 (수집 시각, ID)로 복원합니다.
+    
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        datetime_part, id_part = raw.rsplit("|", 1)
+        return datetime.fromisoformat(datetime_part), int(id_part)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e